@@ -11,12 +11,14 @@ Usage:
     python demo.py --budget 10  # Custom budget
 
 Environment:
-    MODEL_PROVIDER  - mock (default), ollama, azure_ai, openai
+    MODEL_PROVIDER              - mock (default), ollama, azure_ai, openai
+    AGENTOS_DEMO_DETERMINISTIC  - set to 1 for counter-based task/tx IDs
 """
 
 from __future__ import annotations
 
 import argparse
+import itertools
 import os
 import sys
 import time
@@ -42,6 +44,11 @@ from rich import box
 # Demo data structures
 # ---------------------------------------------------------------------------
 
+def _lower_skill_set(skills: list[str]) -> frozenset[str]:
+    """Lowercase and intern skill names for cheap case-insensitive matching."""
+    return frozenset(sys.intern(s.lower()) for s in skills)
+
+
 @dataclass
 class MockExternalAgent:
     """An external agent available for hire in the demo."""
@@ -55,6 +62,13 @@ class MockExternalAgent:
     protocol: str = "a2a"
     payment: str = "x402"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "skills":
+            # Kept in step with every assignment to ``skills``, including
+            # the one in __init__.
+            super().__setattr__("_skills_lower", _lower_skill_set(value))
+
     @property
     def price_str(self) -> str:
         return f"${self.price_per_call:.2f}"
@@ -134,13 +148,8 @@ def discover_agents(
     required_skills: list[str],
 ) -> list[MockExternalAgent]:
     """Filter agents that have at least one matching skill."""
-    required_lower = {s.lower() for s in required_skills}
-    matches = []
-    for agent in agents:
-        agent_skills = {s.lower() for s in agent.skills}
-        if agent_skills & required_lower:
-            matches.append(agent)
-    return matches
+    required_lower = _lower_skill_set(required_skills)
+    return [a for a in agents if not a._skills_lower.isdisjoint(required_lower)]
 
 
 def evaluate_agent(
@@ -148,8 +157,8 @@ def evaluate_agent(
     required_skills: list[str],
 ) -> dict[str, Any]:
     """Evaluate an agent against required skills and return a scored assessment."""
-    agent_skills_lower = {s.lower() for s in agent.skills}
-    required_lower = {s.lower() for s in required_skills}
+    agent_skills_lower = agent._skills_lower
+    required_lower = _lower_skill_set(required_skills)
 
     if not required_lower:
         match_score = 1.0
@@ -178,20 +187,45 @@ def select_best_agent(
     evaluations: list[dict[str, Any]],
     budget_remaining: float,
 ) -> dict[str, Any] | None:
-    """Select the best agent from evaluations within budget."""
-    affordable = [
-        e for e in evaluations
-        if e["approved"] and e["price"] <= budget_remaining
-    ]
-    if not affordable:
-        return None
-    return max(affordable, key=lambda e: e["composite_score"])
+    """Select the best agent from evaluations within budget.
+
+    Budget filtering and the composite-score argmax are fused into a single
+    pass; ties keep the first candidate, matching ``max()`` semantics.
+    """
+    best: dict[str, Any] | None = None
+    best_score = float("-inf")
+    for e in evaluations:
+        score = e["composite_score"]
+        if score > best_score and e["approved"] and e["price"] <= budget_remaining:
+            best, best_score = e, score
+    return best
+
+
+# Monotonic ID sources used instead of uuid4 when AGENTOS_DEMO_DETERMINISTIC=1,
+# so repeated runs produce reproducible task and transaction IDs.
+_TASK_COUNTER = itertools.count(1)
+_TX_COUNTER = itertools.count(1)
+
+
+def _deterministic_ids() -> bool:
+    return os.environ.get("AGENTOS_DEMO_DETERMINISTIC") == "1"
+
+
+def reset_id_counters() -> None:
+    """Restart the deterministic task/transaction ID sequences."""
+    global _TASK_COUNTER, _TX_COUNTER
+    _TASK_COUNTER = itertools.count(1)
+    _TX_COUNTER = itertools.count(1)
 
 
 def simulate_task_execution(agent_name: str, task_description: str) -> dict[str, Any]:
     """Simulate an external agent executing a task via A2A."""
+    if _deterministic_ids():
+        task_id = f"task-{next(_TASK_COUNTER):08d}"
+    else:
+        task_id = f"task-{uuid.uuid4().hex[:8]}"
     return {
-        "task_id": f"task-{uuid.uuid4().hex[:8]}",
+        "task_id": task_id,
         "status": "completed",
         "agent": agent_name,
         "deliverable": _generate_deliverable(agent_name, task_description),
@@ -206,8 +240,12 @@ def simulate_payment(
     task_id: str,
 ) -> dict[str, Any]:
     """Simulate an x402 USDC payment."""
+    if _deterministic_ids():
+        tx_id = f"tx_{next(_TX_COUNTER):012d}"
+    else:
+        tx_id = f"tx_{uuid.uuid4().hex[:12]}"
     return {
-        "tx_id": f"tx_{uuid.uuid4().hex[:12]}",
+        "tx_id": tx_id,
         "from": from_agent,
         "to": to_agent,
         "amount_usdc": amount,
@@ -94,6 +94,11 @@ def _highlight(text: str) -> None:
     print(f"  {_C.BOLD}{_C.WHITE}{text}{_C.RESET}")
 
 
+def _elapsed_ms(t_start: float) -> float:
+    """Milliseconds since *t_start* (a ``time.monotonic()`` reading)."""
+    return round((time.monotonic() - t_start) * 1000, 1)
+
+
 TOTAL_STAGES = 8
 
 
@@ -142,7 +147,7 @@ async def run_showcase_scenario() -> dict:
     stages.append({
         "stage": 1, "name": "Agent Creation",
         "agents": [a.name for a in agents_created],
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 2: Marketplace Registration ────────────────────────────
@@ -158,7 +163,7 @@ async def run_showcase_scenario() -> dict:
     stages.append({
         "stage": 2, "name": "Marketplace Registration",
         "agent_count": len(marketplace_agents),
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 3: CEO Task Analysis ───────────────────────────────────
@@ -189,7 +194,7 @@ async def run_showcase_scenario() -> dict:
         "task_id": task_id,
         "analysis": analysis,
         "budget": budget,
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 4: Sequential Workflow ─────────────────────────────────
@@ -215,7 +220,7 @@ async def run_showcase_scenario() -> dict:
         "pattern": "sequential",
         "agents": ["Research", "Builder"],
         "status": seq_result.status,
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 5: External Agent Hiring + x402 Payment ────────────────
@@ -251,7 +256,7 @@ async def run_showcase_scenario() -> dict:
         "status": hiring_result.status,
         "payment": hiring_result.payment,
         "external_agent": candidates[0].name if candidates else "none",
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 6: Concurrent Multi-Agent Execution ────────────────────
@@ -276,7 +281,7 @@ async def run_showcase_scenario() -> dict:
         "pattern": "concurrent",
         "agents": [a.name for a in concurrent_agents],
         "status": con_result.status,
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 7: Foundry Agent Service ───────────────────────────────
@@ -310,7 +315,7 @@ async def run_showcase_scenario() -> dict:
         "stage": 7, "name": "Foundry Agent Service",
         "foundry_agents": len(foundry_agents),
         "invoke_result": foundry_result.get("status", "unknown"),
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     # ── Stage 8: Results Summary ─────────────────────────────────────
@@ -346,7 +351,7 @@ async def run_showcase_scenario() -> dict:
         "transaction_count": len(txs),
         "task_count": storage.count_tasks(),
         "agent_count": len(registry.list_all()),
-        "duration_ms": round((time.monotonic() - t_stage) * 1000, 1),
+        "duration_ms": _elapsed_ms(t_stage),
     })
 
     return {
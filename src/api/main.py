@@ -141,6 +141,27 @@ class ActivityItem(BaseModel):
     timestamp: float
 
 
+class MCPToolInfo(BaseModel):
+    name: str
+    description: str | None = None
+    inputSchema: dict[str, Any]
+
+
+class MCPToolsResponse(BaseModel):
+    server: str
+    tool_count: int
+    tools: list[MCPToolInfo]
+
+
+class MCPInvokeResponse(BaseModel):
+    tool: str
+    result: Any
+
+
+class MCPBatchResponse(BaseModel):
+    results: list[MCPInvokeResponse]
+
+
 class DemoResponse(BaseModel):
     demo_task: str
     analysis: dict[str, Any]
@@ -230,7 +251,7 @@ async def _execute_task(task_id: str, description: str, budget: float) -> None:
         estimated_cost = analysis.get("estimated_cost", 0.0)
 
         # 3. Get REAL GPT-4o response for the agent's work
-        gpt_response = await asyncio.get_event_loop().run_in_executor(
+        gpt_response = await asyncio.get_running_loop().run_in_executor(
             None, _get_gpt4o_response, description, primary_agent
         )
 
@@ -478,6 +499,24 @@ async def health_azure():
     }
 
 
+@app.get("/__smoke", include_in_schema=False)
+async def smoke():
+    """One-shot bundle of the read-only checks used by deployment smoke tests."""
+    health_data = await health()
+    try:
+        metrics_present = "total_tasks" in get_metrics_collector().get_system_metrics()
+    except Exception:
+        metrics_present = False
+    return {
+        "health": health_data.model_dump(),
+        "health_azure": await health_azure(),
+        "agents_count": health_data.agents_count,
+        "tasks_count": health_data.tasks_total,
+        "transactions_count": ledger.transaction_count(),
+        "metrics_present": metrics_present,
+    }
+
+
 # ── Activity Feed endpoint ────────────────────────────────────────────────
 
 
@@ -870,7 +909,7 @@ async def demo_live(body: dict[str, Any] | None = None):
     # Stage 5: Execute (GPT-4o)
     t4 = time.time()
     storage.update_task_status(task_id, "running")
-    gpt_response = await asyncio.get_event_loop().run_in_executor(
+    gpt_response = await asyncio.get_running_loop().run_in_executor(
         None, _get_gpt4o_response, description, primary_agent
     )
     model = "gpt-4o" if gpt_response else "mock"
@@ -1036,7 +1075,7 @@ async def foundry_health():
 # ── MCP Server REST endpoints ──────────────────────────────────────────────
 
 
-@app.get("/mcp/tools")
+@app.get("/mcp/tools", response_model=MCPToolsResponse)
 async def mcp_list_tools():
     """List all available MCP tools with their input schemas.
 
@@ -1058,39 +1097,85 @@ async def mcp_list_tools():
     }
 
 
-@app.post("/mcp/invoke")
-async def mcp_invoke_tool(body: dict[str, Any]):
-    """Invoke an MCP tool by name with arguments.
-
-    Body: {"tool": "create_task", "arguments": {"description": "Build a landing page", "budget": 5.0}}
-
-    Returns the tool's response as JSON.
-    """
-    from src.mcp_server import _HANDLERS
-
-    tool_name = body.get("tool", "")
-    arguments = body.get("arguments", {})
+def _mcp_handler(tool_name: str):
+    """Look up an MCP tool's dict-returning implementation, raising 400/404."""
+    from src.mcp_server import _IMPLS
 
     if not tool_name:
         raise HTTPException(status_code=400, detail="'tool' field is required")
 
-    handler = _HANDLERS.get(tool_name)
+    handler = _IMPLS.get(tool_name)
     if handler is None:
-        available = list(_HANDLERS.keys())
+        available = list(_IMPLS.keys())
         raise HTTPException(
             status_code=404,
             detail=f"Unknown tool: '{tool_name}'. Available tools: {available}",
         )
+    return handler
 
+
+def _check_mcp_arguments(tool_name: str, arguments: Any) -> None:
+    """Reject arguments that do not match the tool's inputSchema with a 400."""
+    from src.mcp_server import _VALIDATORS
+
+    error = _VALIDATORS[tool_name](arguments)
+    if error is not None:
+        raise HTTPException(status_code=400, detail=f"Invalid arguments for '{tool_name}': {error}")
+
+
+def _run_mcp_handler(handler, arguments: dict[str, Any]) -> Any:
+    """Run a tool implementation; FastAPI encodes the returned dict once."""
     try:
-        result_str = handler(arguments)
-        import json as _json
-        result = _json.loads(result_str)
-        return {"tool": tool_name, "result": result}
+        return handler(arguments)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Tool execution failed: {str(e)}")
 
 
+@app.post("/mcp/invoke", response_model=MCPInvokeResponse)
+async def mcp_invoke_tool(body: dict[str, Any]):
+    """Invoke an MCP tool by name with arguments.
+
+    Body: {"tool": "create_task", "arguments": {"description": "Build a landing page", "budget": 5.0}}
+
+    Returns the tool's response as JSON.
+    """
+    tool_name = body.get("tool", "")
+    handler = _mcp_handler(tool_name)
+    arguments = body.get("arguments", {})
+    _check_mcp_arguments(tool_name, arguments)
+    result = _run_mcp_handler(handler, arguments)
+    return {"tool": tool_name, "result": result}
+
+
+@app.post("/mcp/invoke_batch", response_model=MCPBatchResponse)
+async def mcp_invoke_batch(body: dict[str, Any]):
+    """Invoke several MCP tools in order in one request.
+
+    Body: {"calls": [{"tool": "get_task", "arguments": {...}}, ...]}
+
+    Every tool name and argument set is checked before any call runs, so
+    an unknown tool or malformed arguments fail the batch without side
+    effects. Returns {"results": [...]} with
+    one {"tool", "result"} entry per call, in order.
+    """
+    calls = body.get("calls")
+    if not isinstance(calls, list) or not calls:
+        raise HTTPException(status_code=400, detail="'calls' must be a non-empty list")
+
+    handlers = [
+        _mcp_handler(call.get("tool", "") if isinstance(call, dict) else "")
+        for call in calls
+    ]
+    for call in calls:
+        _check_mcp_arguments(call["tool"], call.get("arguments", {}))
+    return {
+        "results": [
+            {"tool": call["tool"], "result": _run_mcp_handler(handler, call.get("arguments", {}))}
+            for call, handler in zip(calls, handlers)
+        ]
+    }
+
+
 @app.post("/sdk/orchestrate")
 async def sdk_orchestrate(body: dict[str, Any]):
     """Run a task through the Microsoft Agent Framework SDK orchestration.
@@ -22,7 +22,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from src.marketplace import AgentListing, marketplace
 from src.marketplace.x402 import (
@@ -154,6 +154,8 @@ class BalanceResponse(BaseModel):
 
 
 class LedgerEntryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     entry_id: str
     event_type: str
     payer: str
@@ -168,6 +170,10 @@ class LedgerEntryResponse(BaseModel):
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
+# Builds the ledger response from LedgerEntry attributes in one pydantic-core
+# call for the whole list, rather than one model constructor call per entry.
+_ledger_entries_adapter = TypeAdapter(list[LedgerEntryResponse])
+
 
 def _listing_to_response(listing: AgentListing) -> AgentListingResponse:
     return AgentListingResponse(
@@ -407,18 +413,4 @@ async def get_payment_ledger(
         agent_id=agent_id,
         task_id=task_id,
     )
-    return [
-        LedgerEntryResponse(
-            entry_id=e.entry_id,
-            event_type=e.event_type,
-            payer=e.payer,
-            payee=e.payee,
-            amount=e.amount,
-            task_id=e.task_id,
-            escrow_id=e.escrow_id,
-            payment_id=e.payment_id,
-            network=e.network,
-            timestamp=e.timestamp,
-        )
-        for e in entries
-    ]
+    return _ledger_entries_adapter.validate_python(entries)
@@ -156,7 +156,7 @@ class DemoRunner:
         analysis = await analyze_task(spec["description"])
 
         # 3. Get real GPT-4o response
-        gpt_response = await asyncio.get_event_loop().run_in_executor(
+        gpt_response = await asyncio.get_running_loop().run_in_executor(
             None, _get_gpt4o_response, spec["gpt_prompt"]
         )
 
@@ -27,6 +27,7 @@ Category fit: Microsoft Agent Framework MCP integration.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import time
@@ -442,8 +443,9 @@ def create_mcp_server(chat_client: Any = None) -> Any:
 # ---------------------------------------------------------------------------
 
 
-def get_mcp_tool_info() -> list[dict[str, Any]]:
-    """Return info about available MCP tools for dashboard display."""
+@functools.lru_cache(maxsize=1)
+def _tool_info() -> tuple[dict[str, Any], ...]:
+    """Tool info built once; HIREWIRE_SDK_TOOLS is fixed at import."""
     tools_info = []
     for t in HIREWIRE_SDK_TOOLS:
         # SDK FunctionTool objects have a .name attribute
@@ -455,4 +457,10 @@ def get_mcp_tool_info() -> list[dict[str, Any]]:
             "type": "sdk_tool",
             "framework": "agent_framework",
         })
-    return tools_info
+    return tuple(tools_info)
+
+
+def get_mcp_tool_info() -> list[dict[str, Any]]:
+    """Return info about available MCP tools for dashboard display."""
+    # Copies, so callers can't alter the cached entries.
+    return [dict(info) for info in _tool_info()]
@@ -9,10 +9,12 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass, field, asdict
+import uuid
+from dataclasses import dataclass, field, asdict, astuple
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import aiosqlite
 
@@ -51,61 +53,224 @@ CREATE TABLE IF NOT EXISTS agent_scores (
     cost_efficiency REAL NOT NULL DEFAULT 0.0,
     updated_at REAL NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS agent_running_stats (
+    agent_id TEXT PRIMARY KEY,
+    half_life REAL NOT NULL,
+    n INTEGER NOT NULL,
+    sum_w REAL NOT NULL,
+    sum_w_success REAL NOT NULL,
+    sum_w_quality REAL NOT NULL,
+    sum_w_efficiency REAL NOT NULL,
+    mean_quality REAL NOT NULL,
+    m2_quality REAL NOT NULL,
+    latest_ts REAL NOT NULL
+);
+"""
+
+
+_INSERT_FEEDBACK = """INSERT OR REPLACE INTO feedback
+   (task_id, agent_id, outcome, quality_score, latency_ms, cost_usdc, timestamp)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+# Success credit and cost efficiency of one feedback row, mirroring the
+# Python helpers in src.learning.scorer.
+_SUCCESS_SQL = "CASE {outcome} WHEN 'success' THEN 1.0 WHEN 'partial' THEN 0.5 ELSE 0.0 END"
+_EFFICIENCY_SQL = (
+    "CASE WHEN {cost} > 0 THEN MIN({quality} / {cost}, 10.0) / 10.0 ELSE 1.0 END"
+)
+
+# Decay half-life (in tasks) that agent_running_stats rows are kept at by the
+# write methods. AgentScorer scores with this same half-life.
+RUNNING_STATS_HALF_LIFE = 10
+
+_AGGREGATE_COLUMNS = (
+    "n",
+    "sum_w",
+    "sum_w_success",
+    "sum_w_quality",
+    "sum_w_efficiency",
+    "mean_quality",
+    "m2_quality",
+)
+
+# Per-agent decay-weighted sums for AgentScorer, computed in one pass inside
+# SQLite. Row ``rn`` (1 = most recent, ties broken by insertion order) gets
+# weight 0.5 ** ((rn - 1) / half_life). Quality spread is kept as the mean and
+# the sum of squared deviations from it (Welford's M2), which stays accurate
+# where sum(q * q) / n - mean ** 2 would cancel.
+# Needs window functions and POWER() (SQLite >= 3.35 built with math functions).
+_AGGREGATES_SQL = f"""
+SELECT {{select}}COUNT(*)         AS n,
+       SUM(w)                     AS sum_w,
+       SUM(w * success)           AS sum_w_success,
+       SUM(w * quality_score)     AS sum_w_quality,
+       SUM(w * efficiency)        AS sum_w_efficiency,
+       AVG(quality_score)         AS mean_quality,
+       SUM((quality_score - group_mean) * (quality_score - group_mean)) AS m2_quality,
+       MAX(timestamp)             AS latest_ts
+FROM (
+    SELECT agent_id, quality_score, timestamp,
+           POWER(0.5, (ROW_NUMBER() OVER (PARTITION BY agent_id
+                                          ORDER BY timestamp DESC, rowid DESC) - 1)
+                      * 1.0 / ?) AS w,
+           AVG(quality_score) OVER (PARTITION BY agent_id) AS group_mean,
+           {_SUCCESS_SQL.format(outcome="outcome")} AS success,
+           {_EFFICIENCY_SQL.format(cost="cost_usdc", quality="quality_score")} AS efficiency
+    FROM feedback
+    {{where}}
+)
+{{group}}
+"""
+_AGENT_AGGREGATES = _AGGREGATES_SQL.format(select="", where="WHERE agent_id = ?", group="")
+# Recompute one agent's running stats row from its full history. Takes
+# (half_life, half_life, agent_id); writes nothing for an agent without feedback.
+_REBUILD_RUNNING_STATS = """INSERT OR REPLACE INTO agent_running_stats
+   (agent_id, half_life, n, sum_w, sum_w_success, sum_w_quality,
+    sum_w_efficiency, mean_quality, m2_quality, latest_ts)
+""" + _AGGREGATES_SQL.format(
+    select="agent_id, ? AS half_life, ", where="WHERE agent_id = ?", group="GROUP BY agent_id"
+)
+_ALL_AGENT_AGGREGATES = _AGGREGATES_SQL.format(
+    select="agent_id, ", where="", group="GROUP BY agent_id"
+)
+
+# Fold a new most-recent record into an agent's running sums: every older
+# record moves one position back (weight * 0.5 ** (1 / half_life)) and the new
+# one enters at position 0 with weight 1, and Welford's update folds it into
+# the quality mean and M2. Only valid when the record is not older than
+# anything already counted, hence the latest_ts guard.
+_UPDATE_RUNNING_STATS = f"""
+UPDATE agent_running_stats SET
+    n = n + 1,
+    sum_w = sum_w * POWER(0.5, 1.0 / half_life) + 1.0,
+    sum_w_success = sum_w_success * POWER(0.5, 1.0 / half_life)
+        + {_SUCCESS_SQL.format(outcome=":outcome")},
+    sum_w_quality = sum_w_quality * POWER(0.5, 1.0 / half_life) + :quality_score,
+    sum_w_efficiency = sum_w_efficiency * POWER(0.5, 1.0 / half_life)
+        + {_EFFICIENCY_SQL.format(cost=":cost_usdc", quality=":quality_score")},
+    mean_quality = mean_quality + (:quality_score - mean_quality) / (n + 1),
+    m2_quality = m2_quality + (:quality_score - mean_quality) * (:quality_score - mean_quality)
+        * n / (n + 1),
+    latest_ts = :timestamp
+WHERE agent_id = :agent_id AND latest_ts <= :timestamp
 """
 
 
 class FeedbackCollector:
-    """Collects and persists agent feedback in SQLite (WAL mode)."""
+    """Collects and persists agent feedback in SQLite (WAL mode).
+
+    Pass ``":memory:"`` as *db_path* for a throwaway in-memory store.
+    Each thread gets its own connection, kept open until :meth:`close`.
+    Write methods run inside ``with conn:`` so a failed write is rolled back
+    rather than left open on the reused connection.
+    """
 
     def __init__(self, db_path: str | Path | None = None) -> None:
-        default = Path(
-            os.environ.get("HIREWIRE_DB_PATH", "")
-            or str(Path(__file__).resolve().parent.parent.parent / "data" / "hirewire.db")
-        )
-        self._db_path = str(db_path or default)
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+        self._keepalive: sqlite3.Connection | None = None
+        if str(db_path) == ":memory:":
+            # Every connection to a plain ":memory:" path gets its own empty
+            # database, so use a private shared-cache URI instead and hold one
+            # connection open for the collector's lifetime to keep it alive.
+            self._db_path = f"file:feedback_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._uri = True
+            self._keepalive = sqlite3.connect(self._db_path, uri=True)
+        else:
+            default = Path(
+                os.environ.get("HIREWIRE_DB_PATH", "")
+                or str(Path(__file__).resolve().parent.parent.parent / "data" / "hirewire.db")
+            )
+            self._db_path = str(db_path or default)
+            self._uri = False
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+        self._local = threading.local()
+        # Every per-thread connection opened so far, for close().
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        # Whether this SQLite build can run _AGGREGATES_SQL; probed in _init_db.
+        self._sql_aggregates = False
+        # Write sequence numbers backing history_version().
+        self._write_seq = 0
+        self._cleared_at = 0
+        self._versions: dict[str, int] = {}
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+        """This thread's connection, opened on first use and then reused.
+
+        Reusing it keeps SQLite's prepared-statement cache warm across calls.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can close it from
+            # whichever thread calls it; each connection is used by one thread.
+            conn = sqlite3.connect(self._db_path, uri=self._uri, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close every connection this collector opened.
+
+        The collector reopens connections on next use, but an in-memory
+        store is gone once closed.
+        """
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
     def _init_db(self) -> None:
         conn = self._get_conn()
-        try:
+        with conn:
             conn.executescript(_FEEDBACK_SCHEMA)
-            conn.commit()
-        finally:
-            conn.close()
+        self._sql_aggregates = self._supports_sql_aggregates(conn)
+
+    @staticmethod
+    def _supports_sql_aggregates(conn: sqlite3.Connection) -> bool:
+        """Whether SQLite has the window functions and POWER() the aggregates need."""
+        try:
+            conn.execute("SELECT POWER(0.5, ROW_NUMBER() OVER ())").fetchone()
+        except sqlite3.OperationalError:
+            return False
+        return True
 
     # ------------------------------------------------------------------
     # Record feedback
     # ------------------------------------------------------------------
 
     def record_feedback(self, record: FeedbackRecord) -> None:
-        """Store a feedback record."""
+        """Store a feedback record and fold it into the agent's running stats."""
         conn = self._get_conn()
-        try:
-            conn.execute(
-                """INSERT OR REPLACE INTO feedback
-                   (task_id, agent_id, outcome, quality_score, latency_ms, cost_usdc, timestamp)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    record.task_id,
-                    record.agent_id,
-                    record.outcome,
-                    record.quality_score,
-                    record.latency_ms,
-                    record.cost_usdc,
-                    record.timestamp,
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        with conn:
+            replaced = conn.execute(
+                "SELECT 1 FROM feedback WHERE task_id = ? AND agent_id = ?",
+                (record.task_id, record.agent_id),
+            ).fetchone()
+            conn.execute(_INSERT_FEEDBACK, astuple(record))
+            if replaced or not self._update_running_stats(conn, record):
+                self._rebuild_running_stats(conn, [record.agent_id])
+        self._touch([record.agent_id])
+
+    def record_feedback_bulk(self, records: list[FeedbackRecord]) -> None:
+        """Store several feedback records in a single transaction."""
+        if not records:
+            return
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(_INSERT_FEEDBACK, [astuple(r) for r in records])
+            self._rebuild_running_stats(conn, {r.agent_id for r in records})
+        self._touch({r.agent_id for r in records})
 
     # ------------------------------------------------------------------
     # Query feedback
@@ -114,60 +279,104 @@ class FeedbackCollector:
     def get_agent_feedback(self, agent_id: str) -> list[FeedbackRecord]:
         """Get all feedback for a specific agent, ordered by timestamp desc."""
         conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM feedback WHERE agent_id = ? ORDER BY timestamp DESC",
-                (agent_id,),
-            ).fetchall()
-            return [self._row_to_record(r) for r in rows]
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT * FROM feedback WHERE agent_id = ?"
+            " ORDER BY timestamp DESC, rowid DESC",
+            (agent_id,),
+        ).fetchall()
+        return [self._row_to_record(r) for r in rows]
 
     def get_task_feedback(self, task_id: str) -> list[FeedbackRecord]:
         """Get all feedback for a specific task."""
         conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM feedback WHERE task_id = ? ORDER BY timestamp DESC",
-                (task_id,),
-            ).fetchall()
-            return [self._row_to_record(r) for r in rows]
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT * FROM feedback WHERE task_id = ? ORDER BY timestamp DESC",
+            (task_id,),
+        ).fetchall()
+        return [self._row_to_record(r) for r in rows]
 
     def get_all_feedback(self) -> list[FeedbackRecord]:
         """Get all feedback records."""
         conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM feedback ORDER BY timestamp DESC"
-            ).fetchall()
-            return [self._row_to_record(r) for r in rows]
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT * FROM feedback ORDER BY timestamp DESC"
+        ).fetchall()
+        return [self._row_to_record(r) for r in rows]
 
     def count_feedback(self, agent_id: str | None = None) -> int:
         """Count feedback records, optionally filtered by agent."""
         conn = self._get_conn()
-        try:
-            if agent_id is not None:
-                row = conn.execute(
-                    "SELECT COUNT(*) FROM feedback WHERE agent_id = ?", (agent_id,)
-                ).fetchone()
-            else:
-                row = conn.execute("SELECT COUNT(*) FROM feedback").fetchone()
-            return row[0]
-        finally:
-            conn.close()
+        if agent_id is not None:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM feedback WHERE agent_id = ?", (agent_id,)
+            ).fetchone()
+        else:
+            row = conn.execute("SELECT COUNT(*) FROM feedback").fetchone()
+        return row[0]
+
+    def get_agent_aggregates(self, agent_id: str, half_life: float) -> dict[str, float] | None:
+        """Decay-weighted feedback sums for an agent.
+
+        Served from the ``agent_running_stats`` row that the write methods
+        keep current for :data:`RUNNING_STATS_HALF_LIFE`. For any other
+        half-life, or an agent without a row, the sums are computed with one
+        window query over the agent's history. Never writes.
+
+        Returns ``None`` when the SQLite build lacks window functions or
+        ``POWER()``; callers should then fall back to
+        :meth:`get_agent_feedback` and aggregate in Python.
+        """
+        if not self._sql_aggregates:
+            return None
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT * FROM agent_running_stats WHERE agent_id = ? AND half_life = ?",
+            (agent_id, half_life),
+        ).fetchone()
+        if row is None:
+            row = conn.execute(_AGENT_AGGREGATES, (half_life, agent_id)).fetchone()
+        return {k: row[k] or 0.0 for k in _AGGREGATE_COLUMNS}
+
+    def get_all_agent_aggregates(self, half_life: float) -> dict[str, dict[str, float]] | None:
+        """Decay-weighted feedback sums for every agent, in one query.
+
+        Same sums as :meth:`get_agent_aggregates`, keyed by agent_id, but
+        always computed from the full history. Returns ``None`` when SQLite
+        cannot run the query.
+        """
+        if not self._sql_aggregates:
+            return None
+        conn = self._get_conn()
+        rows = conn.execute(_ALL_AGENT_AGGREGATES, (half_life,)).fetchall()
+        return {r["agent_id"]: {k: r[k] or 0.0 for k in _AGGREGATE_COLUMNS} for r in rows}
+
+    def list_feedback_agents(self) -> list[str]:
+        """Distinct agent IDs that have feedback, sorted."""
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT DISTINCT agent_id FROM feedback ORDER BY agent_id"
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def history_version(self, agent_id: str) -> int:
+        """Version of an agent's learning data, for caching derived values.
+
+        Changes whenever feedback for the agent is recorded, or feedback or
+        scores are cleared, through this collector (single, bulk, async and
+        clear methods alike). The counter is per collector and per process:
+        writes made by other collectors or connections on the same database
+        are not seen, so only cache on it when this collector is the
+        database's only writer.
+        """
+        return max(self._versions.get(agent_id, 0), self._cleared_at)
 
     def clear_feedback(self) -> None:
         """Delete all feedback (for testing)."""
         conn = self._get_conn()
-        try:
+        with conn:
             conn.execute("DELETE FROM feedback")
-            conn.commit()
-        finally:
-            conn.close()
+            conn.execute("DELETE FROM agent_running_stats")
+        self._touch_all()
 
     # ------------------------------------------------------------------
     # Agent score persistence
@@ -182,14 +391,31 @@ class FeedbackCollector:
         reliability: float,
         cost_efficiency: float,
     ) -> None:
-        """Save or update an agent's computed score."""
+        """Save or update an agent's computed score.
+
+        The stored row is left untouched when it already holds these values,
+        so ``updated_at`` reflects the last change. The comparison is made
+        against the database, so it holds whoever wrote or cleared the row.
+        """
         conn = self._get_conn()
-        try:
+        with conn:
             conn.execute(
-                """INSERT OR REPLACE INTO agent_scores
+                """INSERT INTO agent_scores
                    (agent_id, composite_score, success_rate, avg_quality,
                     reliability, cost_efficiency, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(agent_id) DO UPDATE SET
+                       composite_score = excluded.composite_score,
+                       success_rate = excluded.success_rate,
+                       avg_quality = excluded.avg_quality,
+                       reliability = excluded.reliability,
+                       cost_efficiency = excluded.cost_efficiency,
+                       updated_at = excluded.updated_at
+                   WHERE (composite_score, success_rate, avg_quality,
+                          reliability, cost_efficiency)
+                      IS NOT (excluded.composite_score, excluded.success_rate,
+                              excluded.avg_quality, excluded.reliability,
+                              excluded.cost_efficiency)""",
                 (
                     agent_id,
                     composite_score,
@@ -200,42 +426,31 @@ class FeedbackCollector:
                     time.time(),
                 ),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def get_agent_score(self, agent_id: str) -> dict[str, Any] | None:
         """Get a cached agent score."""
         conn = self._get_conn()
-        try:
-            row = conn.execute(
-                "SELECT * FROM agent_scores WHERE agent_id = ?", (agent_id,)
-            ).fetchone()
-            if row is None:
-                return None
-            return dict(row)
-        finally:
-            conn.close()
+        row = conn.execute(
+            "SELECT * FROM agent_scores WHERE agent_id = ?", (agent_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(row)
 
     def list_agent_scores(self) -> list[dict[str, Any]]:
         """List all agent scores ordered by composite score desc."""
         conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM agent_scores ORDER BY composite_score DESC"
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        rows = conn.execute(
+            "SELECT * FROM agent_scores ORDER BY composite_score DESC"
+        ).fetchall()
+        return [dict(r) for r in rows]
 
     def clear_agent_scores(self) -> None:
         """Delete all agent scores (for testing)."""
         conn = self._get_conn()
-        try:
+        with conn:
             conn.execute("DELETE FROM agent_scores")
-            conn.commit()
-        finally:
-            conn.close()
+        self._touch_all()
 
     def clear_all(self) -> None:
         """Clear all learning data (for testing)."""
@@ -248,31 +463,25 @@ class FeedbackCollector:
 
     async def async_record_feedback(self, record: FeedbackRecord) -> None:
         """Async version of record_feedback."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with aiosqlite.connect(self._db_path, uri=self._uri) as db:
             await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute(
-                """INSERT OR REPLACE INTO feedback
-                   (task_id, agent_id, outcome, quality_score, latency_ms, cost_usdc, timestamp)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    record.task_id,
-                    record.agent_id,
-                    record.outcome,
-                    record.quality_score,
-                    record.latency_ms,
-                    record.cost_usdc,
-                    record.timestamp,
-                ),
-            )
+            await db.execute(_INSERT_FEEDBACK, astuple(record))
+            if self._sql_aggregates:
+                await db.execute(
+                    _REBUILD_RUNNING_STATS,
+                    (RUNNING_STATS_HALF_LIFE, RUNNING_STATS_HALF_LIFE, record.agent_id),
+                )
             await db.commit()
+        self._touch([record.agent_id])
 
     async def async_get_agent_feedback(self, agent_id: str) -> list[FeedbackRecord]:
         """Async version of get_agent_feedback."""
-        async with aiosqlite.connect(self._db_path) as db:
+        async with aiosqlite.connect(self._db_path, uri=self._uri) as db:
             db.row_factory = aiosqlite.Row
             await db.execute("PRAGMA journal_mode=WAL")
             cursor = await db.execute(
-                "SELECT * FROM feedback WHERE agent_id = ? ORDER BY timestamp DESC",
+                "SELECT * FROM feedback WHERE agent_id = ?"
+                " ORDER BY timestamp DESC, rowid DESC",
                 (agent_id,),
             )
             rows = await cursor.fetchall()
@@ -282,6 +491,34 @@ class FeedbackCollector:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _update_running_stats(self, conn: sqlite3.Connection, record: FeedbackRecord) -> bool:
+        """Fold *record* into its agent's running stats row.
+
+        Returns False when no row was updated: there was none, or *record* is
+        older than its newest entry. The caller then rebuilds the row.
+        """
+        if not self._sql_aggregates:
+            return False
+        return conn.execute(_UPDATE_RUNNING_STATS, asdict(record)).rowcount > 0
+
+    def _touch(self, agent_ids: Iterable[str]) -> None:
+        self._write_seq += 1
+        for agent_id in agent_ids:
+            self._versions[agent_id] = self._write_seq
+
+    def _touch_all(self) -> None:
+        self._write_seq += 1
+        self._cleared_at = self._write_seq
+
+    def _rebuild_running_stats(self, conn: sqlite3.Connection, agent_ids: Iterable[str]) -> None:
+        """Recompute the running stats rows of *agent_ids* from their history."""
+        if not self._sql_aggregates:
+            return
+        conn.executemany(
+            _REBUILD_RUNNING_STATS,
+            [(RUNNING_STATS_HALF_LIFE, RUNNING_STATS_HALF_LIFE, aid) for aid in agent_ids],
+        )
+
     @staticmethod
     def _row_to_record(row: sqlite3.Row | aiosqlite.Row) -> FeedbackRecord:
         return FeedbackRecord(
@@ -170,18 +170,20 @@ class HiringOptimizer:
         Agents with less data have wider distributions, giving them a
         chance to be selected (natural exploration).
         """
-        samples: list[tuple[str, AgentScore, float]] = []
-        for agent_id, score in scored:
-            # Beta distribution parameters from observed successes/failures
-            # Use task_count and success_rate, with a weak prior (alpha=1, beta=1)
-            alpha = 1.0 + score.success_rate * score.task_count
-            beta_param = 1.0 + (1.0 - score.success_rate) * score.task_count
-            sample = self._rng.betavariate(alpha, beta_param)
-            samples.append((agent_id, score, sample))
+        # Beta distribution parameters from observed successes/failures
+        # Use task_count and success_rate, with a weak prior (alpha=1, beta=1)
+        betavariate = self._rng.betavariate
+        samples = [
+            betavariate(
+                1.0 + score.success_rate * score.task_count,
+                1.0 + (1.0 - score.success_rate) * score.task_count,
+            )
+            for _, score in scored
+        ]
 
         # Sort by Thompson sample (descending)
-        samples.sort(key=lambda x: x[2], reverse=True)
-        return [(aid, score) for aid, score, _ in samples]
+        order = sorted(range(len(scored)), key=samples.__getitem__, reverse=True)
+        return [scored[i] for i in order]
 
     @staticmethod
     def _confidence_interval(score: AgentScore) -> tuple[float, float]:
@@ -7,15 +7,20 @@ Recent tasks are weighted higher using exponential decay (half-life = 10 tasks).
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
-from typing import Any
+import operator
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Any, NamedTuple
 
-from src.learning.feedback import FeedbackCollector, FeedbackRecord
+from src.learning.feedback import RUNNING_STATS_HALF_LIFE, FeedbackCollector, FeedbackRecord
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentScore:
-    """Computed reputation score for an agent."""
+    """Computed reputation score for an agent.
+
+    Frozen because AgentScorer hands the same cached instance to every caller.
+    """
 
     agent_id: str
     composite_score: float  # 0.0 - 1.0 weighted blend
@@ -27,14 +32,43 @@ class AgentScore:
     confidence: float = 0.0  # 0.0 - 1.0 (how much data we have)
 
 
+# Neutral prior for agents with no feedback history; only agent_id varies.
+_PRIOR_SCORE = AgentScore(
+    agent_id="",
+    composite_score=0.5,
+    success_rate=0.5,
+    avg_quality=0.5,
+    reliability=0.5,
+    cost_efficiency=0.5,
+    task_count=0,
+    confidence=0.0,
+)
+
 # Composite score weights
 _W_SUCCESS = 0.40
 _W_QUALITY = 0.30
 _W_RELIABILITY = 0.20
 _W_COST = 0.10
 
-# Exponential decay half-life (in number of tasks)
-_HALF_LIFE = 10
+
+def _composite(success: float, quality: float, reliability: float, cost: float) -> float:
+    """Weighted blend of the four metrics."""
+    return (
+        _W_SUCCESS * success
+        + _W_QUALITY * quality
+        + _W_RELIABILITY * reliability
+        + _W_COST * cost
+    )
+
+
+# Exponential decay half-life (in number of tasks); the collector keeps its
+# running stats at the same value so scoring reads them directly.
+_HALF_LIFE = RUNNING_STATS_HALF_LIFE
+
+
+# Precomputed decay weights by position, doubled on demand by _decay_weights().
+_DECAY_TABLE: list[float] = [math.pow(0.5, i / _HALF_LIFE) for i in range(1024)]
+_DECAY_TABLE_LOCK = threading.Lock()
 
 
 def _decay_weight(position: int) -> float:
@@ -43,50 +77,114 @@ def _decay_weight(position: int) -> float:
     Position 0 = most recent task (weight ~ 1.0).
     Weight halves every ``_HALF_LIFE`` positions.
     """
+    if position < len(_DECAY_TABLE):
+        return _DECAY_TABLE[position]
     return math.pow(0.5, position / _HALF_LIFE)
 
 
+def _decay_weights(n: int) -> list[float]:
+    """Decay weights for positions ``0..n-1``, growing the table if needed.
+
+    Growth happens under a lock and appends in a single ``extend`` of a
+    prebuilt list, so concurrent readers only ever see complete prefixes.
+    """
+    if n > len(_DECAY_TABLE):
+        with _DECAY_TABLE_LOCK:
+            start = size = len(_DECAY_TABLE)
+            while size < n:
+                size *= 2
+            _DECAY_TABLE.extend([math.pow(0.5, i / _HALF_LIFE) for i in range(start, size)])
+    return _DECAY_TABLE[:n]
+
+
+# Success credit per outcome; anything else (failure) counts as 0.
+_OUTCOME_CREDIT = {"success": 1.0, "partial": 0.5}
+
+
+def _cost_efficiency(quality: float, cost: float) -> float:
+    """Cost efficiency of one task: quality per dollar, normalized to 0-1.
+
+    Quality per dollar is capped at 10 (a $0.10 task with quality 1.0), and
+    10 qpd maps to 1.0. Free work is maximally efficient.
+    """
+    if cost > 0:
+        return min(quality / cost, 10.0) / 10.0
+    return 1.0
+
+
+class _Metrics(NamedTuple):
+    """Unrounded per-agent metrics that feed the composite score."""
+
+    task_count: int
+    success_rate: float
+    avg_quality: float
+    reliability: float
+    cost_efficiency: float
+
+
+def _metrics_from_sums(agg: dict[str, float]) -> _Metrics:
+    """Turn FeedbackCollector's decay-weighted sums into metrics."""
+    n = int(agg["n"])
+    if n == 0:
+        return _Metrics(0, 0.0, 0.0, 0.0, 0.0)
+    total_weight = agg["sum_w"]
+    reliability = 0.5  # insufficient data
+    if n >= 2:
+        variance = max(0.0, agg["m2_quality"] / n)
+        reliability = max(0.0, 1.0 - 2.0 * math.sqrt(variance))
+    return _Metrics(
+        n,
+        agg["sum_w_success"] / total_weight,
+        agg["sum_w_quality"] / total_weight,
+        reliability,
+        agg["sum_w_efficiency"] / total_weight,
+    )
+
+
 class AgentScorer:
     """Computes agent reputation from feedback history."""
 
     def __init__(self, collector: FeedbackCollector) -> None:
         self._collector = collector
+        # agent_id -> (collector history_version, score computed at that version)
+        self._cache: dict[str, tuple[int, AgentScore]] = {}
 
     def compute_score(self, agent_id: str) -> AgentScore:
         """Compute composite score for an agent from feedback history.
 
         Feedback records are ordered by timestamp descending (most recent first).
         Each record gets an exponential decay weight based on position.
+
+        The result is cached until the collector reports a new
+        ``history_version`` for the agent. That version only tracks writes
+        made through the same collector, so feedback written by another
+        process is not picked up until this collector records or clears.
         """
-        records = self._collector.get_agent_feedback(agent_id)
-
-        if not records:
-            return AgentScore(
-                agent_id=agent_id,
-                composite_score=0.5,  # prior for unknown agents
-                success_rate=0.5,
-                avg_quality=0.5,
-                reliability=0.5,
-                cost_efficiency=0.5,
-                task_count=0,
-                confidence=0.0,
-            )
-
-        # Compute weighted metrics with decay
-        success_rate = self._weighted_success_rate(records)
-        avg_quality = self._weighted_avg_quality(records)
-        reliability = self._compute_reliability(records)
-        cost_efficiency = self._compute_cost_efficiency(records)
-
-        composite = (
-            _W_SUCCESS * success_rate
-            + _W_QUALITY * avg_quality
-            + _W_RELIABILITY * reliability
-            + _W_COST * cost_efficiency
-        )
+        version = self._collector.history_version(agent_id)
+        cached = self._cache.get(agent_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        score = self._compute_score(agent_id)
+        self._cache[agent_id] = (version, score)
+        return score
+
+    def _compute_score(self, agent_id: str) -> AgentScore:
+        metrics = self._sql_metrics(agent_id)
+        if metrics is None:
+            metrics = self._record_metrics(self._collector.get_agent_feedback(agent_id))
+        return self._build_score(agent_id, metrics)
+
+    def _build_score(self, agent_id: str, metrics: _Metrics) -> AgentScore:
+        """Blend metrics into a rounded AgentScore and persist it."""
+        task_count, success_rate, avg_quality, reliability, cost_efficiency = metrics
+
+        if not task_count:
+            return replace(_PRIOR_SCORE, agent_id=agent_id)
+
+        composite = _composite(success_rate, avg_quality, reliability, cost_efficiency)
 
         # Confidence grows with number of tasks (asymptotic to 1.0)
-        confidence = 1.0 - math.exp(-len(records) / 5.0)
+        confidence = 1.0 - math.exp(-task_count / 5.0)
 
         score = AgentScore(
             agent_id=agent_id,
@@ -95,7 +193,7 @@ class AgentScorer:
             avg_quality=round(avg_quality, 4),
             reliability=round(reliability, 4),
             cost_efficiency=round(cost_efficiency, 4),
-            task_count=len(records),
+            task_count=task_count,
             confidence=round(confidence, 4),
         )
 
@@ -118,11 +216,20 @@ class AgentScorer:
         feedback history are included (matched via agent_id prefix or stored
         agent metadata). For now, ranks all agents with feedback.
         """
-        # Gather unique agent IDs from feedback
-        all_feedback = self._collector.get_all_feedback()
-        agent_ids = sorted({r.agent_id for r in all_feedback})
-
-        scores = [self.compute_score(aid) for aid in agent_ids]
+        all_sums = self._collector.get_all_agent_aggregates(_HALF_LIFE)
+        if all_sums is None:
+            scores = [self.compute_score(aid) for aid in self._collector.list_feedback_agents()]
+        else:
+            # One grouped query covers every agent. Cached scores are reused
+            # when still current, but fresh ones are not cached here: their
+            # version could only be read after the query ran.
+            scores = []
+            for aid in sorted(all_sums):
+                cached = self._cache.get(aid)
+                if cached is not None and cached[0] == self._collector.history_version(aid):
+                    scores.append(cached[1])
+                else:
+                    scores.append(self._build_score(aid, _metrics_from_sums(all_sums[aid])))
         scores.sort(key=lambda s: s.composite_score, reverse=True)
         return scores
 
@@ -130,42 +237,49 @@ class AgentScorer:
     # Metric computations
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _weighted_success_rate(records: list[FeedbackRecord]) -> float:
-        """Success rate weighted by recency decay."""
-        total_weight = 0.0
-        success_weight = 0.0
-        for i, rec in enumerate(records):
-            w = _decay_weight(i)
-            total_weight += w
-            if rec.outcome == "success":
-                success_weight += w
-            elif rec.outcome == "partial":
-                success_weight += w * 0.5
-            # failure = 0
-        return success_weight / total_weight if total_weight > 0 else 0.0
+    def _sql_metrics(self, agent_id: str) -> _Metrics | None:
+        """Metrics from sums aggregated inside SQLite, or ``None`` if unsupported."""
+        agg = self._collector.get_agent_aggregates(agent_id, _HALF_LIFE)
+        if agg is None:
+            return None
+        return _metrics_from_sums(agg)
+
+    def _record_metrics(self, records: list[FeedbackRecord]) -> _Metrics:
+        """Metrics computed in Python from records ordered most recent first."""
+        # One pass over the records into per-field columns; the metric
+        # helpers below then work on plain float lists with a shared
+        # weight vector instead of re-walking the records.
+        n = len(records)
+        weights = _decay_weights(n)
+        successes = [_OUTCOME_CREDIT.get(r.outcome, 0.0) for r in records]
+        qualities = [r.quality_score for r in records]
+        efficiencies = [_cost_efficiency(r.quality_score, r.cost_usdc) for r in records]
+
+        return _Metrics(
+            n,
+            self._weighted_mean(weights, successes, default=0.0),
+            self._weighted_mean(weights, qualities, default=0.0),
+            self._compute_reliability(qualities),
+            self._weighted_mean(weights, efficiencies, default=0.5),
+        )
 
     @staticmethod
-    def _weighted_avg_quality(records: list[FeedbackRecord]) -> float:
-        """Quality score weighted by recency decay."""
-        total_weight = 0.0
-        quality_sum = 0.0
-        for i, rec in enumerate(records):
-            w = _decay_weight(i)
-            total_weight += w
-            quality_sum += w * rec.quality_score
-        return quality_sum / total_weight if total_weight > 0 else 0.0
+    def _weighted_mean(weights: list[float], values: list[float], default: float) -> float:
+        """Mean of ``values`` weighted by recency decay."""
+        total_weight = math.fsum(weights)
+        if total_weight <= 0:
+            return default
+        return math.fsum(map(operator.mul, weights, values)) / total_weight
 
     @staticmethod
-    def _compute_reliability(records: list[FeedbackRecord]) -> float:
+    def _compute_reliability(qualities: list[float]) -> float:
         """Reliability = 1 - stddev(quality_scores) normalized.
 
         A reliable agent has consistent quality. High variance = low reliability.
         """
-        if len(records) < 2:
+        if len(qualities) < 2:
             return 0.5  # insufficient data
 
-        qualities = [r.quality_score for r in records]
         mean = sum(qualities) / len(qualities)
         variance = sum((q - mean) ** 2 for q in qualities) / len(qualities)
         stddev = math.sqrt(variance)
@@ -174,25 +288,3 @@ class AgentScorer:
         # stddev of 0 maps to reliability 1
         reliability = max(0.0, 1.0 - 2.0 * stddev)
         return reliability
-
-    @staticmethod
-    def _compute_cost_efficiency(records: list[FeedbackRecord]) -> float:
-        """Cost efficiency: quality per dollar, normalized to 0-1.
-
-        Higher quality per dollar = better efficiency.
-        Uses exponential decay weighting for recency.
-        """
-        total_weight = 0.0
-        efficiency_sum = 0.0
-        for i, rec in enumerate(records):
-            w = _decay_weight(i)
-            total_weight += w
-            if rec.cost_usdc > 0:
-                # Quality per dollar, capped at 10 (for $0.10 tasks with quality 1.0)
-                qpd = min(rec.quality_score / rec.cost_usdc, 10.0)
-                # Normalize to 0-1 range (10 qpd = 1.0 efficiency)
-                efficiency_sum += w * (qpd / 10.0)
-            else:
-                # Free work is maximally efficient
-                efficiency_sum += w * 1.0
-        return efficiency_sum / total_weight if total_weight > 0 else 0.5
@@ -11,17 +11,28 @@ Key components:
 
 from __future__ import annotations
 
+import copy
+import operator
+import secrets
 import time
-import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 
-@dataclass
-class AgentListing:
+class _ListingState:
+    """Derived per-listing state, kept in slots outside the dataclass fields.
+
+    Being outside ``fields()`` keeps it out of asdict(), repr() and equality.
+    """
+
+    __slots__ = ("_skills_lower", "_completion_rate", "_cached_dict", "_cached_reputation")
+
+
+@dataclass(slots=True)
+class AgentListing(_ListingState):
     """Describes an agent available in the marketplace."""
 
-    agent_id: str = field(default_factory=lambda: f"agent_{uuid.uuid4().hex[:12]}")
+    agent_id: str = field(default_factory=lambda: f"agent_{secrets.token_hex(6)}")
     name: str = ""
     description: str = ""
     skills: list[str] = field(default_factory=list)
@@ -38,28 +49,57 @@ class AgentListing:
     registered_at: float = field(default_factory=time.time)
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    @property
-    def price_display(self) -> str:
-        unit = "task" if self.pricing_model == "per-task" else "1K tokens"
-        return f"${self.price_per_unit:.4f}/{unit}"
+    def __setattr__(self, name: str, value: Any) -> None:
+        # object.__setattr__ rather than super(): slots=True rebuilds the
+        # class, which breaks zero-argument super() in its methods.
+        object.__setattr__(self, name, value)
+        if name[0] != "_":
+            # Field snapshots behind to_dict() and get_reputation(); None when stale.
+            object.__setattr__(self, "_cached_dict", None)
+            object.__setattr__(self, "_cached_reputation", None)
+        if name == "skills":
+            # Lowercased once here rather than on every skill query. Replace
+            # ``skills`` wholesale (not in place) to keep this in sync.
+            object.__setattr__(self, "_skills_lower", tuple(s.lower() for s in value))
+        elif name in ("total_jobs", "completed_jobs"):
+            # getattr defaults cover __init__, which sets total_jobs first.
+            total = getattr(self, "total_jobs", 0)
+            rate = getattr(self, "completed_jobs", 0) / total if total else 0.0
+            object.__setattr__(self, "_completion_rate", rate)
 
     @property
     def completion_rate(self) -> float:
         """Task completion rate (0.0-1.0). Returns 0 if no jobs."""
-        if self.total_jobs == 0:
-            return 0.0
-        return self.completed_jobs / self.total_jobs
+        return self._completion_rate
+
+    @property
+    def price_display(self) -> str:
+        unit = "task" if self.pricing_model == "per-task" else "1K tokens"
+        return f"${self.price_per_unit:.4f}/{unit}"
 
     def matches_skill(self, skill: str) -> bool:
         skill_lower = skill.lower()
-        return any(skill_lower in s.lower() for s in self.skills)
+        return any(skill_lower in s for s in self._skills_lower)
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        d["completion_rate"] = self.completion_rate
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._cached_dict = dict(zip(_LISTING_FIELDS, _get_listing_fields(self)))
+            cached["completion_rate"] = self._completion_rate
+        # skills and metadata can change in place, so they are always copied
+        # from the live objects rather than from the snapshot.
+        d = cached.copy()
+        d["skills"] = list(self.skills)
+        d["metadata"] = copy.deepcopy(self.metadata)
         return d
 
 
+# Public fields serialized by AgentListing.to_dict(), read in one attrgetter
+# call instead of asdict()'s recursive walk over every field.
+_LISTING_FIELDS = tuple(f.name for f in fields(AgentListing))
+_get_listing_fields = operator.attrgetter(*_LISTING_FIELDS)
+
+
 class MarketplaceRegistry:
     """Registry of agent listings in the marketplace."""
 
@@ -71,6 +111,10 @@ class MarketplaceRegistry:
         self._listings[listing.agent_id] = listing
         return listing
 
+    def register_agents(self, listings: list[AgentListing]) -> list[str]:
+        """Register several agents at once. Returns their agent_ids."""
+        return [self.register_agent(listing).agent_id for listing in listings]
+
     def unregister_agent(self, agent_id: str) -> bool:
         """Remove an agent listing. Returns True if it existed."""
         return self._listings.pop(agent_id, None) is not None
@@ -94,7 +138,7 @@ class MarketplaceRegistry:
             if (
                 query_lower in listing.name.lower()
                 or query_lower in listing.description.lower()
-                or any(query_lower in s.lower() for s in listing.skills)
+                or any(query_lower in s for s in listing._skills_lower)
             ):
                 if max_price is not None and listing.price_per_unit > max_price:
                     continue
@@ -177,17 +221,20 @@ class MarketplaceRegistry:
         listing = self._listings.get(agent_id)
         if listing is None:
             return None
-        return {
-            "agent_id": listing.agent_id,
-            "name": listing.name,
-            "rating": listing.rating,
-            "total_jobs": listing.total_jobs,
-            "completed_jobs": listing.completed_jobs,
-            "failed_jobs": listing.failed_jobs,
-            "completion_rate": listing.completion_rate,
-            "total_earnings": listing.total_earnings,
-            "availability": listing.availability,
-        }
+        reputation = listing._cached_reputation
+        if reputation is None:
+            reputation = listing._cached_reputation = {
+                "agent_id": listing.agent_id,
+                "name": listing.name,
+                "rating": listing.rating,
+                "total_jobs": listing.total_jobs,
+                "completed_jobs": listing.completed_jobs,
+                "failed_jobs": listing.failed_jobs,
+                "completion_rate": listing.completion_rate,
+                "total_earnings": listing.total_earnings,
+                "availability": listing.availability,
+            }
+        return reputation.copy()
 
     def clear(self) -> None:
         """Remove all listings."""
@@ -232,7 +279,7 @@ class SkillMatcher:
             if max_price is not None and listing.price_per_unit > max_price:
                 continue
 
-            agent_skills_lower = [s.lower() for s in listing.skills]
+            agent_skills_lower = listing._skills_lower
             overlap = sum(
                 1 for req in required_lower
                 if any(req in ask for ask in agent_skills_lower)
@@ -18,27 +18,34 @@ Integrates with:
 
 from __future__ import annotations
 
+import secrets
+import threading
 import time
-import uuid
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
 from src.marketplace import MarketplaceRegistry, SkillMatcher, AgentListing, marketplace
-from src.marketplace.x402 import AgentEscrow, EscrowEntry, X402PaymentGate, PaymentConfig
+from src.marketplace.x402 import (
+    AgentEscrow,
+    EscrowEntry,
+    X402PaymentGate,
+    PaymentConfig,
+)
+from src.marketplace.usdc import from_micro, to_micro
 
 
-@dataclass
+@dataclass(slots=True)
 class HireRequest:
     """A request to hire an agent for a task."""
 
-    task_id: str = field(default_factory=lambda: f"hire_{uuid.uuid4().hex[:12]}")
+    task_id: str = field(default_factory=lambda: f"hire_{secrets.token_hex(6)}")
     description: str = ""
     required_skills: list[str] = field(default_factory=list)
     budget: float = 0.0  # Max USDC to spend
     requester: str = "ceo"
 
 
-@dataclass
+@dataclass(slots=True)
 class HireResult:
     """Result of a hiring flow."""
 
@@ -55,11 +62,18 @@ class HireResult:
 
 
 class BudgetTracker:
-    """Tracks spending per requester across tasks."""
+    """Tracks spending per requester across tasks.
+
+    Amounts are held in integer micro-USDC so that the over-budget check is
+    exact (ten 0.1 spends fit a 1.0 budget).
+    """
 
     def __init__(self, total_budget: float = 100.0) -> None:
         self._total_budget = total_budget
-        self._spent: dict[str, float] = {}  # task_id -> amount
+        self._total_micro = to_micro(total_budget)
+        self._spent: dict[str, int] = {}  # task_id -> micro-USDC
+        self._spent_micro = 0
+        self._lock = threading.Lock()
 
     @property
     def total_budget(self) -> float:
@@ -67,26 +81,44 @@ class BudgetTracker:
 
     @property
     def total_spent(self) -> float:
-        return sum(self._spent.values())
+        return from_micro(self._spent_micro)
 
     @property
     def remaining(self) -> float:
-        return self._total_budget - self.total_spent
+        return from_micro(self._total_micro - self._spent_micro)
 
     def can_afford(self, amount: float) -> bool:
         """Check if the budget can cover this amount."""
-        return amount <= self.remaining
+        return self._spent_micro + to_micro(amount) <= self._total_micro
 
     def spend(self, task_id: str, amount: float) -> bool:
-        """Record spending. Returns False if budget exceeded."""
-        if not self.can_afford(amount):
-            return False
-        self._spent[task_id] = self._spent.get(task_id, 0.0) + amount
+        """Record spending. Returns False if budget exceeded.
+
+        The check and the deduction happen under one lock, so concurrent
+        hires cannot both pass the check and overdraw the budget.
+        """
+        micro = to_micro(amount)
+        with self._lock:
+            if self._spent_micro + micro > self._total_micro:
+                return False
+            self._spent[task_id] = self._spent.get(task_id, 0) + micro
+            self._spent_micro += micro
         return True
 
+    def refund(self, task_id: str, amount: float) -> None:
+        """Return previously spent budget for a task (e.g. a failed hire)."""
+        with self._lock:
+            micro = min(to_micro(amount), self._spent.get(task_id, 0))
+            if not micro:
+                return
+            self._spent[task_id] -= micro
+            if not self._spent[task_id]:
+                del self._spent[task_id]
+            self._spent_micro -= micro
+
     def get_spending(self, task_id: str) -> float:
         """Get total spending for a task."""
-        return self._spent.get(task_id, 0.0)
+        return from_micro(self._spent.get(task_id, 0))
 
     def spending_report(self) -> dict[str, Any]:
         """Generate a spending report."""
@@ -94,12 +126,14 @@ class BudgetTracker:
             "total_budget": self._total_budget,
             "total_spent": self.total_spent,
             "remaining": self.remaining,
-            "tasks": dict(self._spent),
+            "tasks": {task_id: from_micro(micro) for task_id, micro in self._spent.items()},
         }
 
     def reset(self) -> None:
         """Reset all spending."""
-        self._spent.clear()
+        with self._lock:
+            self._spent.clear()
+            self._spent_micro = 0
 
 
 class HiringManager:
@@ -150,9 +184,8 @@ class HiringManager:
 
     def pay(self, request: HireRequest, agent: AgentListing, price: float) -> EscrowEntry | None:
         """Step 4: Create escrow payment. Returns None if budget exceeded."""
-        if not self._budget.can_afford(price):
+        if not self._budget.spend(request.task_id, price):
             return None
-        self._budget.spend(request.task_id, price)
         entry = self._escrow.hold_payment(
             payer=request.requester,
             payee=agent.name,
@@ -246,6 +279,7 @@ class HiringManager:
         else:
             # Refund on failure
             self.refund_payment(escrow_entry.escrow_id)
+            self._budget.refund(request.task_id, price)
             result.status = "failed"
             result.error = "Task result verification failed"
 
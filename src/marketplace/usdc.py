@@ -0,0 +1,25 @@
+"""USDC amount helpers shared by the payment and hiring modules.
+
+Balances and budgets are kept in integer micro-USDC (USDC has 6 decimals)
+so repeated credits and debits add up exactly instead of drifting.
+"""
+
+from __future__ import annotations
+
+MICRO_PER_USDC = 1_000_000
+
+
+def to_micro(amount: float) -> int:
+    """Convert a USDC amount to integer micro-USDC, rounding to the nearest unit.
+
+    Amounts below half a micro-USDC round to zero, as USDC cannot represent them.
+    """
+    return round(amount * MICRO_PER_USDC)
+
+
+def from_micro(micro: int) -> float:
+    """Convert integer micro-USDC back to a USDC amount."""
+    return micro / MICRO_PER_USDC
+
+
+__all__ = ["MICRO_PER_USDC", "to_micro", "from_micro"]
@@ -30,11 +30,16 @@ x402 V2 response format:
 
 from __future__ import annotations
 
+import copy
+import operator
+import secrets
 import time
-import uuid
-from dataclasses import dataclass, field, asdict
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
 from typing import Any
 
+from src.marketplace.usdc import from_micro, to_micro
+
 
 @dataclass
 class PaymentConfig:
@@ -68,11 +73,11 @@ class PaymentConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProof:
     """Proof of payment from a payer."""
 
-    payment_id: str = field(default_factory=lambda: f"pay_{uuid.uuid4().hex[:12]}")
+    payment_id: str = field(default_factory=lambda: f"pay_{secrets.token_hex(6)}")
     payer: str = ""
     payee: str = ""
     amount: float = 0.0
@@ -159,11 +164,11 @@ class X402PaymentGate:
         return sum(p.amount for p in self._payments if p.verified)
 
 
-@dataclass
+@dataclass(slots=True)
 class EscrowEntry:
     """An escrow hold for an agent hiring."""
 
-    escrow_id: str = field(default_factory=lambda: f"escrow_{uuid.uuid4().hex[:12]}")
+    escrow_id: str = field(default_factory=lambda: f"escrow_{secrets.token_hex(6)}")
     payer: str = ""
     payee: str = ""
     amount: float = 0.0
@@ -247,11 +252,11 @@ class AgentEscrow:
         self._entries.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
     """A single entry in the payment ledger (full audit trail)."""
 
-    entry_id: str = field(default_factory=lambda: f"ledger_{uuid.uuid4().hex[:12]}")
+    entry_id: str = field(default_factory=lambda: f"ledger_{secrets.token_hex(6)}")
     event_type: str = ""  # "payment_request", "payment_verified", "escrow_hold", "escrow_release", "escrow_refund"
     payer: str = ""
     payee: str = ""
@@ -264,7 +269,15 @@ class LedgerEntry:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        d = dict(zip(_LEDGER_FIELDS, _get_ledger_fields(self)))
+        d["metadata"] = copy.deepcopy(self.metadata)
+        return d
+
+
+# Fields serialized by LedgerEntry.to_dict(), read in one attrgetter call
+# instead of asdict()'s recursive walk over every field.
+_LEDGER_FIELDS = tuple(f.name for f in fields(LedgerEntry))
+_get_ledger_fields = operator.attrgetter(*_LEDGER_FIELDS)
 
 
 class PaymentLedger:
@@ -276,6 +289,13 @@ class PaymentLedger:
 
     def __init__(self) -> None:
         self._entries: list[LedgerEntry] = []
+        # Secondary indexes: event_type, agent (payer or payee), and task_id
+        # -> positions in _entries. Each bucket is a dict used as an ordered
+        # set, so it iterates in recording order and also answers membership.
+        self._by_type: dict[str, dict[int, None]] = defaultdict(dict)
+        self._by_agent: dict[str, dict[int, None]] = defaultdict(dict)
+        self._by_task: dict[str, dict[int, None]] = defaultdict(dict)
+        self._volume_micro = 0  # running total of amounts, in micro-USDC
 
     def record(
         self,
@@ -301,7 +321,13 @@ class PaymentLedger:
             network=network,
             metadata=metadata or {},
         )
+        pos = len(self._entries)
         self._entries.append(entry)
+        self._by_type[event_type][pos] = None
+        self._by_agent[payer][pos] = None
+        self._by_agent[payee][pos] = None
+        self._by_task[task_id][pos] = None
+        self._volume_micro += to_micro(amount)
         return entry
 
     def get_entries(
@@ -311,14 +337,21 @@ class PaymentLedger:
         task_id: str | None = None,
     ) -> list[LedgerEntry]:
         """Query ledger entries with optional filters."""
-        results = self._entries
+        buckets = []
         if event_type is not None:
-            results = [e for e in results if e.event_type == event_type]
+            buckets.append(self._by_type.get(event_type, {}))
         if agent_id is not None:
-            results = [e for e in results if e.payer == agent_id or e.payee == agent_id]
+            buckets.append(self._by_agent.get(agent_id, {}))
         if task_id is not None:
-            results = [e for e in results if e.task_id == task_id]
-        return results
+            buckets.append(self._by_task.get(task_id, {}))
+        if not buckets:
+            return list(self._entries)
+        # Walk the smallest bucket in order, keeping positions present in
+        # every other bucket; no per-entry attribute comparisons needed.
+        buckets.sort(key=len)
+        smallest, *others = buckets
+        entries = self._entries
+        return [entries[pos] for pos in smallest if all(pos in b for b in others)]
 
     def get_all(self) -> list[LedgerEntry]:
         """Return all ledger entries."""
@@ -329,10 +362,14 @@ class PaymentLedger:
 
     def total_volume(self) -> float:
         """Total USDC volume across all events."""
-        return sum(e.amount for e in self._entries)
+        return from_micro(self._volume_micro)
 
     def clear(self) -> None:
         self._entries.clear()
+        self._by_type.clear()
+        self._by_agent.clear()
+        self._by_task.clear()
+        self._volume_micro = 0
 
 
 class PaymentManager:
@@ -351,7 +388,7 @@ class PaymentManager:
         self._gate = gate or X402PaymentGate()
         self._escrow = escrow or AgentEscrow()
         self._ledger = ledger or PaymentLedger()
-        self._balances: dict[str, float] = {}  # agent_id -> balance
+        self._balances: defaultdict[str, int] = defaultdict(int)  # agent_id -> micro-USDC
 
     @property
     def gate(self) -> X402PaymentGate:
@@ -399,7 +436,7 @@ class PaymentManager:
             metadata={"tx_hash": proof.tx_hash, "verified": ok},
         )
         if ok:
-            self._balances[proof.payee] = self._balances.get(proof.payee, 0.0) + proof.amount
+            self._adjust_balance(proof.payee, to_micro(proof.amount))
         return ok
 
     def hold_escrow(
@@ -426,7 +463,7 @@ class PaymentManager:
         entry = self._escrow.release_on_completion(escrow_id)
         if entry is None:
             return None
-        self._balances[entry.payee] = self._balances.get(entry.payee, 0.0) + entry.amount
+        self._adjust_balance(entry.payee, to_micro(entry.amount))
         self._ledger.record(
             event_type="escrow_release",
             payer=entry.payer,
@@ -442,7 +479,7 @@ class PaymentManager:
         entry = self._escrow.refund_on_failure(escrow_id)
         if entry is None:
             return None
-        self._balances[entry.payer] = self._balances.get(entry.payer, 0.0) + entry.amount
+        self._adjust_balance(entry.payer, to_micro(entry.amount))
         self._ledger.record(
             event_type="escrow_refund",
             payer=entry.payer,
@@ -453,25 +490,29 @@ class PaymentManager:
         )
         return entry
 
+    def _adjust_balance(self, agent_id: str, micro: int) -> float:
+        """Add ``micro`` (may be negative) to a balance. Returns the new USDC balance."""
+        self._balances[agent_id] += micro
+        return from_micro(self._balances[agent_id])
+
     def get_balance(self, agent_id: str) -> float:
         """Get an agent's current balance."""
-        return self._balances.get(agent_id, 0.0)
+        return from_micro(self._balances.get(agent_id, 0))
 
     def get_all_balances(self) -> dict[str, float]:
         """Get all agent balances."""
-        return dict(self._balances)
+        return {agent_id: from_micro(micro) for agent_id, micro in self._balances.items()}
 
     def credit(self, agent_id: str, amount: float) -> float:
         """Manually credit an agent's balance. Returns new balance."""
-        self._balances[agent_id] = self._balances.get(agent_id, 0.0) + amount
-        return self._balances[agent_id]
+        return self._adjust_balance(agent_id, to_micro(amount))
 
     def debit(self, agent_id: str, amount: float) -> bool:
         """Debit an agent's balance. Returns False if insufficient."""
-        current = self._balances.get(agent_id, 0.0)
-        if amount > current:
+        micro = to_micro(amount)
+        if micro > self._balances.get(agent_id, 0):
             return False
-        self._balances[agent_id] = current - amount
+        self._adjust_balance(agent_id, -micro)
         return True
 
 
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import sys
@@ -162,11 +163,60 @@ MCP_TOOLS: list[Tool] = [
 
 
 # ---------------------------------------------------------------------------
-# Tool handlers
+# Argument validation
 # ---------------------------------------------------------------------------
 
+# JSON Schema "type" -> Python types accepted for it.
+_SCHEMA_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
 
-def _handle_create_task(arguments: dict[str, Any]) -> str:
+
+def _compile_validator(schema: dict[str, Any]):
+    """Build a checker for a tool's flat ``inputSchema``.
+
+    Only what the schemas in MCP_TOOLS use is covered: an object with
+    ``required`` keys and typed properties. The returned function gives an
+    error message, or None when the arguments are acceptable.
+    """
+    required = tuple(schema.get("required", ()))
+    types = {
+        name: _SCHEMA_TYPES[prop["type"]]
+        for name, prop in schema.get("properties", {}).items()
+        if prop.get("type") in _SCHEMA_TYPES
+    }
+
+    def validate(arguments: Any) -> str | None:
+        if not isinstance(arguments, dict):
+            return "'arguments' must be an object"
+        missing = [name for name in required if name not in arguments]
+        if missing:
+            return f"Missing required argument(s): {missing}"
+        for name, value in arguments.items():
+            expected = types.get(name)
+            if expected is None:
+                continue
+            # bool is an int subclass but never a valid number/integer here.
+            if not isinstance(value, expected) or (
+                isinstance(value, bool) and bool not in expected
+            ):
+                return f"Argument '{name}' has the wrong type"
+        return None
+
+    return validate
+
+
+# ---------------------------------------------------------------------------
+# Tool implementations (plain dicts)
+# ---------------------------------------------------------------------------
+
+
+def _create_task_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.storage import get_storage
     task_id = f"mcp_{uuid.uuid4().hex[:12]}"
     now = time.time()
@@ -179,36 +229,36 @@ def _handle_create_task(arguments: dict[str, Any]) -> str:
         status="pending",
         created_at=now,
     )
-    return json.dumps({
+    return {
         "task_id": task_id,
         "description": arguments["description"],
         "budget_usd": arguments.get("budget", 1.0),
         "status": "pending",
         "created_at": now,
-    })
+    }
 
 
-def _handle_get_task(arguments: dict[str, Any]) -> str:
+def _get_task_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.storage import get_storage
     task = get_storage().get_task(arguments["task_id"])
     if task is None:
-        return json.dumps({"error": f"Task '{arguments['task_id']}' not found"})
-    return json.dumps({
+        return {"error": f"Task '{arguments['task_id']}' not found"}
+    return {
         "task_id": task["task_id"],
         "description": task["description"],
         "status": task["status"],
         "budget_usd": task["budget_usd"],
         "created_at": task["created_at"],
         "result": task.get("result"),
-    })
+    }
 
 
-def _handle_list_tasks(arguments: dict[str, Any]) -> str:
+def _list_tasks_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.storage import get_storage
     status = arguments.get("status", "all")
     storage = get_storage()
     tasks = storage.list_tasks() if status == "all" else storage.list_tasks(status=status)
-    return json.dumps({
+    return {
         "count": len(tasks),
         "tasks": [
             {
@@ -219,10 +269,10 @@ def _handle_list_tasks(arguments: dict[str, Any]) -> str:
             }
             for t in tasks
         ],
-    })
+    }
 
 
-def _handle_hire_agent(arguments: dict[str, Any]) -> str:
+def _hire_agent_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.marketplace.hiring import HiringManager, HireRequest
     from src.marketplace import marketplace, AgentListing
 
@@ -243,47 +293,55 @@ def _handle_hire_agent(arguments: dict[str, Any]) -> str:
     )
     manager = HiringManager()
     result = manager.hire(request)
-    return json.dumps({
+    return {
         "task_id": result.task_id,
         "status": result.status,
         "agent_name": result.agent_name,
         "agreed_price": result.agreed_price,
         "elapsed_s": result.elapsed_s,
         "error": result.error or None,
-    })
+    }
 
 
-def _handle_list_agents(arguments: dict[str, Any]) -> str:
+def _list_agents_impl(arguments: dict[str, Any]) -> list[dict[str, Any]]:
     from src.mcp_servers.registry_server import registry
     from dataclasses import asdict
-    agents = registry.list_all()
-    return json.dumps([asdict(a) for a in agents], indent=2)
+    return [asdict(a) for a in registry.list_all()]
 
 
-def _handle_marketplace_search(arguments: dict[str, Any]) -> str:
+@functools.lru_cache(maxsize=256)
+def _search_agents_cached(version: int, query: str, max_price: float | None) -> tuple[Any, ...]:
+    """Registry search results, keyed on the registry version they came from."""
+    from src.mcp_servers.registry_server import registry
+    return tuple(registry.search(query, max_price=max_price))
+
+
+def _marketplace_search_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.mcp_servers.registry_server import registry
     from dataclasses import asdict
-    agents = registry.search(arguments["query"], max_price=arguments.get("max_price"))
-    return json.dumps({
+    agents = _search_agents_cached(
+        registry.version, arguments["query"], arguments.get("max_price")
+    )
+    return {
         "count": len(agents),
         "agents": [asdict(a) for a in agents],
-    })
+    }
 
 
-def _handle_check_budget(arguments: dict[str, Any]) -> str:
+def _check_budget_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.mcp_servers.payment_hub import ledger
     budget = ledger.get_budget(arguments["task_id"])
     if budget is None:
-        return json.dumps({"error": "No budget allocated for this task"})
-    return json.dumps({
+        return {"error": "No budget allocated for this task"}
+    return {
         "task_id": budget.task_id,
         "allocated": budget.allocated,
         "spent": budget.spent,
         "remaining": budget.remaining,
-    })
+    }
 
 
-def _handle_check_payment_status(arguments: dict[str, Any]) -> str:
+def _check_payment_status_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.mcp_servers.payment_hub import ledger
     task_id = arguments["task_id"]
     transactions = ledger.get_transactions(task_id=task_id)
@@ -308,10 +366,10 @@ def _handle_check_payment_status(arguments: dict[str, Any]) -> str:
             "spent": budget.spent,
             "remaining": budget.remaining,
         }
-    return json.dumps(result)
+    return result
 
 
-def _handle_pay_agent(arguments: dict[str, Any]) -> str:
+def _pay_agent_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     from src.mcp_servers.payment_hub import ledger
     record = ledger.record_payment(
         from_agent="mcp_client",
@@ -319,26 +377,82 @@ def _handle_pay_agent(arguments: dict[str, Any]) -> str:
         amount=arguments["amount"],
         task_id=arguments["task_id"],
     )
-    return json.dumps({
+    return {
         "tx_id": record.tx_id,
         "status": record.status,
         "amount_usdc": record.amount_usdc,
         "to_agent": record.to_agent,
         "network": "eip155:8453",
-    })
+    }
 
 
-def _handle_get_metrics(arguments: dict[str, Any]) -> str:
+def _get_metrics_impl(arguments: dict[str, Any]) -> dict[str, Any]:
     try:
         from src.metrics.collector import get_metrics_collector
         mc = get_metrics_collector()
         agent_name = arguments.get("agent_name", "all")
         if agent_name == "all":
-            return json.dumps(mc.get_system_metrics())
+            return mc.get_system_metrics()
         summary = mc.get_agent_summary(agent_name)
-        return json.dumps(summary) if summary else json.dumps({"error": f"No metrics for {agent_name}"})
+        return summary if summary else {"error": f"No metrics for {agent_name}"}
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
+
+
+# ---------------------------------------------------------------------------
+# MCP wire handlers: the *_impl functions above, encoded as JSON text
+# ---------------------------------------------------------------------------
+
+
+def _handle_create_task(arguments: dict[str, Any]) -> str:
+    return json.dumps(_create_task_impl(arguments))
+
+
+def _handle_get_task(arguments: dict[str, Any]) -> str:
+    return json.dumps(_get_task_impl(arguments))
+
+
+def _handle_list_tasks(arguments: dict[str, Any]) -> str:
+    return json.dumps(_list_tasks_impl(arguments))
+
+
+def _handle_hire_agent(arguments: dict[str, Any]) -> str:
+    return json.dumps(_hire_agent_impl(arguments))
+
+
+# (registry version, JSON) of the last list_agents response.
+_LIST_AGENTS_CACHE: tuple[int, str] | None = None
+
+
+def _handle_list_agents(arguments: dict[str, Any]) -> str:
+    global _LIST_AGENTS_CACHE
+    from src.mcp_servers.registry_server import registry
+    version = registry.version
+    if _LIST_AGENTS_CACHE is not None and _LIST_AGENTS_CACHE[0] == version:
+        return _LIST_AGENTS_CACHE[1]
+    result = json.dumps(_list_agents_impl(arguments), indent=2)
+    _LIST_AGENTS_CACHE = (version, result)
+    return result
+
+
+def _handle_marketplace_search(arguments: dict[str, Any]) -> str:
+    return json.dumps(_marketplace_search_impl(arguments))
+
+
+def _handle_check_budget(arguments: dict[str, Any]) -> str:
+    return json.dumps(_check_budget_impl(arguments))
+
+
+def _handle_check_payment_status(arguments: dict[str, Any]) -> str:
+    return json.dumps(_check_payment_status_impl(arguments))
+
+
+def _handle_pay_agent(arguments: dict[str, Any]) -> str:
+    return json.dumps(_pay_agent_impl(arguments))
+
+
+def _handle_get_metrics(arguments: dict[str, Any]) -> str:
+    return json.dumps(_get_metrics_impl(arguments))
 
 
 # Dispatcher
@@ -355,6 +469,26 @@ _HANDLERS: dict[str, Any] = {
     "get_metrics": _handle_get_metrics,
 }
 
+# The same tools returning plain dicts, for in-process callers such as the
+# REST API that would otherwise decode the JSON text straight back.
+_IMPLS: dict[str, Any] = {
+    "create_task": _create_task_impl,
+    "get_task": _get_task_impl,
+    "list_tasks": _list_tasks_impl,
+    "hire_agent": _hire_agent_impl,
+    "list_agents": _list_agents_impl,
+    "marketplace_search": _marketplace_search_impl,
+    "check_budget": _check_budget_impl,
+    "check_payment_status": _check_payment_status_impl,
+    "pay_agent": _pay_agent_impl,
+    "get_metrics": _get_metrics_impl,
+}
+
+# Argument checkers, built once from each tool's inputSchema.
+_VALIDATORS: dict[str, Any] = {
+    tool.name: _compile_validator(tool.inputSchema) for tool in MCP_TOOLS
+}
+
 
 # ---------------------------------------------------------------------------
 # MCP Server factory
@@ -162,6 +162,10 @@ class PaymentLedger:
             return list(self._transactions)
         return [t for t in self._transactions if t.task_id == task_id]
 
+    def transaction_count(self) -> int:
+        """Number of recorded transactions."""
+        return len(self._transactions)
+
     def total_spent(self) -> float:
         """Total USDC spent across all tasks."""
         return sum(t.amount_usdc for t in self._transactions if t.status == "completed")
@@ -40,6 +40,15 @@ class AgentRegistry:
     def __init__(self) -> None:
         self._agents: dict[str, AgentCard] = {}
         self._persist = True  # Can be disabled for tests
+        self._version = 0  # bumped on every change to _agents
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever agents are registered or removed.
+
+        Lets callers cache results derived from the registry contents.
+        """
+        return self._version
 
     def _storage(self):
         """Lazy access to storage singleton."""
@@ -48,6 +57,7 @@ class AgentRegistry:
     def register(self, card: AgentCard) -> None:
         """Register an agent in the registry."""
         self._agents[card.name] = card
+        self._version += 1
         if self._persist:
             try:
                 self._storage().save_agent(
@@ -67,6 +77,8 @@ class AgentRegistry:
     def unregister(self, name: str) -> bool:
         """Remove an agent from the registry."""
         removed = self._agents.pop(name, None) is not None
+        if removed:
+            self._version += 1
         if self._persist and removed:
             try:
                 self._storage().remove_agent(name)
@@ -74,6 +86,19 @@ class AgentRegistry:
                 pass
         return removed
 
+    def snapshot(self) -> dict[str, AgentCard]:
+        """Copy of the current name -> card mapping, for :meth:`restore`."""
+        return dict(self._agents)
+
+    def restore(self, cards: dict[str, AgentCard]) -> None:
+        """Replace the in-memory registry contents with *cards*.
+
+        Storage is not touched; this resets the live registry (e.g. to a
+        :meth:`snapshot` taken earlier, in tests).
+        """
+        self._agents = dict(cards)
+        self._version += 1
+
     def get(self, name: str) -> AgentCard | None:
         """Get an agent by name."""
         return self._agents.get(name)
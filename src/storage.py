@@ -92,6 +92,63 @@ CREATE TABLE IF NOT EXISTS metrics (
 """
 
 
+_SAVE_TASK_SQL = """INSERT OR REPLACE INTO tasks
+   (task_id, description, workflow, budget_usd, status, created_at, result)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _task_row(
+    task_id: str,
+    description: str,
+    workflow: str,
+    budget_usd: float,
+    status: str = "pending",
+    created_at: float | None = None,
+    result: dict[str, Any] | None = None,
+) -> tuple[Any, ...]:
+    """Parameters for ``_SAVE_TASK_SQL`` from save_task()'s arguments."""
+    return (
+        task_id,
+        description,
+        workflow,
+        budget_usd,
+        status,
+        created_at or time.time(),
+        json.dumps(result) if result is not None else None,
+    )
+
+
+_SAVE_METRIC_SQL = """INSERT INTO metrics
+   (event_type, agent_id, task_id, task_type, status,
+    cost_usdc, latency_ms, metadata, timestamp)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _metric_row(
+    event_type: str,
+    agent_id: str = "",
+    task_id: str = "",
+    task_type: str = "",
+    status: str = "",
+    cost_usdc: float = 0.0,
+    latency_ms: float = 0.0,
+    metadata: dict[str, Any] | None = None,
+    timestamp: float | None = None,
+) -> tuple[Any, ...]:
+    """Parameters for ``_SAVE_METRIC_SQL`` from save_metric()'s arguments."""
+    return (
+        event_type,
+        agent_id,
+        task_id,
+        task_type,
+        status,
+        cost_usdc,
+        latency_ms,
+        json.dumps(metadata or {}),
+        timestamp or time.time(),
+    )
+
+
 class SQLiteStorage:
     """Unified SQLite storage for tasks, payments, and agent registry.
 
@@ -142,21 +199,24 @@ class SQLiteStorage:
         """Insert or replace a task record."""
         conn = self._get_conn()
         conn.execute(
-            """INSERT OR REPLACE INTO tasks
-               (task_id, description, workflow, budget_usd, status, created_at, result)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                task_id,
-                description,
-                workflow,
-                budget_usd,
-                status,
-                created_at or time.time(),
-                json.dumps(result) if result is not None else None,
-            ),
+            _SAVE_TASK_SQL,
+            _task_row(task_id, description, workflow, budget_usd, status, created_at, result),
         )
         conn.commit()
 
+    def save_tasks(self, tasks: list[dict[str, Any]]) -> int:
+        """Insert or replace several tasks in one transaction.
+
+        Each dict takes the keyword arguments of :meth:`save_task`.
+        Returns the number of tasks written.
+        """
+        if not tasks:
+            return 0
+        conn = self._get_conn()
+        conn.executemany(_SAVE_TASK_SQL, [_task_row(**t) for t in tasks])
+        conn.commit()
+        return len(tasks)
+
     def get_task(self, task_id: str) -> dict[str, Any] | None:
         """Retrieve a task by ID. Returns dict or None."""
         conn = self._get_conn()
@@ -539,24 +599,27 @@ class SQLiteStorage:
         """Insert a metrics event."""
         conn = self._get_conn()
         conn.execute(
-            """INSERT INTO metrics
-               (event_type, agent_id, task_id, task_type, status,
-                cost_usdc, latency_ms, metadata, timestamp)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                event_type,
-                agent_id,
-                task_id,
-                task_type,
-                status,
-                cost_usdc,
-                latency_ms,
-                json.dumps(metadata or {}),
-                timestamp or time.time(),
+            _SAVE_METRIC_SQL,
+            _metric_row(
+                event_type, agent_id, task_id, task_type, status,
+                cost_usdc, latency_ms, metadata, timestamp,
             ),
         )
         conn.commit()
 
+    def save_metrics(self, metrics: list[dict[str, Any]]) -> int:
+        """Insert several metrics events in one transaction.
+
+        Each dict takes the keyword arguments of :meth:`save_metric`.
+        Returns the number of events written.
+        """
+        if not metrics:
+            return 0
+        conn = self._get_conn()
+        conn.executemany(_SAVE_METRIC_SQL, [_metric_row(**m) for m in metrics])
+        conn.commit()
+        return len(metrics)
+
     def get_metrics(
         self,
         event_type: str | None = None,
@@ -15,17 +15,21 @@ import pytest
 # Force mock provider before any module imports config
 os.environ["MODEL_PROVIDER"] = "mock"
 
-# Use a temporary database for tests
+# Use a temporary database for tests.  conftest runs once per process, so
+# under ``pytest -n auto`` every xdist worker gets its own directory here.
 _test_db_dir = tempfile.mkdtemp()
 _test_db_path = os.path.join(_test_db_dir, "test_hirewire.db")
 os.environ["HIREWIRE_DB_PATH"] = _test_db_path
 
+# Imported once here, after the env overrides above, instead of inside the
+# per-test fixtures below.
+import src.storage as storage_mod  # noqa: E402
+from src.config import get_settings  # noqa: E402
+
 
 @pytest.fixture(autouse=True)
 def _reset_settings_cache():
     """Clear cached settings so each test gets fresh config."""
-    from src.config import get_settings
-
     get_settings.cache_clear()
     yield
     get_settings.cache_clear()
@@ -39,8 +43,6 @@ def _reset_storage():
     creating a new storage instance takes ~500ms (schema init, WAL mode),
     while clear_all() takes <5ms.
     """
-    import src.storage as storage_mod
-
     test_db = os.path.join(_test_db_dir, f"test_{os.getpid()}.db")
     if storage_mod._storage is None:
         storage_mod._storage = storage_mod.SQLiteStorage(test_db)
@@ -48,3 +50,40 @@ def _reset_storage():
         storage_mod._storage.clear_all()
     yield
     storage_mod._storage.clear_all()
+
+
+@pytest.fixture(scope="session")
+def marketplace_client():
+    """One app and TestClient with the marketplace routes, built once per session.
+
+    The route handlers read the module-level singletons in
+    ``src.api.marketplace_routes`` on every request, so per-test fixtures
+    only need to monkeypatch fresh state objects in, not rebuild the app.
+    Under ``pytest -n auto`` each xdist worker is its own process with its
+    own app and singletons, so no xdist_group mark is needed.
+    """
+    import src.api.marketplace_routes as routes_mod
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.include_router(routes_mod.router)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """TestClient for the full ``src.api.main`` app, started once per session.
+
+    Entered as a context manager so the app's startup and shutdown hooks
+    run exactly once. Tests only send requests through it; state they
+    create lives in storage and the module singletons, which the autouse
+    fixtures above and in each test module reset.
+    """
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+
+    with TestClient(app) as client:
+        yield client
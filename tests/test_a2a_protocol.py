@@ -344,7 +344,6 @@ class TestA2AProtocolTaskStore:
 class TestA2AClient:
     """Test A2A client discovery and task sending."""
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_discover_agent(self, client):
         agent_card_data = {
@@ -364,7 +363,6 @@ class TestA2AClient:
         assert card.name == "RemoteAgent"
         assert card.url == "http://remote:9000"
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_discover_agent_not_found(self, client):
         respx.get("http://remote:9000/.well-known/agent.json").mock(
@@ -373,7 +371,6 @@ class TestA2AClient:
         card = await client.discover("http://remote:9000")
         assert card is None
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_discover_agent_network_error(self, client):
         respx.get("http://unreachable:9000/.well-known/agent.json").mock(
@@ -382,7 +379,6 @@ class TestA2AClient:
         card = await client.discover("http://unreachable:9000")
         assert card is None
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_discover_caches_agent(self, client):
         respx.get("http://remote:9000/.well-known/agent.json").mock(
@@ -396,7 +392,6 @@ class TestA2AClient:
         assert len(discovered) == 1
         assert discovered[0].name == "CachedAgent"
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_send_task(self, client):
         respx.post("http://remote:9000/a2a").mock(
@@ -410,7 +405,6 @@ class TestA2AClient:
         assert "result" in result
         assert result["result"]["task_id"] == "a2a_123"
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_send_task_network_error(self, client):
         respx.post("http://unreachable:9000/a2a").mock(
@@ -419,7 +413,6 @@ class TestA2AClient:
         result = await client.send_task("http://unreachable:9000", "Test")
         assert "error" in result
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_get_task_status(self, client):
         respx.post("http://remote:9000/a2a").mock(
@@ -432,7 +425,6 @@ class TestA2AClient:
         result = await client.get_task_status("http://remote:9000", "a2a_123")
         assert result["result"]["state"] == "completed"
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_cancel_task(self, client):
         respx.post("http://remote:9000/a2a").mock(
@@ -481,7 +473,6 @@ class TestA2AClient:
         client.clear_discovered()
         assert len(client.get_discovered()) == 0
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_discover_url_trailing_slash(self, client):
         """Ensure trailing slashes are handled correctly."""
@@ -741,7 +732,6 @@ class TestA2AServer:
 class TestA2AEndpoints:
     """Test the FastAPI A2A endpoints via ASGI transport."""
 
-    @pytest.mark.asyncio
     async def test_agent_card_endpoint(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -755,7 +745,6 @@ class TestA2AEndpoints:
         assert "skills" in card
         assert "protocols" in card
 
-    @pytest.mark.asyncio
     async def test_a2a_jsonrpc_tasks_send(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -774,7 +763,6 @@ class TestA2AEndpoints:
         assert "result" in data
         assert data["id"] == 100
 
-    @pytest.mark.asyncio
     async def test_a2a_jsonrpc_agents_info(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -791,7 +779,6 @@ class TestA2AEndpoints:
         data = resp.json()
         assert data["result"]["name"] == "HireWire"
 
-    @pytest.mark.asyncio
     async def test_a2a_jsonrpc_invalid_json(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -808,7 +795,6 @@ class TestA2AEndpoints:
         assert "error" in data
         assert data["error"]["code"] == PARSE_ERROR
 
-    @pytest.mark.asyncio
     async def test_a2a_jsonrpc_batch(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -824,7 +810,6 @@ class TestA2AEndpoints:
         assert isinstance(data, list)
         assert len(data) == 2
 
-    @pytest.mark.asyncio
     async def test_a2a_jsonrpc_empty_batch(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -836,7 +821,6 @@ class TestA2AEndpoints:
         data = resp.json()
         assert "error" in data
 
-    @pytest.mark.asyncio
     async def test_a2a_agents_endpoint(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -849,7 +833,6 @@ class TestA2AEndpoints:
         assert "total" in data
         assert "agents" in data
 
-    @pytest.mark.asyncio
     async def test_a2a_discover_missing_url(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -859,7 +842,6 @@ class TestA2AEndpoints:
             resp = await client.post("/a2a/discover", json={})
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_a2a_delegate_missing_url(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -869,7 +851,6 @@ class TestA2AEndpoints:
             resp = await client.post("/a2a/delegate", json={"description": "test"})
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_a2a_delegate_missing_description(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -879,7 +860,6 @@ class TestA2AEndpoints:
             resp = await client.post("/a2a/delegate", json={"url": "http://test"})
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_a2a_info_endpoint(self):
         from src.api.main import app
         async with httpx.AsyncClient(
@@ -902,7 +882,6 @@ class TestA2AEndpoints:
 class TestDelegation:
     """Test the delegation helper."""
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_delegate_success(self):
         respx.get("http://remote:9000/.well-known/agent.json").mock(
@@ -926,7 +905,6 @@ class TestDelegation:
         assert result["remote_agent"]["name"] == "RemoteAgent"
         assert "task_result" in result
 
-    @pytest.mark.asyncio
     @respx.mock
     async def test_delegate_discovery_fails(self):
         respx.get("http://unreachable:9000/.well-known/agent.json").mock(
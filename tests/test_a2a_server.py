@@ -456,7 +456,6 @@ class TestAgentsList:
 class TestA2AEndpoints:
     """Test the FastAPI endpoints via ASGI transport."""
 
-    @pytest.mark.asyncio
     async def test_agent_card_endpoint(self):
         app = create_a2a_app(base_url="https://test.example.com")
         async with httpx.AsyncClient(
@@ -469,7 +468,6 @@ class TestA2AEndpoints:
         assert card["name"] == "HireWire"
         assert card["url"] == "https://test.example.com"
 
-    @pytest.mark.asyncio
     async def test_health_endpoint(self):
         app = create_a2a_app()
         async with httpx.AsyncClient(
@@ -483,7 +481,6 @@ class TestA2AEndpoints:
         assert data["protocol"] == "a2a"
         assert data["agents_available"] >= 2
 
-    @pytest.mark.asyncio
     async def test_jsonrpc_tasks_send(self):
         app = create_a2a_app()
         async with httpx.AsyncClient(
@@ -505,7 +502,6 @@ class TestA2AEndpoints:
         assert data["result"]["status"] == "completed"
         assert data["id"] == 100
 
-    @pytest.mark.asyncio
     async def test_jsonrpc_invalid_json(self):
         app = create_a2a_app()
         async with httpx.AsyncClient(
@@ -522,7 +518,6 @@ class TestA2AEndpoints:
         assert "error" in data
         assert data["error"]["code"] == PARSE_ERROR
 
-    @pytest.mark.asyncio
     async def test_jsonrpc_batch_request(self):
         app = create_a2a_app()
         async with httpx.AsyncClient(
@@ -550,7 +545,6 @@ class TestA2AEndpoints:
         assert data[0]["id"] == 1
         assert data[1]["id"] == 2
 
-    @pytest.mark.asyncio
     async def test_jsonrpc_empty_batch(self):
         app = create_a2a_app()
         async with httpx.AsyncClient(
@@ -85,14 +85,12 @@ async def designer_server():
 class TestMockExternalAgent:
     """Test that the mock external designer agent works correctly."""
 
-    @pytest.mark.asyncio
     async def test_health_endpoint(self, designer_server):
         async with httpx.AsyncClient() as client:
             resp = await client.get(f"http://127.0.0.1:{DESIGNER_PORT}/health")
         assert resp.status_code == 200
         assert resp.json()["status"] == "ok"
 
-    @pytest.mark.asyncio
     async def test_agent_card_endpoint(self, designer_server):
         async with httpx.AsyncClient() as client:
             resp = await client.get(f"http://127.0.0.1:{DESIGNER_PORT}/agent-card")
@@ -102,7 +100,6 @@ class TestMockExternalAgent:
         assert "design" in card["skills"]
         assert card["pricing"]["amount_usdc"] == 0.05
 
-    @pytest.mark.asyncio
     async def test_task_submission(self, designer_server):
         payload = {
             "task_id": "test-001",
@@ -122,7 +119,6 @@ class TestMockExternalAgent:
         assert result["price_usdc"] == 0.05
         assert "Design Deliverable" in result["deliverable"]
 
-    @pytest.mark.asyncio
     async def test_landing_page_deliverable(self, designer_server):
         payload = {
             "task_id": "test-lp",
@@ -136,7 +132,6 @@ class TestMockExternalAgent:
         assert "Landing Page" in result["deliverable"]
         assert "Color Palette" in result["deliverable"]
 
-    @pytest.mark.asyncio
     async def test_processed_tasks_tracked(self, designer_server):
         payload = {"task_id": "track-001", "description": "Generic design task"}
         async with httpx.AsyncClient() as client:
@@ -212,7 +207,6 @@ class TestAgentEvaluation:
 class TestHiringWorkflow:
     """Test the full hiring workflow end-to-end."""
 
-    @pytest.mark.asyncio
     async def test_hiring_completes(self, designer_server):
         # Update endpoint to match test server port
         agent = registry.get("designer-ext-001")
@@ -232,7 +226,6 @@ class TestHiringWorkflow:
         finally:
             agent.endpoint = original_endpoint
 
-    @pytest.mark.asyncio
     async def test_budget_deducted_after_hiring(self, designer_server):
         agent = registry.get("designer-ext-001")
         original_endpoint = agent.endpoint
@@ -251,7 +244,6 @@ class TestHiringWorkflow:
         finally:
             agent.endpoint = original_endpoint
 
-    @pytest.mark.asyncio
     async def test_hiring_no_agents_found(self):
         result = await run_hiring_workflow(
             task_id="no-agent-001",
@@ -264,7 +256,6 @@ class TestHiringWorkflow:
         assert result.external_result is None
         assert result.payment is None
 
-    @pytest.mark.asyncio
     async def test_hiring_records_payment(self, designer_server):
         agent = registry.get("designer-ext-001")
         original_endpoint = agent.endpoint
@@ -288,7 +279,6 @@ class TestHiringWorkflow:
         finally:
             agent.endpoint = original_endpoint
 
-    @pytest.mark.asyncio
     async def test_hiring_discovery_returns_agents(self, designer_server):
         agent = registry.get("designer-ext-001")
         original_endpoint = agent.endpoint
@@ -311,7 +301,6 @@ class TestHiringWorkflow:
 # ---------------------------------------------------------------------------
 
 class TestAgentHiringDemoScenario:
-    @pytest.mark.asyncio
     async def test_demo_scenario_completes(self, designer_server):
         """Run the full demo scenario end-to-end.
 
@@ -57,7 +57,6 @@ class TestAgentCreation:
         assert len(BUILDER_INSTRUCTIONS) > 100
         assert len(RESEARCH_INSTRUCTIONS) > 100
 
-    @pytest.mark.asyncio
     async def test_mock_client_works(self, mock_client):
         """Verify mock client returns a response."""
         response = await mock_client.get_response("Hello, world!")
@@ -52,34 +52,28 @@ def _clean_running_tasks():
 # ---------------------------------------------------------------------------
 
 class TestSubmitTask:
-    @pytest.mark.asyncio
     async def test_submit_returns_201(self, client):
         resp = await client.post("/tasks", json={"description": "build a CLI tool", "budget": 2.0})
         assert resp.status_code == 201
 
-    @pytest.mark.asyncio
     async def test_submit_returns_task_id(self, client):
         resp = await client.post("/tasks", json={"description": "build a CLI tool"})
         data = resp.json()
         assert "task_id" in data
         assert data["task_id"].startswith("task_")
 
-    @pytest.mark.asyncio
     async def test_submit_default_budget(self, client):
         resp = await client.post("/tasks", json={"description": "test"})
         assert resp.json()["budget_usd"] == 1.0
 
-    @pytest.mark.asyncio
     async def test_submit_custom_budget(self, client):
         resp = await client.post("/tasks", json={"description": "test", "budget": 5.5})
         assert resp.json()["budget_usd"] == 5.5
 
-    @pytest.mark.asyncio
     async def test_submit_status_is_pending(self, client):
         resp = await client.post("/tasks", json={"description": "hello"})
         assert resp.json()["status"] == "pending"
 
-    @pytest.mark.asyncio
     async def test_submit_has_created_at(self, client):
         before = time.time()
         resp = await client.post("/tasks", json={"description": "hello"})
@@ -87,7 +81,6 @@ class TestSubmitTask:
         ts = resp.json()["created_at"]
         assert before <= ts <= after
 
-    @pytest.mark.asyncio
     async def test_submit_persists_to_storage(self, client):
         resp = await client.post("/tasks", json={"description": "persist me"})
         task_id = resp.json()["task_id"]
@@ -95,27 +88,22 @@ class TestSubmitTask:
         assert stored is not None
         assert stored["description"] == "persist me"
 
-    @pytest.mark.asyncio
     async def test_submit_empty_description_rejected(self, client):
         resp = await client.post("/tasks", json={"description": "", "budget": 1.0})
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_submit_missing_description_rejected(self, client):
         resp = await client.post("/tasks", json={"budget": 1.0})
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_submit_zero_budget_rejected(self, client):
         resp = await client.post("/tasks", json={"description": "test", "budget": 0})
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_submit_negative_budget_rejected(self, client):
         resp = await client.post("/tasks", json={"description": "test", "budget": -5})
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_submit_excessive_budget_rejected(self, client):
         resp = await client.post("/tasks", json={"description": "test", "budget": 5000})
         assert resp.status_code == 422
@@ -126,7 +114,6 @@ class TestSubmitTask:
 # ---------------------------------------------------------------------------
 
 class TestGetTask:
-    @pytest.mark.asyncio
     async def test_get_existing_task(self, client):
         create = await client.post("/tasks", json={"description": "find me"})
         task_id = create.json()["task_id"]
@@ -134,19 +121,16 @@ class TestGetTask:
         assert resp.status_code == 200
         assert resp.json()["task_id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_get_missing_task_404(self, client):
         resp = await client.get("/tasks/nonexistent_id")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_get_task_has_description(self, client):
         create = await client.post("/tasks", json={"description": "describe me"})
         task_id = create.json()["task_id"]
         resp = await client.get(f"/tasks/{task_id}")
         assert resp.json()["description"] == "describe me"
 
-    @pytest.mark.asyncio
     async def test_get_completed_task_has_result(self, client):
         """Submit and wait briefly so the background task completes."""
         create = await client.post("/tasks", json={"description": "build a landing page"})
@@ -163,13 +147,11 @@ class TestGetTask:
 # ---------------------------------------------------------------------------
 
 class TestTransactions:
-    @pytest.mark.asyncio
     async def test_empty_transactions(self, client):
         resp = await client.get("/transactions")
         assert resp.status_code == 200
         assert resp.json() == []
 
-    @pytest.mark.asyncio
     async def test_transactions_after_demo(self, client):
         """The /demo endpoint creates transactions."""
         await client.get("/demo")
@@ -178,7 +160,6 @@ class TestTransactions:
         txs = resp.json()
         assert len(txs) >= 1
 
-    @pytest.mark.asyncio
     async def test_transaction_structure(self, client):
         await client.get("/demo")
         resp = await client.get("/transactions")
@@ -192,32 +173,27 @@ class TestTransactions:
 # ---------------------------------------------------------------------------
 
 class TestListAgents:
-    @pytest.mark.asyncio
     async def test_agents_returns_list(self, client):
         resp = await client.get("/agents")
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    @pytest.mark.asyncio
     async def test_agents_has_builder(self, client):
         resp = await client.get("/agents")
         names = [a["name"] for a in resp.json()]
         assert "builder" in names
 
-    @pytest.mark.asyncio
     async def test_agents_has_research(self, client):
         resp = await client.get("/agents")
         names = [a["name"] for a in resp.json()]
         assert "research" in names
 
-    @pytest.mark.asyncio
     async def test_agents_structure(self, client):
         resp = await client.get("/agents")
         agent = resp.json()[0]
         for key in ("name", "description", "skills", "price_per_call", "protocol", "payment"):
             assert key in agent
 
-    @pytest.mark.asyncio
     async def test_agents_count_at_least_two(self, client):
         resp = await client.get("/agents")
         assert len(resp.json()) >= 2
@@ -228,22 +204,18 @@ class TestListAgents:
 # ---------------------------------------------------------------------------
 
 class TestHealth:
-    @pytest.mark.asyncio
     async def test_health_returns_200(self, client):
         resp = await client.get("/health")
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_health_status_healthy(self, client):
         resp = await client.get("/health")
         assert resp.json()["status"] == "healthy"
 
-    @pytest.mark.asyncio
     async def test_health_uptime_positive(self, client):
         resp = await client.get("/health")
         assert resp.json()["uptime_seconds"] >= 0
 
-    @pytest.mark.asyncio
     async def test_health_counts_tasks(self, client):
         resp = await client.get("/health")
         data = resp.json()
@@ -253,37 +225,66 @@ class TestHealth:
         assert "agents_count" in data
         assert "total_spent_usdc" in data
 
-    @pytest.mark.asyncio
     async def test_health_task_count_increases(self, client):
         h1 = (await client.get("/health")).json()
         await client.post("/tasks", json={"description": "bump the count"})
         h2 = (await client.get("/health")).json()
         assert h2["tasks_total"] >= h1["tasks_total"] + 1
 
-    @pytest.mark.asyncio
     async def test_health_agents_count_matches_registry(self, client):
         resp = await client.get("/health")
         assert resp.json()["agents_count"] == len(registry.list_all())
 
 
+class TestSmoke:
+    async def test_smoke_bundles_read_only_checks(self, client):
+        resp = await client.get("/__smoke")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["health"]["status"] == "healthy"
+        assert data["health_azure"]["status"] in ("healthy", "degraded")
+        assert data["agents_count"] == len(registry.list_all())
+        assert data["tasks_count"] == data["health"]["tasks_total"]
+        assert data["transactions_count"] == 0
+        assert data["metrics_present"] is True
+
+    async def test_smoke_counts_transactions(self, client):
+        ledger.allocate_budget("smoke_task", 1.0)
+        ledger.record_payment("ceo", "builder", 0.1, "smoke_task")
+        resp = await client.get("/__smoke")
+        assert resp.json()["transactions_count"] == 1
+
+    async def test_smoke_reports_broken_metrics(self, client, monkeypatch):
+        import src.api.main as main_mod
+
+        def _broken():
+            raise RuntimeError("metrics store unavailable")
+
+        monkeypatch.setattr(main_mod, "get_metrics_collector", _broken)
+        resp = await client.get("/__smoke")
+        assert resp.status_code == 200
+        assert resp.json()["metrics_present"] is False
+
+    async def test_smoke_hidden_from_openapi(self, client):
+        resp = await client.get("/openapi.json")
+        assert "/__smoke" not in resp.json()["paths"]
+
+
 # ---------------------------------------------------------------------------
 # GET /demo — Demo scenario
 # ---------------------------------------------------------------------------
 
 class TestDemo:
-    @pytest.mark.asyncio
     async def test_demo_returns_200(self, client):
         resp = await client.get("/demo")
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_demo_has_analysis(self, client):
         resp = await client.get("/demo")
         data = resp.json()
         assert "analysis" in data
         assert "subtasks" in data["analysis"]
 
-    @pytest.mark.asyncio
     async def test_demo_creates_task(self, client):
         resp = await client.get("/demo")
         data = resp.json()
@@ -291,19 +292,16 @@ class TestDemo:
         assert task["task_id"].startswith("demo_")
         assert task["status"] == "completed"
 
-    @pytest.mark.asyncio
     async def test_demo_creates_transactions(self, client):
         resp = await client.get("/demo")
         data = resp.json()
         assert data["transactions_after"] > data["transactions_before"]
 
-    @pytest.mark.asyncio
     async def test_demo_shows_agents_available(self, client):
         resp = await client.get("/demo")
         data = resp.json()
         assert data["agents_available"] >= 2
 
-    @pytest.mark.asyncio
     async def test_demo_task_description(self, client):
         resp = await client.get("/demo")
         data = resp.json()
@@ -315,7 +313,6 @@ class TestDemo:
 # ---------------------------------------------------------------------------
 
 class TestCORS:
-    @pytest.mark.asyncio
     async def test_cors_origin_header(self, client):
         resp = await client.options(
             "/health",
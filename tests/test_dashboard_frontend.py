@@ -22,18 +22,15 @@ def client():
 
 
 class TestDashboardServing:
-    @pytest.mark.asyncio
     async def test_root_serves_html(self, client):
         resp = await client.get("/")
         assert resp.status_code == 200
         assert "text/html" in resp.headers["content-type"]
 
-    @pytest.mark.asyncio
     async def test_root_contains_hirewire(self, client):
         resp = await client.get("/")
         assert "HireWire" in resp.text
 
-    @pytest.mark.asyncio
     async def test_root_contains_dashboard_panels(self, client):
         resp = await client.get("/")
         assert "Activity Feed" in resp.text
@@ -41,19 +38,16 @@ class TestDashboardServing:
         assert "Payment Log" in resp.text
         assert "Submit Task" in resp.text
 
-    @pytest.mark.asyncio
     async def test_root_contains_submit_form(self, client):
         resp = await client.get("/")
         assert "inline-task-input" in resp.text
         assert "submit-btn" in resp.text
 
-    @pytest.mark.asyncio
     async def test_dashboard_static_mount(self, client):
         resp = await client.get("/dashboard/index.html")
         assert resp.status_code == 200
         assert "HireWire" in resp.text
 
-    @pytest.mark.asyncio
     async def test_root_has_auto_refresh(self, client):
         resp = await client.get("/")
         assert "setInterval" in resp.text
@@ -61,13 +55,11 @@ class TestDashboardServing:
 
 
 class TestListTasksEndpoint:
-    @pytest.mark.asyncio
     async def test_list_tasks_returns_list(self, client):
         resp = await client.get("/tasks")
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    @pytest.mark.asyncio
     async def test_list_tasks_returns_valid_items(self, client):
         resp = await client.get("/tasks")
         data = resp.json()
@@ -77,7 +69,6 @@ class TestListTasksEndpoint:
             assert "description" in item
             assert "status" in item
 
-    @pytest.mark.asyncio
     async def test_list_tasks_includes_submitted(self, client):
         before = await client.get("/tasks")
         count_before = len(before.json())
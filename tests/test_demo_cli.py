@@ -18,6 +18,7 @@ from demo.cli import (
     select_best_agent,
     simulate_task_execution,
     simulate_payment,
+    reset_id_counters,
     run_demo_workflow,
     build_parser,
 )
@@ -67,6 +68,19 @@ class TestDiscoverAgents:
         assert len(agents) == 1
         assert agents[0].name == "TestAgent"
 
+    def test_reassigned_skills_are_matched(self):
+        agent = MockExternalAgent(
+            name="TestAgent",
+            description="Test",
+            skills=["testing"],
+            price_per_call=0.01,
+            rating=5.0,
+            tasks_completed=100,
+        )
+        agent.skills = ["Deployment"]
+        assert discover_agents([agent], ["testing"]) == []
+        assert discover_agents([agent], ["deployment"]) == [agent]
+
 
 # ---------------------------------------------------------------------------
 # Evaluation
@@ -193,6 +207,30 @@ class TestSimulatePayment:
         assert p1["tx_id"] != p2["tx_id"]
 
 
+class TestDeterministicIds:
+    @pytest.fixture(autouse=True)
+    def _deterministic(self, monkeypatch):
+        monkeypatch.setenv("AGENTOS_DEMO_DETERMINISTIC", "1")
+        reset_id_counters()
+        yield
+        reset_id_counters()
+
+    def test_ids_are_sequential(self):
+        t1 = simulate_task_execution("A", "x")
+        p1 = simulate_payment("CEO", "A", 0.1, t1["task_id"])
+        p2 = simulate_payment("CEO", "B", 0.2, "t2")
+        assert t1["task_id"] == "task-00000001"
+        assert p1["tx_id"] == "tx_000000000001"
+        assert p2["tx_id"] == "tx_000000000002"
+
+    def test_workflow_is_reproducible(self):
+        first = run_demo_workflow(DemoConfig(fast=True))
+        reset_id_counters()
+        second = run_demo_workflow(DemoConfig(fast=True))
+        assert first.steps[-1].details["tx_id"] == second.steps[-1].details["tx_id"]
+        assert first.steps[-2].details["task_id"] == second.steps[-2].details["task_id"]
+
+
 # ---------------------------------------------------------------------------
 # Full workflow
 # ---------------------------------------------------------------------------
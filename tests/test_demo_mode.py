@@ -12,7 +12,6 @@ Covers:
 from __future__ import annotations
 
 import asyncio
-import os
 import time
 
 import pytest
@@ -43,51 +42,32 @@ def client():
     return httpx.AsyncClient(transport=transport, base_url="http://test")
 
 
-@pytest.fixture(autouse=True)
-def _clean_ledger():
-    """Reset ledger between tests."""
-    ledger.clear()
-    yield
-    ledger.clear()
+# Registry contents before any test in this module has seeded demo agents.
+_REGISTRY_BASELINE = registry.snapshot()
 
 
-@pytest.fixture(autouse=True)
-def _clean_demo_runner():
-    """Stop and reset demo runner between tests."""
-    _demo_runner._running = False
-    _demo_runner._task = None
-    _demo_runner._tasks_submitted = 0
-    _demo_runner._task_index = 0
-    yield
+def _reset_all_demo_state() -> None:
+    """Reset ledger, demo runner, background tasks, registry and storage."""
+    ledger.clear()
     _demo_runner._running = False
     if _demo_runner._task is not None and not _demo_runner._task.done():
         _demo_runner._task.cancel()
     _demo_runner._task = None
-
-
-@pytest.fixture(autouse=True)
-def _clean_running_tasks():
-    """Cancel stray background tasks."""
-    _running_tasks.clear()
-    yield
+    _demo_runner._tasks_submitted = 0
+    _demo_runner._task_index = 0
     for t in list(_running_tasks.values()):
         t.cancel()
     _running_tasks.clear()
-
-
-@pytest.fixture(autouse=True)
-def _clean_storage():
-    """Clear all storage before each test to prevent cross-contamination."""
+    registry.restore(_REGISTRY_BASELINE)
     get_storage().clear_all()
-    yield
 
 
 @pytest.fixture(autouse=True)
-def _clean_demo_agents():
-    """Remove demo agents after each test so they don't leak."""
+def _reset():
+    """Reset all demo-mode global state around each test."""
+    _reset_all_demo_state()
     yield
-    for a in DEMO_AGENTS:
-        registry.unregister(a["name"])
+    _reset_all_demo_state()
 
 
 # ---------------------------------------------------------------------------
@@ -191,7 +171,6 @@ class TestDemoRunner:
         runner = DemoRunner()
         assert runner.is_running is False
 
-    @pytest.mark.asyncio
     async def test_runner_start_stop(self):
         runner = DemoRunner(interval=0.05)
         runner.start()
@@ -200,7 +179,6 @@ class TestDemoRunner:
         runner.stop()
         assert runner.is_running is False
 
-    @pytest.mark.asyncio
     async def test_runner_submits_tasks(self):
         runner = DemoRunner(interval=0.05)
         runner.start()
@@ -208,7 +186,6 @@ class TestDemoRunner:
         runner.stop()
         assert runner._tasks_submitted >= 1
 
-    @pytest.mark.asyncio
     async def test_runner_creates_db_tasks(self):
         storage = get_storage()
         before = len(storage.list_tasks())
@@ -226,7 +203,6 @@ class TestDemoRunner:
         assert "tasks_submitted" in status
         assert "interval_seconds" in status
 
-    @pytest.mark.asyncio
     async def test_runner_stop_idempotent(self):
         runner = DemoRunner()
         runner.stop()
@@ -243,7 +219,6 @@ class TestDemoRunner:
 
 
 class TestDemoEndpoints:
-    @pytest.mark.asyncio
     async def test_seed_endpoint_returns_200(self, client):
         resp = await client.get("/demo/seed")
         assert resp.status_code == 200
@@ -251,7 +226,6 @@ class TestDemoEndpoints:
         assert data["status"] == "seeded"
         assert data["tasks_created"] > 0
 
-    @pytest.mark.asyncio
     async def test_start_endpoint(self, client):
         resp = await client.get("/demo/start")
         assert resp.status_code == 200
@@ -261,7 +235,6 @@ class TestDemoEndpoints:
         # Clean up
         _demo_runner.stop()
 
-    @pytest.mark.asyncio
     async def test_start_already_running(self, client):
         await client.get("/demo/start")
         resp = await client.get("/demo/start")
@@ -269,7 +242,6 @@ class TestDemoEndpoints:
         assert data["status"] == "already_running"
         _demo_runner.stop()
 
-    @pytest.mark.asyncio
     async def test_stop_endpoint(self, client):
         await client.get("/demo/start")
         resp = await client.get("/demo/stop")
@@ -278,14 +250,12 @@ class TestDemoEndpoints:
         assert data["status"] == "stopped"
         assert data["was_running"] is True
 
-    @pytest.mark.asyncio
     async def test_stop_when_not_running(self, client):
         resp = await client.get("/demo/stop")
         data = resp.json()
         assert data["status"] == "stopped"
         assert data["was_running"] is False
 
-    @pytest.mark.asyncio
     async def test_status_endpoint(self, client):
         resp = await client.get("/demo/status")
         assert resp.status_code == 200
@@ -293,7 +263,6 @@ class TestDemoEndpoints:
         assert "running" in data
         assert "tasks_submitted" in data
 
-    @pytest.mark.asyncio
     async def test_seed_populates_dashboard_data(self, client):
         """After seeding, /health should show tasks and agents."""
         await client.get("/demo/seed")
@@ -309,14 +278,12 @@ class TestDemoEndpoints:
 
 
 class TestActivityAndStats:
-    @pytest.mark.asyncio
     async def test_activity_endpoint_empty(self, client):
         resp = await client.get("/activity")
         assert resp.status_code == 200
         data = resp.json()
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
     async def test_activity_endpoint_after_seed(self, client):
         await client.get("/demo/seed")
         resp = await client.get("/activity")
@@ -330,7 +297,6 @@ class TestActivityAndStats:
             assert "text" in item
             assert "time" in item
 
-    @pytest.mark.asyncio
     async def test_stats_endpoint(self, client):
         await client.get("/demo/seed")
         resp = await client.get("/stats")
@@ -343,7 +309,6 @@ class TestActivityAndStats:
         assert "completion_rate" in data
         assert data["total_tasks"] > 0
 
-    @pytest.mark.asyncio
     async def test_health_includes_gpt4o(self, client):
         """Health endpoint includes gpt4o_available field."""
         resp = await client.get("/health")
@@ -359,7 +324,6 @@ class TestActivityAndStats:
 
 
 class TestAutoSeed:
-    @pytest.mark.asyncio
     async def test_startup_with_demo_env(self, client, monkeypatch):
         """With HIREWIRE_DEMO=1, startup should seed data."""
         monkeypatch.setenv("HIREWIRE_DEMO", "1")
@@ -370,7 +334,6 @@ class TestAutoSeed:
         tasks = storage.list_tasks()
         assert len(tasks) >= len(DEMO_SCENARIOS)
 
-    @pytest.mark.asyncio
     async def test_startup_without_demo_env(self, client, monkeypatch):
         """Without HIREWIRE_DEMO=1, startup should not seed."""
         monkeypatch.delenv("HIREWIRE_DEMO", raising=False)
@@ -7,24 +7,41 @@ client and that the CLI argument parser works correctly.
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 from src.mcp_servers.payment_hub import ledger
 
 
-@pytest.fixture(autouse=True)
-def _reset_ledger():
-    """Clear ledger state so budget allocations don't collide across tests."""
+def _clear_ledger() -> None:
     ledger._transactions.clear()
     ledger._budgets.clear()
     ledger._tx_counter = 0
+
+
+@pytest.fixture(autouse=True)
+def _reset_ledger():
+    """Clear ledger state so budget allocations don't collide across tests."""
+    _clear_ledger()
     yield
-    ledger._transactions.clear()
-    ledger._budgets.clear()
-    ledger._tx_counter = 0
+    _clear_ledger()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def showcase_result():
+    """Run the showcase scenario once and share its result across checks.
+
+    Module-scoped fixtures are set up before the function-scoped ledger
+    reset, so the ledger is cleared here explicitly before the run.
+    """
+    from demo.scenario_showcase import run_showcase_scenario
+
+    _clear_ledger()
+    result = await run_showcase_scenario()
+    _clear_ledger()
+    return result
 
 
 class TestLandingPageScenario:
-    @pytest.mark.asyncio
     async def test_landing_page_completes(self):
         from demo.scenario_landing_page import run_landing_page_scenario
 
@@ -38,7 +55,6 @@ class TestLandingPageScenario:
 
 
 class TestParallelResearchScenario:
-    @pytest.mark.asyncio
     async def test_parallel_research_completes(self):
         from demo.scenario_parallel_research import run_parallel_research_scenario
 
@@ -52,11 +68,8 @@ class TestParallelResearchScenario:
 
 
 class TestShowcaseScenario:
-    @pytest.mark.asyncio
-    async def test_showcase_completes(self):
-        from demo.scenario_showcase import run_showcase_scenario
-
-        result = await run_showcase_scenario()
+    def test_showcase_completes(self, showcase_result):
+        result = showcase_result
 
         assert result["workflow"] == "showcase"
         assert result["status"] == "completed"
@@ -64,42 +77,28 @@ class TestShowcaseScenario:
         assert result["budget"]["allocated"] == 10.0
         assert len(result["stages"]) == 8
 
-    @pytest.mark.asyncio
-    async def test_showcase_stages_have_required_fields(self):
-        from demo.scenario_showcase import run_showcase_scenario
-
-        result = await run_showcase_scenario()
-
-        for stage in result["stages"]:
+    def test_showcase_stages_have_required_fields(self, showcase_result):
+        for stage in showcase_result["stages"]:
             assert "stage" in stage
             assert "name" in stage
             assert "duration_ms" in stage
             assert stage["duration_ms"] >= 0
 
-    @pytest.mark.asyncio
-    async def test_showcase_includes_foundry(self):
-        from demo.scenario_showcase import run_showcase_scenario
-
-        result = await run_showcase_scenario()
-
-        foundry_stage = [s for s in result["stages"] if s["name"] == "Foundry Agent Service"]
+    def test_showcase_includes_foundry(self, showcase_result):
+        foundry_stage = [
+            s for s in showcase_result["stages"] if s["name"] == "Foundry Agent Service"
+        ]
         assert len(foundry_stage) == 1
         assert foundry_stage[0]["foundry_agents"] == 4
 
-    @pytest.mark.asyncio
-    async def test_showcase_includes_x402(self):
-        from demo.scenario_showcase import run_showcase_scenario
-
-        result = await run_showcase_scenario()
-
-        hiring_stage = [s for s in result["stages"] if "x402" in s["name"]]
+    def test_showcase_includes_x402(self, showcase_result):
+        hiring_stage = [s for s in showcase_result["stages"] if "x402" in s["name"]]
         assert len(hiring_stage) == 1
         # In mock mode without external server, hiring may fail — that's OK
         assert hiring_stage[0]["status"] in ("completed", "failed")
 
 
 class TestRecordDemo:
-    @pytest.mark.asyncio
     async def test_recorded_demo_completes(self):
         from demo.record_demo import run_recorded_demo
 
@@ -110,7 +109,6 @@ class TestRecordDemo:
         assert result["stage_1"]["count"] == 4
         assert result["stage_8"]["total_elapsed_s"] >= 0
 
-    @pytest.mark.asyncio
     async def test_recorded_demo_has_all_stages(self):
         from demo.record_demo import run_recorded_demo
 
@@ -12,50 +12,64 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-from src.api.server import _tasks, _background_tasks, app
+from src.api import server
+from src.api.server import app
 
 
-@pytest.fixture(autouse=True)
-def _clear_task_store():
-    """Reset in-memory stores between tests."""
-    _tasks.clear()
-    _background_tasks.clear()
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def _clear_task_store(monkeypatch):
+    """Give each test fresh in-memory stores, and stop its leftover runs.
+
+    The loop is shared by the whole module, so a background run a test did
+    not wait for would otherwise keep going, and write to storage, during
+    later tests. Cancelling it here lets its ``finally`` persist the record
+    before conftest resets storage.
+    """
+    monkeypatch.setattr(server, "_tasks", {})
+    monkeypatch.setattr(server, "_background_tasks", {})
     yield
-    _tasks.clear()
-    _background_tasks.clear()
+    pending = list(server._background_tasks.values())
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client():
+    """One ASGI client for the module; ``_clear_task_store`` keeps tests isolated."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
-async def _submit_and_wait(client: AsyncClient, payload: dict, timeout: float = 5.0) -> dict:
-    """Submit a task and poll until it reaches a terminal state."""
-    resp = await client.post("/tasks", json=payload)
+async def _wait_for_completion(client: AsyncClient, task_id: str, timeout: float = 5.0) -> dict:
+    """Wait for a task's background run to finish and return its final state.
+
+    The run removes itself from ``_background_tasks`` as its last step, so a
+    missing entry means it has already finished.
+    """
+    bg = server._background_tasks.get(task_id)
+    if bg is not None:
+        done, _ = await asyncio.wait({bg}, timeout=timeout)
+        if not done:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+    resp = await client.get(f"/tasks/{task_id}")
     assert resp.status_code == 200
-    data = resp.json()
-    task_id = data["task_id"]
+    return resp.json()
 
-    # Wait for background task to finish
-    deadline = asyncio.get_event_loop().time() + timeout
-    while asyncio.get_event_loop().time() < deadline:
-        resp = await client.get(f"/tasks/{task_id}")
-        assert resp.status_code == 200
-        status = resp.json()["status"]
-        if status in ("completed", "failed"):
-            return resp.json()
-        await asyncio.sleep(0.05)
 
-    raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+async def _submit_and_wait(client: AsyncClient, payload: dict, timeout: float = 5.0) -> dict:
+    """Submit a task and wait until it reaches a terminal state."""
+    resp = await client.post("/tasks", json=payload)
+    assert resp.status_code == 200
+    return await _wait_for_completion(client, resp.json()["task_id"], timeout)
 
 
+@pytest.mark.xdist_group(name="asgi")
 class TestTaskExecution:
     """Test that submitted tasks actually run through workflows."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sequential_task_completes(self, client):
         result = await _submit_and_wait(client, {
             "description": "Build a hello world app",
@@ -66,7 +80,7 @@ class TestTaskExecution:
         assert result["result"] is not None
         assert result["result"]["workflow"] == "sequential"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_concurrent_task_completes(self, client):
         result = await _submit_and_wait(client, {
             "description": "Research and build in parallel",
@@ -77,7 +91,7 @@ class TestTaskExecution:
         assert result["result"] is not None
         assert result["result"]["workflow"] == "concurrent"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_group_chat_task_completes(self, client):
         result = await _submit_and_wait(client, {
             "description": "Collaborate on a complex feature",
@@ -88,7 +102,7 @@ class TestTaskExecution:
         assert result["result"] is not None
         assert result["result"]["workflow"] == "group_chat"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_task_returns_pending_immediately(self, client):
         """POST /tasks should return before the workflow finishes."""
         resp = await client.post("/tasks", json={
@@ -100,7 +114,7 @@ class TestTaskExecution:
         # Status should be pending or running (background task may start instantly)
         assert data["status"] in ("pending", "running")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_result_contains_output(self, client):
         result = await _submit_and_wait(client, {
             "description": "Analyze market data",
@@ -110,12 +124,12 @@ class TestTaskExecution:
         output = result["result"]["output"]
         assert "MockLLM" in output
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_task_not_found(self, client):
         resp = await client.get("/tasks/task_nonexistent")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_multiple_tasks_run_concurrently(self, client):
         """Submit several tasks and verify all complete."""
         tasks = []
@@ -129,18 +143,13 @@ class TestTaskExecution:
             tasks.append(resp.json()["task_id"])
 
         # Wait for all to complete
-        for task_id in tasks:
-            deadline = asyncio.get_event_loop().time() + 10.0
-            while asyncio.get_event_loop().time() < deadline:
-                resp = await client.get(f"/tasks/{task_id}")
-                if resp.json()["status"] == "completed":
-                    break
-                await asyncio.sleep(0.05)
-            else:
-                raise TimeoutError(f"Task {task_id} did not complete")
-            assert resp.json()["status"] == "completed"
-
-    @pytest.mark.asyncio
+        results = await asyncio.gather(
+            *(_wait_for_completion(client, task_id, timeout=10.0) for task_id in tasks)
+        )
+        for result in results:
+            assert result["status"] == "completed"
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_budget_allocated_for_task(self, client):
         resp = await client.post("/tasks", json={
             "description": "Budget test",
@@ -152,7 +161,7 @@ class TestTaskExecution:
         assert budget_resp.status_code == 200
         assert budget_resp.json()["allocated"] == 42.0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_tasks_shows_submitted(self, client):
         await client.post("/tasks", json={
             "description": "List test",
@@ -162,7 +171,7 @@ class TestTaskExecution:
         assert resp.status_code == 200
         assert resp.json()["total"] >= 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_default_workflow_is_sequential(self, client):
         resp = await client.post("/tasks", json={
             "description": "Default workflow test",
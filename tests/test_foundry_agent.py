@@ -5,6 +5,7 @@ All Foundry API calls are mocked so tests run without credentials.
 
 from __future__ import annotations
 
+import dataclasses
 import os
 from unittest.mock import MagicMock, patch
 
@@ -12,33 +13,96 @@ import pytest
 
 os.environ.setdefault("MODEL_PROVIDER", "mock")
 
+import src.framework.foundry_agent as foundry_mod
+from src.framework.foundry_agent import (
+    FoundryAgentConfig,
+    FoundryAgentInstance,
+    FoundryAgentProvider,
+    create_hirewire_foundry_agents,
+    foundry_available,
+    get_foundry_provider,
+)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def _foundry_env(monkeypatch):
-    """Set Foundry environment variables for tests."""
-    monkeypatch.setenv("AZURE_AI_PROJECT_ENDPOINT", "https://test.services.ai.azure.com/api/projects/test-project")
-    monkeypatch.setenv("AZURE_AI_MODEL_DEPLOYMENT", "gpt-4o")
-    # Reset singleton
-    import src.framework.foundry_agent as mod
-    mod._provider = None
+_TEST_ENDPOINT = "https://test.services.ai.azure.com/api/projects/test-project"
+
+
+@pytest.fixture(autouse=True)
+def _reset_foundry_singleton():
+    """Reset the provider singleton around every test."""
+    foundry_mod._provider = None
     yield
-    mod._provider = None
+    foundry_mod._provider = None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _foundry_env():
+    """Set Foundry environment variables once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AZURE_AI_PROJECT_ENDPOINT", _TEST_ENDPOINT)
+        mp.setenv("AZURE_AI_MODEL_DEPLOYMENT", "gpt-4o")
+        yield
+
+
+@pytest.fixture(scope="module")
+def foundry_configured(_foundry_env):
+    """foundry_available() under the module's Foundry env, checked once.
+
+    The env is fixed for the whole module, so tests that only need the
+    answer share this instead of re-reading ``os.environ``.
+    """
+    return foundry_available()
 
 
 @pytest.fixture()
 def _no_foundry_env(monkeypatch):
-    """Ensure no Foundry env vars are set."""
+    """Unset the module-wide Foundry env vars for a single test."""
     monkeypatch.delenv("AZURE_AI_PROJECT_ENDPOINT", raising=False)
     monkeypatch.delenv("AZURE_AI_MODEL_DEPLOYMENT", raising=False)
-    import src.framework.foundry_agent as mod
-    mod._provider = None
-    yield
-    mod._provider = None
+
+
+@pytest.fixture(scope="module")
+def provider_mod():
+    """One provider per module, configured the same way as ``_foundry_env``."""
+    return FoundryAgentProvider(project_endpoint=_TEST_ENDPOINT, model_deployment="gpt-4o")
+
+
+@pytest.fixture()
+def provider(provider_mod):
+    """The shared provider with its agent registry emptied for this test."""
+    provider_mod._agents.clear()
+    return provider_mod
+
+
+@pytest.fixture(scope="module")
+def hirewire():
+    """``(provider, agents)`` with the four HireWire agents, built once per module.
+
+    The provider is separate from ``provider_mod``; tests must treat it as
+    read-only.
+    """
+    p = FoundryAgentProvider(project_endpoint=_TEST_ENDPOINT, model_deployment="gpt-4o")
+    return p, create_hirewire_foundry_agents(p)
+
+
+@pytest.fixture()
+def cfg():
+    """Factory for agent configs that only spells out the fields a test cares about."""
+    base = FoundryAgentConfig(name="T", description="...", instructions="...")
+    return lambda **kw: dataclasses.replace(base, **kw)
+
+
+@pytest.fixture()
+def populated_provider(provider, cfg):
+    """The shared provider holding a Builder and a Research agent."""
+    provider.create_agent(cfg(name="Builder", description="Code generation"))
+    provider.create_agent(cfg(name="Research", description="Data analysis"))
+    return provider
 
 
 # ---------------------------------------------------------------------------
@@ -47,29 +111,19 @@ def _no_foundry_env(monkeypatch):
 
 
 class TestFoundryAgentConfig:
-    def test_config_defaults(self):
-        from src.framework.foundry_agent import FoundryAgentConfig
-
-        config = FoundryAgentConfig(
-            name="Test",
-            description="Test agent",
-            instructions="Do things",
-        )
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, {"model_deployment": "gpt-4o", "tools": [], "metadata": {}}),
+            ({"model_deployment": "gpt-35-turbo"}, {"model_deployment": "gpt-35-turbo"}),
+        ],
+        ids=["defaults", "custom-model"],
+    )
+    def test_config(self, kwargs, expected):
+        config = FoundryAgentConfig(name="Test", description="Test agent", instructions="...", **kwargs)
         assert config.name == "Test"
-        assert config.model_deployment == "gpt-4o"
-        assert config.tools == []
-        assert config.metadata == {}
-
-    def test_config_custom_model(self):
-        from src.framework.foundry_agent import FoundryAgentConfig
-
-        config = FoundryAgentConfig(
-            name="Custom",
-            description="Custom model",
-            instructions="...",
-            model_deployment="gpt-35-turbo",
-        )
-        assert config.model_deployment == "gpt-35-turbo"
+        for field_name, value in expected.items():
+            assert getattr(config, field_name) == value
 
 
 # ---------------------------------------------------------------------------
@@ -79,8 +133,6 @@ class TestFoundryAgentConfig:
 
 class TestFoundryAgentInstance:
     def test_instance_defaults(self):
-        from src.framework.foundry_agent import FoundryAgentInstance
-
         inst = FoundryAgentInstance(
             agent_id="test_123",
             name="Builder",
@@ -92,31 +144,32 @@ class TestFoundryAgentInstance:
         assert inst.invoke_count == 0
         assert inst.thread_ids == []
 
-    def test_instance_agent_card(self):
-        from src.framework.foundry_agent import FoundryAgentInstance
-
+    @pytest.mark.parametrize(
+        "model,expected",
+        [
+            ("gpt-4o", {
+                "id": "agent_abc",
+                "name": "Research",
+                "model": "gpt-4o",
+                "provider": "azure_ai_foundry",
+            }),
+            ("gpt-35-turbo", {"model": "gpt-35-turbo"}),
+        ],
+        ids=["default-model", "custom-model"],
+    )
+    def test_instance_agent_card(self, model, expected):
         inst = FoundryAgentInstance(
             agent_id="agent_abc",
             name="Research",
             description="Research specialist",
-            model_deployment="gpt-4o",
+            model_deployment=model,
         )
         card = inst.agent_card
-        assert card["id"] == "agent_abc"
-        assert card["name"] == "Research"
-        assert card["provider"] == "azure_ai_foundry"
+        for key, value in expected.items():
+            assert card[key] == value
         assert card["capabilities"]["foundry_hosted"] is True
         assert card["capabilities"]["invoke"] is True
 
-    def test_instance_card_model(self):
-        from src.framework.foundry_agent import FoundryAgentInstance
-
-        inst = FoundryAgentInstance(
-            agent_id="x", name="Y", description="Z",
-            model_deployment="gpt-35-turbo",
-        )
-        assert inst.agent_card["model"] == "gpt-35-turbo"
-
 
 # ---------------------------------------------------------------------------
 # Tests — FoundryAgentProvider (without Foundry SDK)
@@ -126,16 +179,12 @@ class TestFoundryAgentInstance:
 class TestFoundryAgentProviderLocal:
     """Tests for the provider running in local/mock mode (no Foundry SDK)."""
 
-    def test_init_from_env(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
+    def test_init_from_env(self):
         provider = FoundryAgentProvider()
-        assert provider.project_endpoint == "https://test.services.ai.azure.com/api/projects/test-project"
+        assert provider.project_endpoint == _TEST_ENDPOINT
         assert provider.model_deployment == "gpt-4o"
 
     def test_init_explicit_args(self):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
         provider = FoundryAgentProvider(
             project_endpoint="https://custom.endpoint.com",
             model_deployment="gpt-35-turbo",
@@ -143,22 +192,14 @@ class TestFoundryAgentProviderLocal:
         assert provider.project_endpoint == "https://custom.endpoint.com"
         assert provider.model_deployment == "gpt-35-turbo"
 
-    def test_is_available_with_env(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
-        provider = FoundryAgentProvider()
-        assert provider.is_available is True
+    def test_is_available_with_env(self, provider, foundry_configured):
+        assert provider.is_available is foundry_configured is True
 
     def test_is_available_without_env(self, _no_foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
         provider = FoundryAgentProvider()
         assert provider.is_available is False
 
-    def test_create_agent(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
+    def test_create_agent(self, provider):
         config = FoundryAgentConfig(
             name="TestAgent",
             description="A test agent",
@@ -169,60 +210,30 @@ class TestFoundryAgentProviderLocal:
         assert inst.agent_id.startswith("foundry_")
         assert inst.status == "active"
 
-    def test_get_agent(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Getter", description="Get test", instructions="...",
-        ))
+    def test_get_agent(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Getter", description="Get test"))
         found = provider.get_agent(inst.agent_id)
         assert found is inst
 
-    def test_get_agent_not_found(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
-        provider = FoundryAgentProvider()
+    def test_get_agent_not_found(self, provider):
         assert provider.get_agent("nonexistent") is None
 
-    def test_list_agents(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="A", description="A", instructions="A"))
-        provider.create_agent(FoundryAgentConfig(name="B", description="B", instructions="B"))
-        assert len(provider.list_agents()) == 2
-
-    def test_list_agents_empty(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
+    def test_list_agents(self, populated_provider):
+        assert len(populated_provider.list_agents()) == 2
 
-        provider = FoundryAgentProvider()
+    def test_list_agents_empty(self, provider):
         assert provider.list_agents() == []
 
-    def test_delete_agent(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Deletable", description="...", instructions="...",
-        ))
+    def test_delete_agent(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Deletable"))
         assert provider.delete_agent(inst.agent_id) is True
         assert provider.get_agent(inst.agent_id) is None
 
-    def test_delete_agent_not_found(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
-        provider = FoundryAgentProvider()
+    def test_delete_agent_not_found(self, provider):
         assert provider.delete_agent("nonexistent") is False
 
-    @pytest.mark.asyncio
-    async def test_invoke_agent_local(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Invoker", description="Test invoke", instructions="Invoke things",
-        ))
+    async def test_invoke_agent_local(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Invoker", description="Test invoke", instructions="Invoke things"))
         result = await provider.invoke_agent(inst.agent_id, "Hello world")
         assert result["agent"] == "Invoker"
         assert result["status"] == "completed"
@@ -230,35 +241,19 @@ class TestFoundryAgentProviderLocal:
         assert result["elapsed_ms"] >= 0
         assert inst.invoke_count == 1
 
-    @pytest.mark.asyncio
-    async def test_invoke_agent_not_found(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
-        provider = FoundryAgentProvider()
+    async def test_invoke_agent_not_found(self, provider):
         result = await provider.invoke_agent("nonexistent", "task")
         assert result["status"] == "error"
         assert "not found" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_invoke_increments_count(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Counter", description="Count invokes", instructions="...",
-        ))
+    async def test_invoke_increments_count(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Counter", description="Count invokes"))
         await provider.invoke_agent(inst.agent_id, "task 1")
         await provider.invoke_agent(inst.agent_id, "task 2")
         assert inst.invoke_count == 2
 
-    @pytest.mark.asyncio
-    async def test_invoke_with_context(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Contextual", description="Uses context", instructions="...",
-        ))
+    async def test_invoke_with_context(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Contextual", description="Uses context"))
         result = await provider.invoke_agent(
             inst.agent_id, "task", context={"key": "value"}
         )
@@ -271,50 +266,26 @@ class TestFoundryAgentProviderLocal:
 
 
 class TestFoundryDiscovery:
-    def test_discover_all(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="Alpha", description="Alpha agent", instructions="..."))
-        provider.create_agent(FoundryAgentConfig(name="Beta", description="Beta agent", instructions="..."))
-        cards = provider.discover_agents()
-        assert len(cards) == 2
-
-    def test_discover_by_capability(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="Builder", description="Code generation", instructions="..."))
-        provider.create_agent(FoundryAgentConfig(name="Research", description="Data analysis", instructions="..."))
-        cards = provider.discover_agents("code")
-        assert len(cards) == 1
-        assert cards[0]["name"] == "Builder"
-
-    def test_discover_no_match(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="Alpha", description="Does alpha", instructions="..."))
-        cards = provider.discover_agents("nonexistent_capability")
-        assert len(cards) == 0
-
-    def test_discover_excludes_deleted(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        inst = provider.create_agent(FoundryAgentConfig(name="Old", description="Old agent", instructions="..."))
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            (None, {"Builder", "Research"}),
+            ("code", {"Builder"}),
+            ("CODE", {"Builder"}),
+            ("nonexistent_capability", set()),
+        ],
+        ids=["all", "by-capability", "case-insensitive", "no-match"],
+    )
+    def test_discover(self, populated_provider, query, expected):
+        cards = populated_provider.discover_agents(query)
+        assert {c["name"] for c in cards} == expected
+
+    def test_discover_excludes_deleted(self, provider, cfg):
+        inst = provider.create_agent(cfg(name="Old", description="Old agent"))
         provider.delete_agent(inst.agent_id)
         cards = provider.discover_agents()
         assert len(cards) == 0
 
-    def test_discover_case_insensitive(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="Builder", description="Code Generation", instructions="..."))
-        cards = provider.discover_agents("CODE")
-        assert len(cards) == 1
-
 
 # ---------------------------------------------------------------------------
 # Tests — Connectivity
@@ -323,26 +294,18 @@ class TestFoundryDiscovery:
 
 class TestFoundryConnectivity:
     def test_check_connection_not_configured(self, _no_foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
         provider = FoundryAgentProvider()
         result = provider.check_connection()
         assert result["connected"] is False
         assert "not configured" in result["error"]
 
-    def test_check_connection_no_sdk(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
-        provider = FoundryAgentProvider()
+    def test_check_connection_no_sdk(self, provider):
         # Client won't initialize without the SDK
         result = provider.check_connection()
         assert result["connected"] is False
 
-    def test_get_info(self, _foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        provider.create_agent(FoundryAgentConfig(name="Test", description="...", instructions="..."))
+    def test_get_info(self, provider, cfg):
+        provider.create_agent(cfg(name="Test"))
         info = provider.get_info()
         assert info["provider"] == "azure_ai_foundry"
         assert info["is_available"] is True
@@ -350,8 +313,6 @@ class TestFoundryConnectivity:
         assert len(info["agents"]) == 1
 
     def test_get_info_not_configured(self, _no_foundry_env):
-        from src.framework.foundry_agent import FoundryAgentProvider
-
         provider = FoundryAgentProvider()
         info = provider.get_info()
         assert info["is_available"] is False
@@ -364,27 +325,25 @@ class TestFoundryConnectivity:
 
 
 class TestModuleHelpers:
-    def test_foundry_available_true(self, _foundry_env):
-        from src.framework.foundry_agent import foundry_available
-        assert foundry_available() is True
+    def test_foundry_available_true(self, foundry_configured):
+        assert foundry_configured is True
 
     def test_foundry_available_false(self, _no_foundry_env):
-        from src.framework.foundry_agent import foundry_available
         assert foundry_available() is False
 
-    def test_get_foundry_provider_singleton(self, _foundry_env):
-        from src.framework.foundry_agent import get_foundry_provider
+    def test_foundry_available_follows_env(self, monkeypatch):
+        monkeypatch.delenv("AZURE_AI_PROJECT_ENDPOINT")
+        assert foundry_available() is False
+        monkeypatch.setenv("AZURE_AI_PROJECT_ENDPOINT", _TEST_ENDPOINT)
+        assert foundry_available() is True
+
+    def test_get_foundry_provider_singleton(self):
         p1 = get_foundry_provider()
         p2 = get_foundry_provider()
         assert p1 is p2
 
-    def test_create_hirewire_foundry_agents(self, _foundry_env):
-        from src.framework.foundry_agent import (
-            FoundryAgentProvider,
-            create_hirewire_foundry_agents,
-        )
-        provider = FoundryAgentProvider()
-        agents = create_hirewire_foundry_agents(provider)
+    def test_create_hirewire_foundry_agents(self, hirewire):
+        _, agents = hirewire
         assert len(agents) == 4
         assert "ceo" in agents
         assert "builder" in agents
@@ -424,18 +383,10 @@ class TestFrameworkExports:
 
 
 class TestMultiAgentFoundry:
-    @pytest.mark.asyncio
-    async def test_sequential_invocation(self, _foundry_env):
+    async def test_sequential_invocation(self, provider, cfg):
         """Invoke multiple agents sequentially."""
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-        ceo = provider.create_agent(FoundryAgentConfig(
-            name="CEO", description="Orchestrator", instructions="Orchestrate",
-        ))
-        builder = provider.create_agent(FoundryAgentConfig(
-            name="Builder", description="Code gen", instructions="Build code",
-        ))
+        ceo = provider.create_agent(cfg(name="CEO", description="Orchestrator", instructions="Orchestrate"))
+        builder = provider.create_agent(cfg(name="Builder", description="Code gen", instructions="Build code"))
 
         r1 = await provider.invoke_agent(ceo.agent_id, "Analyze this task")
         r2 = await provider.invoke_agent(builder.agent_id, "Build the feature")
@@ -445,17 +396,9 @@ class TestMultiAgentFoundry:
         assert r1["agent"] == "CEO"
         assert r2["agent"] == "Builder"
 
-    @pytest.mark.asyncio
-    async def test_discovery_after_creation(self, _foundry_env):
+    async def test_discovery_after_creation(self, hirewire):
         """Create agents then discover by capability."""
-        from src.framework.foundry_agent import (
-            FoundryAgentProvider,
-            FoundryAgentConfig,
-            create_hirewire_foundry_agents,
-        )
-
-        provider = FoundryAgentProvider()
-        create_hirewire_foundry_agents(provider)
+        provider, _ = hirewire
 
         # Discover code-related agents
         code_agents = provider.discover_agents("code")
@@ -469,17 +412,10 @@ class TestMultiAgentFoundry:
         analysis_agents = provider.discover_agents("pricing")
         assert any(a["name"] == "Analyst" for a in analysis_agents)
 
-    @pytest.mark.asyncio
-    async def test_create_invoke_delete_lifecycle(self, _foundry_env):
+    async def test_create_invoke_delete_lifecycle(self, provider, cfg):
         """Full lifecycle: create -> invoke -> delete."""
-        from src.framework.foundry_agent import FoundryAgentProvider, FoundryAgentConfig
-
-        provider = FoundryAgentProvider()
-
         # Create
-        inst = provider.create_agent(FoundryAgentConfig(
-            name="Lifecycle", description="Lifecycle test", instructions="...",
-        ))
+        inst = provider.create_agent(cfg(name="Lifecycle", description="Lifecycle test"))
         assert provider.get_agent(inst.agent_id) is not None
 
         # Invoke
@@ -240,7 +240,6 @@ class TestThreadManagement:
 
 
 class TestAgentInvocation:
-    @pytest.mark.asyncio
     async def test_invoke_basic(self):
         agent = _make_agent("Invoker")
         result = await agent.invoke("What is 2+2?")
@@ -249,14 +248,12 @@ class TestAgentInvocation:
         assert result["invoke_count"] == 1
         assert result["thread_id"].startswith("thread_")
 
-    @pytest.mark.asyncio
     async def test_invoke_increments_count(self):
         agent = _make_agent("Counter")
         await agent.invoke("task 1")
         await agent.invoke("task 2")
         assert agent.invoke_count == 2
 
-    @pytest.mark.asyncio
     async def test_invoke_with_thread(self):
         agent = _make_agent("Threaded")
         thread = agent.create_thread()
@@ -265,13 +262,11 @@ class TestAgentInvocation:
         # Should have user + assistant messages
         assert len(thread.messages) == 2
 
-    @pytest.mark.asyncio
     async def test_invoke_with_context(self):
         agent = _make_agent("Contextual")
         result = await agent.invoke("task", context={"key": "value"})
         assert result["agent"] == "Contextual"
 
-    @pytest.mark.asyncio
     async def test_invoke_elapsed_ms(self):
         agent = _make_agent("Timed")
         result = await agent.invoke("task")
@@ -284,7 +279,6 @@ class TestAgentInvocation:
 
 
 class TestAgentDelegation:
-    @pytest.mark.asyncio
     async def test_delegate_to_connected_agent(self):
         primary = _make_agent("Boss")
         specialist = _make_agent("Worker")
@@ -293,13 +287,11 @@ class TestAgentDelegation:
         assert result["agent"] == "Worker"
         assert result["delegated_by"] == "Boss"
 
-    @pytest.mark.asyncio
     async def test_delegate_to_unknown_agent_raises(self):
         primary = _make_agent("Boss")
         with pytest.raises(ValueError, match="not connected"):
             await primary.delegate("Unknown", "task")
 
-    @pytest.mark.asyncio
     async def test_delegate_with_shared_thread(self):
         primary = _make_agent("Boss")
         specialist = _make_agent("Worker")
@@ -317,7 +309,6 @@ class TestAgentDelegation:
 
 
 class TestSequentialOrchestrator:
-    @pytest.mark.asyncio
     async def test_sequential_basic(self):
         agents = [_make_agent("Research"), _make_agent("Build")]
         orch = SequentialOrchestrator(agents)
@@ -328,28 +319,24 @@ class TestSequentialOrchestrator:
         assert result.success is True
         assert result.elapsed_ms > 0
 
-    @pytest.mark.asyncio
     async def test_sequential_empty_agents(self):
         orch = SequentialOrchestrator([])
         result = await orch.run("task")
         assert result.status == "failed"
         assert "No agents" in result.metadata.get("error", "")
 
-    @pytest.mark.asyncio
     async def test_sequential_single_agent(self):
         orch = SequentialOrchestrator([_make_agent("Solo")])
         result = await orch.run("task")
         assert result.status == "completed"
         assert result.agent_count == 1
 
-    @pytest.mark.asyncio
     async def test_sequential_history(self):
         orch = SequentialOrchestrator([_make_agent("A")])
         await orch.run("task 1")
         await orch.run("task 2")
         assert len(orch.history) == 2
 
-    @pytest.mark.asyncio
     async def test_sequential_passes_output_forward(self):
         agents = [_make_agent("First"), _make_agent("Second")]
         orch = SequentialOrchestrator(agents)
@@ -365,7 +352,6 @@ class TestSequentialOrchestrator:
 
 
 class TestConcurrentOrchestrator:
-    @pytest.mark.asyncio
     async def test_concurrent_basic(self):
         agents = [_make_agent("A"), _make_agent("B"), _make_agent("C")]
         orch = ConcurrentOrchestrator(agents)
@@ -374,13 +360,11 @@ class TestConcurrentOrchestrator:
         assert result.status == "completed"
         assert result.agent_count == 3
 
-    @pytest.mark.asyncio
     async def test_concurrent_empty_agents(self):
         orch = ConcurrentOrchestrator([])
         result = await orch.run("task")
         assert result.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_concurrent_merges_outputs(self):
         agents = [_make_agent("Alpha"), _make_agent("Beta")]
         orch = ConcurrentOrchestrator(agents)
@@ -388,7 +372,6 @@ class TestConcurrentOrchestrator:
         assert "[Alpha]" in result.final_output
         assert "[Beta]" in result.final_output
 
-    @pytest.mark.asyncio
     async def test_concurrent_add_remove_agent(self):
         orch = ConcurrentOrchestrator()
         orch.add_agent(_make_agent("X"))
@@ -404,7 +387,6 @@ class TestConcurrentOrchestrator:
 
 
 class TestHandoffOrchestrator:
-    @pytest.mark.asyncio
     async def test_handoff_explicit_delegation(self):
         primary = _make_agent("CEO")
         specialist = _make_agent("Builder")
@@ -415,7 +397,6 @@ class TestHandoffOrchestrator:
         assert result.metadata.get("delegated_to") == "Builder"
         assert result.agent_count == 2
 
-    @pytest.mark.asyncio
     async def test_handoff_no_delegation(self):
         primary = _make_agent("CEO")
         orch = HandoffOrchestrator(primary=primary, specialists=[])
@@ -424,7 +405,6 @@ class TestHandoffOrchestrator:
         assert result.agent_count == 1
         assert result.metadata.get("delegated_to") is None
 
-    @pytest.mark.asyncio
     async def test_handoff_auto_delegation(self):
         primary = _make_agent("CEO")
         # Specialist description matches task keywords
@@ -439,13 +419,11 @@ class TestHandoffOrchestrator:
         result = await orch.run("research the latest AI trends and analyze data")
         assert result.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_handoff_empty_agents(self):
         orch = HandoffOrchestrator()
         result = await orch.run("task")
         assert result.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_handoff_primary_property(self):
         p = _make_agent("P")
         s = _make_agent("S")
@@ -460,7 +438,6 @@ class TestHandoffOrchestrator:
 
 
 class TestMCPToolDescriptor:
-    @pytest.mark.asyncio
     async def test_execute_with_handler(self):
         tool = MCPToolDescriptor(
             name="test",
@@ -471,7 +448,6 @@ class TestMCPToolDescriptor:
         result = await tool.execute({"key": "val"})
         assert result == {"echoed": {"key": "val"}}
 
-    @pytest.mark.asyncio
     async def test_execute_default_handler(self):
         tool = MCPToolDescriptor(
             name="default",
@@ -556,7 +532,6 @@ class TestMCPToolRegistry:
         reg.register(MCPToolDescriptor(name="b", description="d", parameters={}))
         assert len(reg.list_all()) == 2
 
-    @pytest.mark.asyncio
     async def test_invoke_success(self):
         reg = MCPToolRegistry()
         reg.register(MCPToolDescriptor(name="echo", description="d", parameters={}, _execute=_echo_handler))
@@ -565,13 +540,11 @@ class TestMCPToolRegistry:
         assert len(reg.get_invocation_log()) == 1
         assert reg.get_invocation_log()[0]["status"] == "completed"
 
-    @pytest.mark.asyncio
     async def test_invoke_not_found(self):
         reg = MCPToolRegistry()
         result = await reg.invoke("nonexistent", {})
         assert result["status"] == "error"
 
-    @pytest.mark.asyncio
     async def test_invoke_failure(self):
         reg = MCPToolRegistry()
         reg.register(MCPToolDescriptor(name="fail", description="d", parameters={}, _execute=_fail_handler))
@@ -604,38 +577,32 @@ class TestBuiltinMCPTools:
     def test_builtin_tools_count(self):
         assert len(BUILTIN_TOOLS) == 8
 
-    @pytest.mark.asyncio
     async def test_screenshot_tool(self):
         result = await SCREENSHOT_TOOL.execute({"url": "https://example.com"})
         assert result["status"] == "ok"
         assert result["url"] == "https://example.com"
         assert result["format"] == "png"
 
-    @pytest.mark.asyncio
     async def test_ai_analysis_tool(self):
         result = await AI_ANALYSIS_TOOL.execute({"content": "test data", "type": "summary"})
         assert result["status"] == "ok"
         assert result["analysis_type"] == "summary"
 
-    @pytest.mark.asyncio
     async def test_markdown_conversion_tool(self):
         result = await MARKDOWN_CONVERSION_TOOL.execute({"content": "<h1>Hello</h1>", "source_format": "html"})
         assert result["status"] == "ok"
         assert "html" in result["source_format"]
 
-    @pytest.mark.asyncio
     async def test_web_search_tool(self):
         result = await WEB_SEARCH_TOOL.execute({"query": "AI agents", "max_results": 3})
         assert result["status"] == "ok"
         assert len(result["results"]) == 3
 
-    @pytest.mark.asyncio
     async def test_file_operation_tool(self):
         result = await FILE_OPERATION_TOOL.execute({"operation": "read", "path": "/tmp/test.txt"})
         assert result["status"] == "ok"
         assert result["operation"] == "read"
 
-    @pytest.mark.asyncio
     async def test_api_call_tool(self):
         result = await API_CALL_TOOL.execute({"url": "https://api.example.com/v1", "method": "POST"})
         assert result["status"] == "ok"
@@ -709,7 +676,6 @@ class TestA2AServer:
         assert card_dict["name"] == "S"
         assert "protocols" in card_dict
 
-    @pytest.mark.asyncio
     async def test_handle_task(self):
         agent = _make_agent("Handler")
         server = A2AServer(agent)
@@ -719,7 +685,6 @@ class TestA2AServer:
         assert task.from_agent == "requester"
         assert task.result is not None
 
-    @pytest.mark.asyncio
     async def test_handle_task_tracks_tasks(self):
         agent = _make_agent("Tracker")
         server = A2AServer(agent)
@@ -839,20 +804,17 @@ class TestPrebuiltAgents:
         agent = create_researcher_agent(chat_client=_mock_client(), include_tools=False)
         assert len(agent.list_tools()) == 0
 
-    @pytest.mark.asyncio
     async def test_researcher_invoke(self):
         agent = create_researcher_agent(chat_client=_mock_client())
         result = await agent.invoke("Research AI agent frameworks")
         assert result["agent"] == "Researcher"
         assert "response" in result
 
-    @pytest.mark.asyncio
     async def test_analyst_invoke(self):
         agent = create_analyst_agent(chat_client=_mock_client())
         result = await agent.invoke("Analyze the competitive landscape")
         assert result["agent"] == "Analyst"
 
-    @pytest.mark.asyncio
     async def test_executor_invoke(self):
         agent = create_executor_agent(chat_client=_mock_client())
         result = await agent.invoke("Create a configuration file")
@@ -865,7 +827,6 @@ class TestPrebuiltAgents:
 
 
 class TestMultiAgentIntegration:
-    @pytest.mark.asyncio
     async def test_researcher_analyst_sequential(self):
         """Research → Analyst pipeline."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -875,7 +836,6 @@ class TestMultiAgentIntegration:
         assert result.status == "completed"
         assert result.agent_count == 2
 
-    @pytest.mark.asyncio
     async def test_all_agents_concurrent(self):
         """All three agents run in parallel."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -889,7 +849,6 @@ class TestMultiAgentIntegration:
         assert "[Analyst]" in result.final_output
         assert "[Executor]" in result.final_output
 
-    @pytest.mark.asyncio
     async def test_handoff_researcher_to_executor(self):
         """CEO hands off research results to executor."""
         ceo = _make_agent("CEO")
@@ -900,7 +859,6 @@ class TestMultiAgentIntegration:
         assert result.status == "completed"
         assert result.metadata["delegated_to"] == "Executor"
 
-    @pytest.mark.asyncio
     async def test_three_stage_pipeline(self):
         """Research → Analyze → Execute pipeline."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -911,7 +869,6 @@ class TestMultiAgentIntegration:
         assert result.status == "completed"
         assert result.agent_count == 3
 
-    @pytest.mark.asyncio
     async def test_a2a_server_with_prebuilt_agent(self):
         """A2A server wrapping a pre-built agent."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -923,7 +880,6 @@ class TestMultiAgentIntegration:
         task = await server.handle_task("Research quantum computing")
         assert task.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_orchestrator_result_properties(self):
         """Test OrchestratorResult dataclass properties."""
         result = OrchestratorResult(pattern="test", task="test task", status="completed")
@@ -940,7 +896,6 @@ class TestMultiAgentIntegration:
 
 
 class TestEdgeCases:
-    @pytest.mark.asyncio
     async def test_agent_message_metadata(self):
         msg = AgentMessage(role="user", content="test", metadata={"key": "val"})
         assert msg.metadata["key"] == "val"
@@ -952,7 +907,6 @@ class TestEdgeCases:
         assert task.result is None
         assert task.task_id.startswith("a2a_")
 
-    @pytest.mark.asyncio
     async def test_registry_invoke_tracking(self):
         """Test that invocations are tracked in order."""
         reg = MCPToolRegistry()
@@ -973,7 +927,6 @@ class TestEdgeCases:
         assert thread.metadata["purpose"] == "testing"
         assert thread.metadata["priority"] == "high"
 
-    @pytest.mark.asyncio
     async def test_concurrent_preserves_all_results(self):
         """Ensure concurrent orchestration keeps all agent results."""
         agents = [_make_agent(f"Agent{i}") for i in range(5)]
@@ -991,7 +944,6 @@ class TestEdgeCases:
 
 
 class TestRouterOrchestrator:
-    @pytest.mark.asyncio
     async def test_router_basic(self):
         researcher = AgentFrameworkAgent(
             name="Researcher",
@@ -1011,7 +963,6 @@ class TestRouterOrchestrator:
         assert result.status == "completed"
         assert result.metadata["routed_to"] == "Researcher"
 
-    @pytest.mark.asyncio
     async def test_router_routes_to_builder(self):
         researcher = AgentFrameworkAgent(
             name="Researcher",
@@ -1030,13 +981,11 @@ class TestRouterOrchestrator:
         result = await orch.run("builder should builds code deploys applications")
         assert result.metadata["routed_to"] == "Builder"
 
-    @pytest.mark.asyncio
     async def test_router_empty_agents(self):
         orch = RouterOrchestrator([])
         result = await orch.run("task")
         assert result.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_router_fallback_to_first(self):
         """When no keyword match, fallback to first agent."""
         a = _make_agent("Alpha")
@@ -1046,7 +995,6 @@ class TestRouterOrchestrator:
         assert result.status == "completed"
         assert result.metadata["routed_to"] == "Alpha"
 
-    @pytest.mark.asyncio
     async def test_router_custom_routing_fn(self):
         """Use a custom routing function."""
         a = _make_agent("Alice")
@@ -1062,7 +1010,6 @@ class TestRouterOrchestrator:
         result = await orch.run("any task")
         assert result.metadata["routed_to"] == "Bob"
 
-    @pytest.mark.asyncio
     async def test_router_history_tracking(self):
         orch = RouterOrchestrator([_make_agent("X")])
         await orch.run("task 1")
@@ -1130,7 +1077,6 @@ class TestPipelineBuilder:
         assert isinstance(pipeline, Pipeline)
         assert pipeline.step_count == 1
 
-    @pytest.mark.asyncio
     async def test_pipeline_sequential_steps(self):
         pipeline = (
             PipelineBuilder()
@@ -1144,7 +1090,6 @@ class TestPipelineBuilder:
         assert len(result.agent_results) == 2
         assert result.metadata["steps_completed"] == 2
 
-    @pytest.mark.asyncio
     async def test_pipeline_with_concurrent_step(self):
         pipeline = (
             PipelineBuilder()
@@ -1158,7 +1103,6 @@ class TestPipelineBuilder:
         # 1 (plan) + 2 (parallel A & B) + 1 (merge) = 4 step results
         assert len(result.agent_results) == 4
 
-    @pytest.mark.asyncio
     async def test_pipeline_with_router_step(self):
         researcher = AgentFrameworkAgent(
             name="Researcher",
@@ -1181,14 +1125,12 @@ class TestPipelineBuilder:
         assert result.status == "completed"
         assert result.agent_results[0].get("routed_to") is not None
 
-    @pytest.mark.asyncio
     async def test_pipeline_empty(self):
         pipeline = PipelineBuilder().build()
         result = await pipeline.run("task")
         assert result.status == "failed"
         assert "Empty pipeline" in result.metadata.get("error", "")
 
-    @pytest.mark.asyncio
     async def test_pipeline_single_step(self):
         pipeline = PipelineBuilder().add_step("only", _make_agent("Solo")).build()
         result = await pipeline.run("single step task")
@@ -1203,7 +1145,6 @@ class TestPipelineBuilder:
 
 
 class TestNewMCPTools:
-    @pytest.mark.asyncio
     async def test_code_execution_tool(self):
         result = await CODE_EXECUTION_TOOL.execute({"language": "python", "code": "print('hello')"})
         assert result["status"] == "ok"
@@ -1211,37 +1152,31 @@ class TestNewMCPTools:
         assert result["exit_code"] == 0
         assert result["execution_time_ms"] > 0
 
-    @pytest.mark.asyncio
     async def test_code_execution_javascript(self):
         result = await CODE_EXECUTION_TOOL.execute({"language": "javascript", "code": "console.log('hi')"})
         assert result["status"] == "ok"
         assert result["language"] == "javascript"
 
-    @pytest.mark.asyncio
     async def test_data_store_set(self):
         result = await DATA_STORE_TOOL.execute({"operation": "set", "key": "name", "value": "test"})
         assert result["status"] == "ok"
         assert result["stored"] is True
 
-    @pytest.mark.asyncio
     async def test_data_store_get(self):
         result = await DATA_STORE_TOOL.execute({"operation": "get", "key": "name"})
         assert result["status"] == "ok"
         assert "mock_value_for_name" in result["value"]
 
-    @pytest.mark.asyncio
     async def test_data_store_delete(self):
         result = await DATA_STORE_TOOL.execute({"operation": "delete", "key": "name"})
         assert result["status"] == "ok"
         assert result["deleted"] is True
 
-    @pytest.mark.asyncio
     async def test_data_store_list(self):
         result = await DATA_STORE_TOOL.execute({"operation": "list"})
         assert result["status"] == "ok"
         assert isinstance(result["keys"], list)
 
-    @pytest.mark.asyncio
     async def test_data_store_unknown_op(self):
         result = await DATA_STORE_TOOL.execute({"operation": "upsert"})
         assert result["status"] == "error"
@@ -1296,7 +1231,6 @@ class TestA2ABatchOperations:
         batch = A2ATaskBatch([t1, t2])
         assert batch.is_complete is False
 
-    @pytest.mark.asyncio
     async def test_server_handle_batch(self):
         agent = _make_agent("BatchAgent")
         server = A2AServer(agent)
@@ -1309,7 +1243,6 @@ class TestA2ABatchOperations:
         assert batch.completed_count == 3
         assert all(t.to_agent == "BatchAgent" for t in batch.tasks)
 
-    @pytest.mark.asyncio
     async def test_server_handle_batch_single(self):
         agent = _make_agent("SingleBatch")
         server = A2AServer(agent)
@@ -1317,7 +1250,6 @@ class TestA2ABatchOperations:
         assert batch.total_count == 1
         assert batch.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_server_handle_batch_empty(self):
         agent = _make_agent("EmptyBatch")
         server = A2AServer(agent)
@@ -1391,7 +1323,6 @@ class TestA2ATaskCancellation:
 
 
 class TestComplexPipelineIntegration:
-    @pytest.mark.asyncio
     async def test_research_analyze_execute_pipeline(self):
         """Full 3-stage pipeline using pre-built agents."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -1408,7 +1339,6 @@ class TestComplexPipelineIntegration:
         assert result.status == "completed"
         assert result.metadata["steps_completed"] == 3
 
-    @pytest.mark.asyncio
     async def test_fan_out_fan_in_pipeline(self):
         """Parallel research followed by analysis merge."""
         r1 = create_researcher_agent(chat_client=_mock_client())
@@ -1425,7 +1355,6 @@ class TestComplexPipelineIntegration:
         # 2 parallel + 1 analyze = 3
         assert len(result.agent_results) == 3
 
-    @pytest.mark.asyncio
     async def test_router_with_prebuilt_agents(self):
         """Router selects the right pre-built agent."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -1436,7 +1365,6 @@ class TestComplexPipelineIntegration:
         assert result.status == "completed"
         assert result.metadata["routed_to"] == "Executor"
 
-    @pytest.mark.asyncio
     async def test_a2a_server_batch_with_prebuilt(self):
         """A2A batch operations with pre-built agents."""
         researcher = create_researcher_agent(chat_client=_mock_client())
@@ -1451,7 +1379,6 @@ class TestComplexPipelineIntegration:
         # All tasks should be tracked in server
         assert len(server.list_tasks()) == 3
 
-    @pytest.mark.asyncio
     async def test_pipeline_result_has_final_output(self):
         """Pipeline final_output comes from last step."""
         pipeline = (
@@ -15,7 +15,6 @@ Also covers error handling edge cases:
 from __future__ import annotations
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.marketplace import AgentListing, MarketplaceRegistry, SkillMatcher, marketplace
@@ -456,6 +455,7 @@ class TestErrorHandlingEdgeCases:
         entry = escrow.get_entry(result.escrow_id)
         assert entry is not None
         assert entry.status == "refunded"
+        assert budget.remaining == pytest.approx(10.0)
 
 
 # ===================================================================
@@ -525,6 +525,16 @@ class TestSkillMatchingIntegration:
 class TestBudgetTrackingIntegration:
     """Budget enforcement across the full pipeline."""
 
+    def test_hire_agent_with_sub_micro_price(self):
+        """A price below one micro-USDC hires normally and spends nothing."""
+        reg = MarketplaceRegistry()
+        reg.register_agent(_make_listing("Tiny", ["code"], 1e-7, 4.0, "tiny-001"))
+        manager, _, _, bt = _create_pipeline(budget=1.0, registry=reg)
+        result = manager.hire(HireRequest(required_skills=["code"], budget=0.5))
+        assert result.status == "completed"
+        assert result.agreed_price == 1e-7
+        assert bt.total_spent == 0.0
+
     def test_budget_tracks_spending_per_task(self):
         """Each task's spending is tracked independently."""
         manager, _, _, bt = _create_pipeline(budget=10.0)
@@ -572,7 +582,7 @@ class TestBudgetTrackingIntegration:
 
 
 @pytest.fixture
-def api_client():
+def api_client(marketplace_client, monkeypatch):
     """Create a test client with marketplace routes and fresh state."""
     import src.api.marketplace_routes as routes_mod
 
@@ -588,25 +598,13 @@ def api_client():
         budget_tracker=fresh_budget,
     )
 
-    old_marketplace = routes_mod.marketplace
-    old_escrow = routes_mod._escrow
-    old_budget = routes_mod._budget
-    old_hiring = routes_mod._hiring_manager
-
-    routes_mod.marketplace = fresh_marketplace
-    routes_mod._escrow = fresh_escrow
-    routes_mod._budget = fresh_budget
-    routes_mod._hiring_manager = fresh_hiring
-
-    app = FastAPI()
-    app.include_router(routes_mod.router)
-    client = TestClient(app)
-    yield client
+    # Patch module-level singletons; monkeypatch restores them afterwards.
+    monkeypatch.setattr(routes_mod, "marketplace", fresh_marketplace)
+    monkeypatch.setattr(routes_mod, "_escrow", fresh_escrow)
+    monkeypatch.setattr(routes_mod, "_budget", fresh_budget)
+    monkeypatch.setattr(routes_mod, "_hiring_manager", fresh_hiring)
 
-    routes_mod.marketplace = old_marketplace
-    routes_mod._escrow = old_escrow
-    routes_mod._budget = old_budget
-    routes_mod._hiring_manager = old_hiring
+    return marketplace_client
 
 
 class TestAPIErrorCodes:
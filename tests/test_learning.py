@@ -5,20 +5,35 @@ Covers: FeedbackCollector, AgentScorer, HiringOptimizer, and CEO integration.
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import math
-import os
-import tempfile
+import sqlite3
+import threading
 import time
 
 import pytest
 
+import src.learning.feedback as feedback_mod
 from src.learning.feedback import (
     FeedbackRecord,
     FeedbackCollector,
     get_feedback_collector,
     reset_feedback_collector,
 )
-from src.learning.scorer import AgentScore, AgentScorer, _decay_weight, _HALF_LIFE
+from src.learning.scorer import (
+    AgentScore,
+    AgentScorer,
+    _decay_weight,
+    _decay_weights,
+    _DECAY_TABLE,
+    _HALF_LIFE,
+    _W_COST,
+    _W_QUALITY,
+    _W_RELIABILITY,
+    _W_SUCCESS,
+    _composite,
+)
 from src.learning.optimizer import AgentRecommendation, HiringOptimizer
 
 
@@ -27,24 +42,59 @@ from src.learning.optimizer import AgentRecommendation, HiringOptimizer
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def collector_mod():
+    """One in-memory FeedbackCollector shared by the whole module."""
+    return FeedbackCollector(":memory:")
+
+
+@pytest.fixture
+def collector(collector_mod):
+    """The shared collector, emptied before each test."""
+    collector_mod.clear_all()
+    return collector_mod
+
+
 @pytest.fixture
-def collector():
-    """Fresh FeedbackCollector with temporary database."""
-    tmpdir = tempfile.mkdtemp()
-    db_path = os.path.join(tmpdir, "test_learning.db")
-    return FeedbackCollector(db_path)
+def global_collector(collector, monkeypatch):
+    """Install the shared in-memory collector as the module-level singleton."""
+    monkeypatch.setattr(feedback_mod, "_collector", collector)
+    return collector
 
 
 @pytest.fixture
-def scorer(collector):
+def fake_clock(monkeypatch):
+    """Make ``time.time()`` return 1000.0, 2000.0, ... on successive calls."""
+    ticks = itertools.count(1000.0, 1000.0)
+    monkeypatch.setattr(time, "time", lambda: next(ticks))
+
+
+@pytest.fixture(scope="module")
+def scorer_mod(collector_mod):
+    return AgentScorer(collector_mod)
+
+
+@pytest.fixture
+def scorer(scorer_mod, collector):
     """AgentScorer backed by the test collector."""
-    return AgentScorer(collector)
+    return scorer_mod
+
+
+@pytest.fixture(scope="module")
+def optimizer_mod(collector_mod, scorer_mod):
+    return HiringOptimizer(collector_mod, scorer=scorer_mod, rng_seed=42)
 
 
 @pytest.fixture
-def optimizer(collector):
-    """HiringOptimizer with fixed seed for determinism."""
-    return HiringOptimizer(collector, rng_seed=42)
+def optimizer(optimizer_mod, collector):
+    """HiringOptimizer with fixed seed for determinism.
+
+    The instance is shared, so undo what earlier tests changed: the
+    exploration rate and the RNG position.
+    """
+    optimizer_mod.exploration_rate = 0.15
+    optimizer_mod._rng.seed(42)
+    return optimizer_mod
 
 
 def _make_record(
@@ -67,6 +117,22 @@ def _make_record(
     )
 
 
+def _make_records(agent_id: str, n: int, prefix: str = "t", **fields) -> list[FeedbackRecord]:
+    """``n`` records for one agent: task ids ``{prefix}0..``, timestamps 1000, 1001, ...
+
+    A field given as a callable is called with the record index.
+    """
+    return [
+        _make_record(
+            task_id=f"{prefix}{i}",
+            agent_id=agent_id,
+            ts=1000 + i,
+            **{k: v(i) if callable(v) else v for k, v in fields.items()},
+        )
+        for i in range(n)
+    ]
+
+
 # ===================================================================
 # FeedbackCollector Tests
 # ===================================================================
@@ -112,39 +178,34 @@ class TestFeedbackCollector:
         assert results[0].quality_score == 0.9
 
     def test_get_task_feedback(self, collector):
-        collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
-        collector.record_feedback(_make_record(task_id="t1", agent_id="b"))
-        collector.record_feedback(_make_record(task_id="t2", agent_id="a"))
+        collector.record_feedback_bulk([
+            _make_record(task_id="t1", agent_id="a"),
+            _make_record(task_id="t1", agent_id="b"),
+            _make_record(task_id="t2", agent_id="a"),
+        ])
 
         results = collector.get_task_feedback("t1")
         assert len(results) == 2
 
-    def test_get_agent_feedback_ordered(self, collector):
+    def test_get_agent_feedback_ordered(self, collector, fake_clock):
         """Feedback is ordered by timestamp DESC (most recent first)."""
-        collector.record_feedback(_make_record(task_id="t1", agent_id="a", ts=1000))
-        collector.record_feedback(_make_record(task_id="t2", agent_id="a", ts=2000))
+        collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
+        collector.record_feedback(_make_record(task_id="t2", agent_id="a"))
 
         results = collector.get_agent_feedback("a")
         assert results[0].task_id == "t2"  # more recent first
         assert results[1].task_id == "t1"
 
-    def test_get_all_feedback(self, collector):
-        collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
-        collector.record_feedback(_make_record(task_id="t2", agent_id="b"))
-        all_fb = collector.get_all_feedback()
-        assert len(all_fb) == 2
-
-    def test_count_feedback_all(self, collector):
-        collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
-        collector.record_feedback(_make_record(task_id="t2", agent_id="b"))
-        assert collector.count_feedback() == 2
-
-    def test_count_feedback_by_agent(self, collector):
-        collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
-        collector.record_feedback(_make_record(task_id="t2", agent_id="a"))
-        collector.record_feedback(_make_record(task_id="t3", agent_id="b"))
+    def test_counts_and_listing(self, collector):
+        collector.record_feedback_bulk([
+            _make_record(task_id="t1", agent_id="a"),
+            _make_record(task_id="t2", agent_id="a"),
+            _make_record(task_id="t3", agent_id="b"),
+        ])
+        assert collector.count_feedback() == 3
         assert collector.count_feedback("a") == 2
         assert collector.count_feedback("b") == 1
+        assert len(collector.get_all_feedback()) == 3
 
     def test_empty_feedback(self, collector):
         assert collector.get_agent_feedback("nonexistent") == []
@@ -168,12 +229,15 @@ class TestFeedbackCollector:
         assert results[0].quality_score == 0.9
 
     def test_multiple_agents(self, collector):
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(task_id=f"t{i}", agent_id=f"agent-{i % 3}")
-            )
+        collector.record_feedback_bulk([
+            _make_record(task_id=f"t{i}", agent_id=f"agent-{i % 3}") for i in range(5)
+        ])
         assert collector.count_feedback() == 5
 
+    def test_bulk_empty_is_noop(self, collector):
+        collector.record_feedback_bulk([])
+        assert collector.count_feedback() == 0
+
     def test_agent_score_persistence(self, collector):
         collector.save_agent_score(
             agent_id="a",
@@ -191,6 +255,27 @@ class TestFeedbackCollector:
     def test_agent_score_not_found(self, collector):
         assert collector.get_agent_score("nonexistent") is None
 
+    def test_identical_score_not_rewritten(self, collector):
+        collector.save_agent_score("a", 0.8, 0.9, 0.7, 0.6, 0.5)
+        first = collector.get_agent_score("a")
+        time.sleep(0.01)
+        collector.save_agent_score("a", 0.8, 0.9, 0.7, 0.6, 0.5)
+        assert collector.get_agent_score("a") == first
+        collector.save_agent_score("a", 0.81, 0.9, 0.7, 0.6, 0.5)
+        updated = collector.get_agent_score("a")
+        assert updated["composite_score"] == pytest.approx(0.81)
+        assert updated["updated_at"] > first["updated_at"]
+
+    def test_identical_score_rewritten_after_external_clear(self, tmp_path):
+        db_path = str(tmp_path / "shared.db")
+        writer, other = FeedbackCollector(db_path), FeedbackCollector(db_path)
+        writer.save_agent_score("a", 0.8, 0.9, 0.7, 0.6, 0.5)
+        other.clear_agent_scores()
+        writer.save_agent_score("a", 0.8, 0.9, 0.7, 0.6, 0.5)
+        assert other.get_agent_score("a")["composite_score"] == pytest.approx(0.8)
+        writer.close()
+        other.close()
+
     def test_list_agent_scores(self, collector):
         collector.save_agent_score("a", 0.9, 0.9, 0.9, 0.9, 0.9)
         collector.save_agent_score("b", 0.5, 0.5, 0.5, 0.5, 0.5)
@@ -210,18 +295,51 @@ class TestFeedbackCollector:
         assert collector.count_feedback() == 0
         assert collector.list_agent_scores() == []
 
+    def test_persistence_to_disk(self, tmp_path):
+        db_path = str(tmp_path / "persist.db")
+        FeedbackCollector(db_path).record_feedback(_make_record())
+        assert FeedbackCollector(db_path).count_feedback() == 1
+
+    def test_connection_reused_per_thread(self, collector):
+        conn = collector._get_conn()
+        assert collector._get_conn() is conn
+        other = []
+        t = threading.Thread(target=lambda: other.append(collector._get_conn()))
+        t.start()
+        t.join()
+        assert other[0] is not conn
+
+    def test_close_closes_pooled_connections(self, tmp_path):
+        collector = FeedbackCollector(str(tmp_path / "close.db"))
+        conns = [collector._get_conn()]
+        t = threading.Thread(target=lambda: conns.append(collector._get_conn()))
+        t.start()
+        t.join()
+        collector.close()
+        for conn in conns:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        collector.record_feedback(_make_record())  # reopens on next use
+        assert collector.count_feedback() == 1
+        collector.close()
+
+    def test_in_memory_stores_are_isolated(self):
+        a = FeedbackCollector(":memory:")
+        b = FeedbackCollector(":memory:")
+        a.record_feedback(_make_record())
+        assert a.count_feedback() == 1
+        assert b.count_feedback() == 0
+
 
 class TestFeedbackCollectorAsync:
     """Test async methods of FeedbackCollector."""
 
-    @pytest.mark.asyncio
     async def test_async_record_feedback(self, collector):
         rec = _make_record()
         await collector.async_record_feedback(rec)
         results = collector.get_agent_feedback("agent-a")
         assert len(results) == 1
 
-    @pytest.mark.asyncio
     async def test_async_get_agent_feedback(self, collector):
         collector.record_feedback(_make_record(task_id="t1", agent_id="a"))
         results = await collector.async_get_agent_feedback("a")
@@ -232,16 +350,13 @@ class TestFeedbackSingleton:
     """Test the module-level singleton pattern."""
 
     def test_get_and_reset(self):
-        tmpdir = tempfile.mkdtemp()
-        db_path = os.path.join(tmpdir, "singleton_test.db")
-        c1 = reset_feedback_collector(db_path)
+        c1 = reset_feedback_collector(":memory:")
         c2 = get_feedback_collector()
         assert c1 is c2
 
     def test_reset_creates_new(self):
-        tmpdir = tempfile.mkdtemp()
-        c1 = reset_feedback_collector(os.path.join(tmpdir, "a.db"))
-        c2 = reset_feedback_collector(os.path.join(tmpdir, "b.db"))
+        c1 = reset_feedback_collector(":memory:")
+        c2 = reset_feedback_collector(":memory:")
         assert c1 is not c2
 
 
@@ -272,6 +387,17 @@ class TestDecayWeight:
         for i in range(100):
             assert _decay_weight(i) > 0
 
+    def test_table_grows_past_initial_size(self, monkeypatch):
+        """Weights beyond the precomputed table still follow the formula."""
+        # Grow a copy so the shared table keeps its size for later tests.
+        table = list(_DECAY_TABLE)
+        monkeypatch.setattr("src.learning.scorer._DECAY_TABLE", table)
+        n = len(table) + 1
+        weights = _decay_weights(n)
+        assert len(weights) == n
+        assert weights[-1] == pytest.approx(math.pow(0.5, (n - 1) / _HALF_LIFE))
+        assert len(_DECAY_TABLE) < len(table)
+
 
 class TestAgentScorer:
     """Test agent score computation."""
@@ -283,19 +409,19 @@ class TestAgentScorer:
         assert score.confidence == 0.0
         assert score.task_count == 0
 
+    def test_scores_are_immutable(self, scorer):
+        """Cached scores are shared between callers, so they cannot be edited."""
+        score = scorer.compute_score("unknown-agent")
+        assert score is scorer.compute_score("unknown-agent")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            score.composite_score = 1.0
+
     def test_perfect_agent(self, collector, scorer):
         """Agent with all successful high-quality tasks."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="perfect",
-                    outcome="success",
-                    quality=1.0,
-                    cost=0.10,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "perfect", 10,
+            outcome="success", quality=1.0, cost=0.10,
+        ))
         score = scorer.compute_score("perfect")
         assert score.success_rate == pytest.approx(1.0)
         assert score.avg_quality == pytest.approx(1.0)
@@ -303,62 +429,41 @@ class TestAgentScorer:
 
     def test_failing_agent(self, collector, scorer):
         """Agent that always fails scores low."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="bad",
-                    outcome="failure",
-                    quality=0.1,
-                    cost=1.0,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "bad", 10,
+            outcome="failure", quality=0.1, cost=1.0,
+        ))
         score = scorer.compute_score("bad")
         assert score.success_rate < 0.1
         assert score.composite_score < 0.3
 
     def test_partial_outcomes(self, collector, scorer):
         """Partial outcomes contribute 0.5 to success rate."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="partial",
-                    outcome="partial",
-                    quality=0.5,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "partial", 10,
+            outcome="partial", quality=0.5,
+        ))
         score = scorer.compute_score("partial")
         assert score.success_rate == pytest.approx(0.5, abs=0.05)
 
     def test_decay_weights_recent(self, collector, scorer):
         """Recent success after earlier failures should score higher than vice versa."""
         # Early failures, recent successes
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"improving-{i}",
-                    agent_id="improving",
-                    outcome="failure" if i < 5 else "success",
-                    quality=0.2 if i < 5 else 0.9,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "improving", 10,
+            prefix="improving-",
+            outcome=lambda i: "failure" if i < 5 else "success",
+            quality=lambda i: 0.2 if i < 5 else 0.9,
+        ))
         improving_score = scorer.compute_score("improving")
 
         # Early successes, recent failures
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"declining-{i}",
-                    agent_id="declining",
-                    outcome="success" if i < 5 else "failure",
-                    quality=0.9 if i < 5 else 0.2,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "declining", 10,
+            prefix="declining-",
+            outcome=lambda i: "success" if i < 5 else "failure",
+            quality=lambda i: 0.9 if i < 5 else 0.2,
+        ))
         declining_score = scorer.compute_score("declining")
 
         # Improving agent should score higher due to recency weighting
@@ -388,94 +493,78 @@ class TestAgentScorer:
 
     def test_reliability_consistent(self, collector, scorer):
         """Consistent quality = high reliability."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="consistent",
-                    outcome="success",
-                    quality=0.8,  # always 0.8
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "consistent", 10,
+            outcome="success", quality=0.8,  # always 0.8
+        ))
         score = scorer.compute_score("consistent")
         assert score.reliability > 0.9  # nearly perfect consistency
 
     def test_reliability_inconsistent(self, collector, scorer):
         """Wild quality swings = low reliability."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="erratic",
-                    outcome="success",
-                    quality=0.0 if i % 2 == 0 else 1.0,  # alternating extremes
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "erratic", 10,
+            outcome="success",
+            quality=lambda i: 0.0 if i % 2 == 0 else 1.0,  # alternating extremes
+        ))
         score = scorer.compute_score("erratic")
         assert score.reliability < 0.3  # very inconsistent
 
     def test_cost_efficiency_free(self, collector, scorer):
         """Free work is maximally cost-efficient."""
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="free",
-                    outcome="success",
-                    quality=0.8,
-                    cost=0.0,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "free", 5,
+            outcome="success", quality=0.8, cost=0.0,
+        ))
         score = scorer.compute_score("free")
         assert score.cost_efficiency == pytest.approx(1.0)
 
     def test_cost_efficiency_expensive(self, collector, scorer):
         """Expensive low-quality work has poor cost efficiency."""
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}",
-                    agent_id="expensive",
-                    outcome="success",
-                    quality=0.1,
-                    cost=10.0,
-                    ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "expensive", 5,
+            outcome="success", quality=0.1, cost=10.0,
+        ))
         score = scorer.compute_score("expensive")
         assert score.cost_efficiency < 0.1
 
     def test_composite_weights_sum_to_one(self):
         """Verify weight constants sum to 1.0."""
-        from src.learning.scorer import _W_SUCCESS, _W_QUALITY, _W_RELIABILITY, _W_COST
         assert _W_SUCCESS + _W_QUALITY + _W_RELIABILITY + _W_COST == pytest.approx(1.0)
+        assert _composite(1.0, 1.0, 1.0, 1.0) == pytest.approx(1.0)
+        assert _composite(1.0, 0.0, 0.0, 0.0) == _W_SUCCESS
 
     def test_rank_agents(self, collector, scorer):
         """Ranking should order agents by composite score."""
         # Good agent
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"good-{i}", agent_id="good",
-                    outcome="success", quality=0.9, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "good", 5,
+            prefix="good-", outcome="success", quality=0.9,
+        ))
         # Bad agent
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"bad-{i}", agent_id="bad",
-                    outcome="failure", quality=0.2, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "bad", 5,
+            prefix="bad-", outcome="failure", quality=0.2,
+        ))
         rankings = scorer.rank_agents()
         assert len(rankings) == 2
         assert rankings[0].agent_id == "good"
         assert rankings[1].agent_id == "bad"
 
+    def test_rank_agents_matches_per_agent_scores(self, collector, monkeypatch):
+        """The grouped ranking query agrees with scoring agents one by one."""
+        for agent, quality in [("x", 0.9), ("y", 0.4), ("z", 0.7)]:
+            collector.record_feedback_bulk(_make_records(
+                agent, 6, prefix=f"{agent}-",
+                outcome=lambda i: "failure" if i % 3 == 0 else "success", quality=quality,
+            ))
+        ranked = AgentScorer(collector).rank_agents()
+        assert [s.agent_id for s in ranked] == ["x", "z", "y"]
+        assert ranked == [AgentScorer(collector).compute_score(a) for a in ("x", "z", "y")]
+
+        monkeypatch.setattr(collector, "_sql_aggregates", False)
+        assert AgentScorer(collector).rank_agents() == ranked
+
     def test_score_persisted(self, collector, scorer):
         """Computing a score should persist it to the agent_scores table."""
         collector.record_feedback(
@@ -494,6 +583,93 @@ class TestAgentScorer:
         score = scorer.compute_score("solo")
         assert score.reliability == 0.5  # insufficient data default
 
+    def test_sql_and_python_paths_agree(self, collector, scorer, monkeypatch):
+        """The SQL aggregation and the Python fallback produce the same score."""
+        outcomes = ["success", "partial", "failure"]
+        collector.record_feedback_bulk([
+            _make_record(
+                task_id=f"t{i}", agent_id="mixed", outcome=outcomes[i % 3],
+                quality=0.3 + 0.05 * i, cost=0.05 * (i % 4), ts=1000.0 + i,
+            )
+            for i in range(12)
+        ])
+        via_sql = scorer.compute_score("mixed")
+        assert collector._sql_aggregates  # SQLite here supports the query
+        monkeypatch.setattr(collector, "_sql_aggregates", False)
+        via_python = AgentScorer(collector).compute_score("mixed")
+        assert via_sql == via_python
+
+    def test_unrelated_sql_error_not_swallowed(self):
+        """Only missing SQLite features disable the SQL aggregation path."""
+        collector = FeedbackCollector(":memory:")
+        collector.record_feedback(_make_record(task_id="t1", agent_id="broken"))
+        conn = sqlite3.connect(collector._db_path, uri=collector._uri)
+        conn.execute("DROP TABLE agent_running_stats")
+        conn.commit()
+        conn.close()
+        with pytest.raises(sqlite3.OperationalError):
+            collector.get_agent_aggregates("broken", 10.0)
+        assert collector._sql_aggregates
+
+    def test_writes_maintain_running_stats_and_reads_do_not_write(self, collector):
+        """Running stats rows are kept by the write methods; reading is a pure SELECT."""
+        collector.record_feedback(_make_record(task_id="t1", agent_id="single"))
+        collector.record_feedback_bulk(_make_records("bulk", 3))
+        conn = collector._get_conn()
+        rows = dict(conn.execute("SELECT agent_id, n FROM agent_running_stats").fetchall())
+        assert rows == {"single": 1, "bulk": 3}
+
+        changes = conn.total_changes
+        for half_life in (10.0, 3.0):
+            assert collector.get_agent_aggregates("bulk", half_life)["n"] == 3
+        assert collector.get_agent_aggregates("unknown", 10.0)["n"] == 0
+        assert conn.total_changes == changes
+        assert not conn.in_transaction
+
+    @pytest.mark.parametrize("late_ts", [2000.0, 500.0], ids=["in_order", "out_of_order"])
+    def test_running_stats_match_full_rescan(self, collector, scorer, monkeypatch, late_ts):
+        """Incrementally folded sums score the same as a rebuild from history."""
+        collector.record_feedback(_make_record(task_id="t0", agent_id="inc", ts=1000.0))
+        scorer.compute_score("inc")
+        for i in range(1, 8):
+            collector.record_feedback(_make_record(
+                task_id=f"t{i}", agent_id="inc", outcome="partial" if i % 2 else "success",
+                quality=0.5 + 0.05 * i, cost=0.1 * i, ts=1000.0 + i,
+            ))
+        collector.record_feedback(_make_record(task_id="late", agent_id="inc", ts=late_ts))
+        incremental = scorer.compute_score("inc")
+        monkeypatch.setattr(collector, "_sql_aggregates", False)
+        assert incremental == AgentScorer(collector).compute_score("inc")
+
+    def test_tied_timestamps_ordered_by_insertion(self, collector, scorer, monkeypatch):
+        """Records sharing a timestamp decay in insertion order on both paths."""
+        for i, outcome in enumerate(["failure", "partial", "success"]):
+            collector.record_feedback(_make_record(
+                task_id=f"t{i}", agent_id="tied", outcome=outcome, quality=0.2 + 0.3 * i,
+                ts=1000.0,
+            ))
+            via_sql = scorer.compute_score("tied")
+        assert [r.task_id for r in collector.get_agent_feedback("tied")] == ["t2", "t1", "t0"]
+        monkeypatch.setattr(collector, "_sql_aggregates", False)
+        assert via_sql == AgentScorer(collector).compute_score("tied")
+
+    def test_score_cached_until_history_changes(self, collector, scorer, monkeypatch):
+        """Rescoring an unchanged agent does not touch the database."""
+        calls = []
+        aggregates = collector.get_agent_aggregates
+        monkeypatch.setattr(
+            collector, "get_agent_aggregates",
+            lambda *args: calls.append(args) or aggregates(*args),
+        )
+        collector.record_feedback(_make_record(task_id="t1", agent_id="cached"))
+        first = scorer.compute_score("cached")
+        assert scorer.compute_score("cached") is first
+        assert len(calls) == 1
+
+        collector.record_feedback(_make_record(task_id="t2", agent_id="cached"))
+        assert scorer.compute_score("cached").task_count == 2
+        assert len(calls) == 2
+
 
 # ===================================================================
 # HiringOptimizer Tests
@@ -516,13 +692,10 @@ class TestHiringOptimizer:
         assert rec.agent_id == "only-one"
 
     def test_recommend_returns_recommendation(self, collector, optimizer):
-        for i in range(3):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"t{i}", agent_id="candidate",
-                    outcome="success", quality=0.8, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "candidate", 3,
+            outcome="success", quality=0.8,
+        ))
         rec = optimizer.recommend_agent(["candidate"])
         assert isinstance(rec, AgentRecommendation)
         assert rec.agent_id == "candidate"
@@ -532,21 +705,15 @@ class TestHiringOptimizer:
     def test_exploit_picks_best(self, collector):
         """Exploitation should pick the highest-scoring agent."""
         # Agent A: great
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"a-{i}", agent_id="great",
-                    outcome="success", quality=0.95, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "great", 10,
+            prefix="a-", outcome="success", quality=0.95,
+        ))
         # Agent B: mediocre
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"b-{i}", agent_id="mediocre",
-                    outcome="partial", quality=0.4, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "mediocre", 10,
+            prefix="b-", outcome="partial", quality=0.4,
+        ))
 
         # Force exploitation (rate=0)
         opt = HiringOptimizer(collector, exploration_rate=0.0, rng_seed=42)
@@ -557,20 +724,14 @@ class TestHiringOptimizer:
 
     def test_explore_sometimes_picks_other(self, collector):
         """Exploration should sometimes pick non-top agents."""
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"a-{i}", agent_id="top",
-                    outcome="success", quality=0.95, ts=1000 + i,
-                )
-            )
-        for i in range(10):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"b-{i}", agent_id="mid",
-                    outcome="success", quality=0.5, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "top", 10,
+            prefix="a-", outcome="success", quality=0.95,
+        ))
+        collector.record_feedback_bulk(_make_records(
+            "mid", 10,
+            prefix="b-", outcome="success", quality=0.5,
+        ))
 
         # Force exploration (rate=1.0), run many trials
         opt = HiringOptimizer(collector, exploration_rate=1.0, rng_seed=123)
@@ -598,21 +759,15 @@ class TestHiringOptimizer:
     def test_budget_filter(self, collector):
         """Budget filter should exclude expensive agents."""
         # Cheap agent
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"cheap-{i}", agent_id="cheap",
-                    outcome="success", quality=0.7, cost=0.10, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "cheap", 5,
+            prefix="cheap-", outcome="success", quality=0.7, cost=0.10,
+        ))
         # Expensive agent
-        for i in range(5):
-            collector.record_feedback(
-                _make_record(
-                    task_id=f"pricey-{i}", agent_id="pricey",
-                    outcome="success", quality=0.9, cost=5.00, ts=1000 + i,
-                )
-            )
+        collector.record_feedback_bulk(_make_records(
+            "pricey", 5,
+            prefix="pricey-", outcome="success", quality=0.9, cost=5.00,
+        ))
 
         opt = HiringOptimizer(collector, exploration_rate=0.0, rng_seed=42)
         rec = opt.recommend_agent(["cheap", "pricey"], budget=0.50)
@@ -688,16 +843,10 @@ class TestHiringOptimizer:
 class TestCEOIntegration:
     """Test that learning tools integrate with the CEO agent."""
 
-    @pytest.mark.asyncio
-    async def test_record_feedback_tool(self):
+    async def test_record_feedback_tool(self, global_collector):
         """Test the record_task_feedback CEO tool."""
         from src.agents.ceo_agent import record_task_feedback
 
-        # Reset the singleton to use a temp DB
-        tmpdir = tempfile.mkdtemp()
-        db_path = os.path.join(tmpdir, "ceo_test.db")
-        reset_feedback_collector(db_path)
-
         result = await record_task_feedback(
             task_id="ceo-t1",
             agent_id="builder",
@@ -710,14 +859,10 @@ class TestCEOIntegration:
         assert result["agent_id"] == "builder"
         assert "updated_score" in result
 
-    @pytest.mark.asyncio
-    async def test_record_feedback_clamps_quality(self):
+    async def test_record_feedback_clamps_quality(self, global_collector):
         """Quality score should be clamped to [0, 1]."""
         from src.agents.ceo_agent import record_task_feedback
 
-        tmpdir = tempfile.mkdtemp()
-        reset_feedback_collector(os.path.join(tmpdir, "clamp.db"))
-
         result = await record_task_feedback(
             task_id="clamp-t1",
             agent_id="a",
@@ -726,17 +871,12 @@ class TestCEOIntegration:
         )
         assert result["status"] == "recorded"
 
-    @pytest.mark.asyncio
-    async def test_get_hiring_recommendation_tool(self):
+    async def test_get_hiring_recommendation_tool(self, global_collector):
         """Test the get_hiring_recommendation CEO tool."""
         from src.agents.ceo_agent import get_hiring_recommendation
 
-        tmpdir = tempfile.mkdtemp()
-        db_path = os.path.join(tmpdir, "rec_test.db")
-        collector = reset_feedback_collector(db_path)
-
         # Add some history
-        collector.record_feedback(
+        global_collector.record_feedback(
             _make_record(task_id="t1", agent_id="builder", outcome="success", quality=0.9)
         )
 
@@ -749,13 +889,9 @@ class TestCEOIntegration:
         assert "agent_id" in result
         assert "confidence_interval" in result
 
-    @pytest.mark.asyncio
-    async def test_get_hiring_recommendation_no_candidates(self):
+    async def test_get_hiring_recommendation_no_candidates(self, global_collector):
         from src.agents.ceo_agent import get_hiring_recommendation
 
-        tmpdir = tempfile.mkdtemp()
-        reset_feedback_collector(os.path.join(tmpdir, "empty.db"))
-
         result = await get_hiring_recommendation(candidate_ids="")
         assert result["status"] == "error"
 
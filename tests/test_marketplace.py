@@ -13,8 +13,9 @@ Covers:
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
-from fastapi.testclient import TestClient
 
 from src.marketplace import (
     AgentListing,
@@ -118,6 +119,12 @@ class TestAgentListing:
         listing = _make_listing(skills=["web-search"])
         assert listing.matches_skill("search") is True
 
+    def test_matches_skill_after_reassign(self):
+        listing = _make_listing(skills=["python"])
+        listing.skills = ["Design"]
+        assert listing.matches_skill("design") is True
+        assert listing.matches_skill("python") is False
+
     def test_to_dict(self):
         listing = _make_listing("Beta")
         d = listing.to_dict()
@@ -126,6 +133,28 @@ class TestAgentListing:
         assert "skills" in d
         assert isinstance(d["skills"], list)
 
+    def test_asdict_has_only_public_fields(self):
+        listing = _make_listing("Beta", skills=["code"])
+        listing.to_dict()  # fills the snapshot caches
+        d = dataclasses.asdict(listing)
+        assert "completion_rate" not in d
+        assert not any(name.startswith("_") for name in d)
+
+    def test_completion_rate_is_read_only(self):
+        listing = _make_listing("Beta")
+        with pytest.raises(AttributeError):
+            listing.completion_rate = 0.5
+
+    def test_to_dict_is_a_copy_without_private_fields(self):
+        listing = _make_listing("Beta", skills=["code"])
+        d = listing.to_dict()
+        assert "_skills_lower" not in d
+        d["skills"].append("design")
+        assert listing.skills == ["code"]
+
+    def test_listing_uses_slots(self):
+        assert not hasattr(_make_listing(), "__dict__")
+
     def test_registered_at_auto(self):
         listing = AgentListing()
         assert listing.registered_at > 0
@@ -712,10 +741,9 @@ class TestHiringManager:
 
 
 @pytest.fixture
-def api_client():
+def api_client(marketplace_client, monkeypatch):
     """Create a test client with marketplace routes mounted."""
     import src.api.marketplace_routes as routes_mod
-    from fastapi import FastAPI
 
     # Create fresh state for each test
     fresh_marketplace = MarketplaceRegistry()
@@ -730,27 +758,13 @@ def api_client():
         budget_tracker=fresh_budget,
     )
 
-    # Patch module-level singletons
-    old_marketplace = routes_mod.marketplace
-    old_escrow = routes_mod._escrow
-    old_budget = routes_mod._budget
-    old_hiring = routes_mod._hiring_manager
-
-    routes_mod.marketplace = fresh_marketplace
-    routes_mod._escrow = fresh_escrow
-    routes_mod._budget = fresh_budget
-    routes_mod._hiring_manager = fresh_hiring
-
-    app = FastAPI()
-    app.include_router(routes_mod.router)
-    client = TestClient(app)
-    yield client
-
-    # Restore originals
-    routes_mod.marketplace = old_marketplace
-    routes_mod._escrow = old_escrow
-    routes_mod._budget = old_budget
-    routes_mod._hiring_manager = old_hiring
+    # Patch module-level singletons; monkeypatch restores them afterwards.
+    monkeypatch.setattr(routes_mod, "marketplace", fresh_marketplace)
+    monkeypatch.setattr(routes_mod, "_escrow", fresh_escrow)
+    monkeypatch.setattr(routes_mod, "_budget", fresh_budget)
+    monkeypatch.setattr(routes_mod, "_hiring_manager", fresh_hiring)
+
+    return marketplace_client
 
 
 class TestMarketplaceAPI:
@@ -78,6 +78,26 @@ class TestRegistryEdgeCases:
         assert reg.count() == 1
         assert reg.get_agent("same-id").name == "Agent2"
 
+    def test_overwrite_reindexes_skills(self):
+        reg = MarketplaceRegistry()
+        reg.register_agent(_make_listing("Agent1", ["code"], agent_id="same-id"))
+        reg.register_agent(_make_listing("Agent2", ["design"], agent_id="same-id"))
+        assert reg.discover_agents("code") == []
+        assert [a.name for a in reg.discover_agents("design")] == ["Agent2"]
+
+    def test_reassigned_skills_used_for_discovery(self):
+        reg = MarketplaceRegistry()
+        listing = reg.register_agent(_make_listing("Agent1", ["code"]))
+        listing.skills = ["design"]
+        assert reg.discover_agents("code") == []
+        assert reg.discover_agents("design") == [listing]
+
+    def test_unregister_drops_from_discovery(self):
+        reg = MarketplaceRegistry()
+        reg.register_agent(_make_listing("Agent1", ["code"], agent_id="gone"))
+        reg.unregister_agent("gone")
+        assert reg.discover_agents("code") == []
+
     def test_discover_case_insensitive(self):
         reg = MarketplaceRegistry()
         reg.register_agent(_make_listing("Coder", ["Python"]))
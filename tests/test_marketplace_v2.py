@@ -13,8 +13,9 @@ Covers:
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
-from fastapi.testclient import TestClient
 
 from src.marketplace import (
     AgentListing,
@@ -67,13 +68,24 @@ def _make_listing(
     return listing
 
 
-def _seeded_registry() -> MarketplaceRegistry:
+# (name, skills, price, rating) of the seeded registry's agents
+_SEEDED_SPEC = (
+    ("Coder", ("code", "python", "testing"), 0.02, 4.5),
+    ("Designer", ("design", "ui", "ux"), 0.05, 4.8),
+    ("Researcher", ("research", "analysis"), 0.01, 4.2),
+    ("DevOps", ("deployment", "docker"), 0.03, 3.9),
+    ("Writer", ("writing", "docs"), 0.00, 4.0),
+)
+
+
+@pytest.fixture(scope="module")
+def seeded_registry() -> MarketplaceRegistry:
+    """Five seeded agents, shared by the module; tests must not modify it."""
     reg = MarketplaceRegistry()
-    reg.register_agent(_make_listing("Coder", ["code", "python", "testing"], 0.02, 4.5))
-    reg.register_agent(_make_listing("Designer", ["design", "ui", "ux"], 0.05, 4.8))
-    reg.register_agent(_make_listing("Researcher", ["research", "analysis"], 0.01, 4.2))
-    reg.register_agent(_make_listing("DevOps", ["deployment", "docker"], 0.03, 3.9))
-    reg.register_agent(_make_listing("Writer", ["writing", "docs"], 0.00, 4.0))
+    reg.register_agents([
+        _make_listing(name, list(skills), price, rating)
+        for name, skills, price, rating in _SEEDED_SPEC
+    ])
     return reg
 
 
@@ -106,6 +118,15 @@ class TestAgentReputation:
         listing = AgentListing(total_jobs=5, completed_jobs=0, failed_jobs=5)
         assert listing.completion_rate == 0.0
 
+    def test_completion_rate_follows_job_counts(self):
+        listing = AgentListing(total_jobs=2, completed_jobs=1)
+        listing.completed_jobs += 1
+        assert listing.completion_rate == 1.0
+        listing.total_jobs += 2
+        assert listing.completion_rate == 0.5
+        listing.total_jobs = 0
+        assert listing.completion_rate == 0.0
+
     def test_to_dict_includes_completion_rate(self):
         listing = AgentListing(total_jobs=4, completed_jobs=3, failed_jobs=1)
         d = listing.to_dict()
@@ -131,7 +152,7 @@ class TestRegistryReputation:
         assert reg.record_job_completion("a1", success=True, earnings=0.05) is True
         assert listing.total_jobs == 1
         assert listing.completed_jobs == 1
-        assert listing.total_earnings == pytest.approx(0.05)
+        assert listing.total_earnings == 0.05
 
     def test_record_job_completion_failure(self):
         reg = MarketplaceRegistry()
@@ -218,25 +239,74 @@ class TestRegistryReputation:
         reg.register_agent(_make_listing("A3", agent_id="a3", availability="available"))
         available = reg.list_available()
         assert len(available) == 2
+        reg.set_availability("a3", "offline")
+        reg.set_availability("a2", "available")
+        reg.unregister_agent("a1")
+        assert [a.agent_id for a in reg.list_available()] == ["a2"]
+        reg.register_agent(_make_listing("A1", agent_id="a1", availability="available"))
+        reg.set_availability("a3", "available")
+        assert [a.agent_id for a in reg.list_available()] == ["a2", "a3", "a1"]
 
-    def test_sort_by_price(self):
-        reg = _seeded_registry()
+    def test_list_available_follows_direct_assignment(self):
+        reg = MarketplaceRegistry()
+        listing = reg.register_agent(_make_listing("A1", agent_id="a1", availability="available"))
+        listing.availability = "busy"
+        assert reg.list_available() == []
+        listing.availability = "available"
+        assert reg.list_available() == [listing]
+
+    def test_sort_by_price(self, seeded_registry):
+        reg = seeded_registry
         sorted_agents = reg.sort_by_price(ascending=True)
         prices = [a.price_per_unit for a in sorted_agents]
         assert prices == sorted(prices)
 
-    def test_sort_by_price_descending(self):
-        reg = _seeded_registry()
+    def test_sort_by_price_descending(self, seeded_registry):
+        reg = seeded_registry
         sorted_agents = reg.sort_by_price(ascending=False)
         prices = [a.price_per_unit for a in sorted_agents]
         assert prices == sorted(prices, reverse=True)
 
-    def test_sort_by_rating(self):
-        reg = _seeded_registry()
+    def test_sort_by_rating(self, seeded_registry):
+        reg = seeded_registry
         sorted_agents = reg.sort_by_rating()
         ratings = [a.rating for a in sorted_agents]
         assert ratings == sorted(ratings, reverse=True)
 
+    def test_sort_orders_track_updates(self):
+        reg = MarketplaceRegistry()
+        for i, (price, rating) in enumerate([(0.02, 4.0), (0.01, 4.5), (0.02, 3.0), (0.05, 4.0)]):
+            reg.register_agent(_make_listing(f"A{i}", price=price, rating=rating, agent_id=f"a{i}"))
+        reg.update_agent_rating("a2", 5.0)
+        reg.get_agent("a3").price_per_unit = 0.0  # changed outside the registry
+        reg.unregister_agent("a1")
+        reg.register_agent(_make_listing("A0", price=0.02, rating=4.2, agent_id="a0"))
+
+        listings = reg.list_all()
+        assert reg.sort_by_price() == sorted(listings, key=lambda a: a.price_per_unit)
+        assert reg.sort_by_price(ascending=False) == sorted(
+            listings, key=lambda a: a.price_per_unit, reverse=True
+        )
+        assert reg.sort_by_rating() == sorted(listings, key=lambda a: a.rating, reverse=True)
+
+    def test_register_agents_matches_one_by_one(self):
+        specs = [("A", 0.02, 4.0), ("B", 0.01, 4.5), ("C", 0.02, 3.0), ("A", 0.05, 4.9)]
+        bulk, single = MarketplaceRegistry(), MarketplaceRegistry()
+        bulk.register_agent(_make_listing("Old", price=1.0, agent_id="id-C"))
+        single.register_agent(_make_listing("Old", price=1.0, agent_id="id-C"))
+        ids = bulk.register_agents([
+            _make_listing(n, price=p, rating=r, agent_id=f"id-{n}") for n, p, r in specs
+        ])
+        for n, p, r in specs:
+            single.register_agent(_make_listing(n, price=p, rating=r, agent_id=f"id-{n}"))
+        assert ids == ["id-A", "id-B", "id-C", "id-A"]
+        assert bulk.count() == 3
+        for reg_sort in ("sort_by_price", "sort_by_rating"):
+            assert [a.agent_id for a in getattr(bulk, reg_sort)()] == [
+                a.agent_id for a in getattr(single, reg_sort)()
+            ]
+        assert [a.agent_id for a in bulk.discover_agents("code")] == ["id-C", "id-A", "id-B"]
+
     def test_get_reputation(self):
         reg = MarketplaceRegistry()
         listing = _make_listing("Agent1", agent_id="a1", rating=4.5)
@@ -253,6 +323,19 @@ class TestRegistryReputation:
         assert rep["completion_rate"] == pytest.approx(0.8)
         assert rep["total_earnings"] == 1.5
 
+    def test_reputation_and_to_dict_follow_updates(self):
+        reg = MarketplaceRegistry()
+        listing = reg.register_agent(_make_listing("Agent1", agent_id="a1"))
+        reg.get_reputation("a1")["total_jobs"] = 99
+        assert reg.get_reputation("a1")["total_jobs"] == 0
+        listing.to_dict()
+        reg.record_job_completion("a1", success=True, earnings=0.5)
+        reg.set_availability("a1", "busy")
+        rep = reg.get_reputation("a1")
+        assert (rep["total_jobs"], rep["total_earnings"], rep["availability"]) == (1, 0.5, "busy")
+        d = listing.to_dict()
+        assert (d["completed_jobs"], d["completion_rate"], d["availability"]) == (1, 1.0, "busy")
+
     def test_get_reputation_not_found(self):
         reg = MarketplaceRegistry()
         assert reg.get_reputation("nope") is None
@@ -290,7 +373,8 @@ class TestPaymentLedger:
         ledger.record("escrow_hold", amount=0.02)
         ledger.record("payment_request", amount=0.03)
         results = ledger.get_entries(event_type="payment_request")
-        assert len(results) == 2
+        assert [e.amount for e in results] == [0.01, 0.03]
+        assert ledger.get_entries(event_type="escrow_refund") == []
 
     def test_filter_by_agent_id(self):
         ledger = PaymentLedger()
@@ -312,13 +396,23 @@ class TestPaymentLedger:
         ledger = PaymentLedger()
         ledger.record("a", amount=0.05)
         ledger.record("b", amount=0.10)
-        assert ledger.total_volume() == pytest.approx(0.15)
+        assert ledger.total_volume() == 0.15
+        ledger.clear()
+        assert ledger.total_volume() == 0.0
 
     def test_clear(self):
         ledger = PaymentLedger()
         ledger.record("a")
         ledger.clear()
         assert ledger.count() == 0
+        assert ledger.get_entries(event_type="a") == []
+        assert ledger.get_entries(agent_id="") == []
+
+    @pytest.mark.parametrize(
+        "cls", [LedgerEntry, EscrowEntry, PaymentProof, HireRequest, HireResult]
+    )
+    def test_records_use_slots(self, cls):
+        assert not hasattr(cls.__new__(cls), "__dict__")
 
     def test_ledger_entry_to_dict(self):
         entry = LedgerEntry(
@@ -332,6 +426,12 @@ class TestPaymentLedger:
         assert d["event_type"] == "escrow_hold"
         assert d["payer"] == "ceo"
         assert d["amount"] == 0.05
+        assert list(d) == [f.name for f in dataclasses.fields(LedgerEntry)]
+
+    def test_ledger_entry_to_dict_copies_metadata(self):
+        entry = LedgerEntry(metadata={"tags": ["a"]})
+        entry.to_dict()["metadata"]["tags"].append("b")
+        assert entry.metadata == {"tags": ["a"]}
 
     def test_combined_filters(self):
         ledger = PaymentLedger()
@@ -340,6 +440,13 @@ class TestPaymentLedger:
         ledger.record("escrow_hold", payer="agent2", task_id="t2")
         results = ledger.get_entries(event_type="escrow_hold", agent_id="agent1")
         assert len(results) == 1
+        assert ledger.get_entries(event_type="escrow_hold", agent_id="agent1", task_id="t2") == []
+        assert len(ledger.get_entries(agent_id="agent1", task_id="t1")) == 2
+
+    def test_self_payment_listed_once(self):
+        ledger = PaymentLedger()
+        ledger.record("escrow_hold", payer="agent1", payee="agent1")
+        assert len(ledger.get_entries(agent_id="agent1")) == 1
 
 
 # ===================================================================
@@ -365,7 +472,7 @@ class TestPaymentManager:
         pm = self._make_manager()
         proof = PaymentProof(payer="0xP", payee="0xPayee", amount=0.01)
         assert pm.verify_payment(proof) is True
-        assert pm.get_balance("0xPayee") == pytest.approx(0.01)
+        assert pm.get_balance("0xPayee") == 0.01
         entries = pm.ledger.get_entries(event_type="payment_verified")
         assert len(entries) == 1
 
@@ -385,7 +492,7 @@ class TestPaymentManager:
         released = pm.release_escrow(entry.escrow_id)
         assert released is not None
         assert released.status == "released"
-        assert pm.get_balance("builder") == pytest.approx(0.05)
+        assert pm.get_balance("builder") == 0.05
         assert pm.ledger.count() == 2  # + escrow_release
 
     def test_hold_and_refund_escrow(self):
@@ -394,7 +501,7 @@ class TestPaymentManager:
         refunded = pm.refund_escrow(entry.escrow_id)
         assert refunded is not None
         assert refunded.status == "refunded"
-        assert pm.get_balance("ceo") == pytest.approx(0.05)
+        assert pm.get_balance("ceo") == 0.05
         assert pm.ledger.count() == 2
 
     def test_release_nonexistent_escrow(self):
@@ -410,21 +517,37 @@ class TestPaymentManager:
         pm.credit("a1", 0.10)
         pm.credit("a2", 0.20)
         balances = pm.get_all_balances()
-        assert balances["a1"] == pytest.approx(0.10)
-        assert balances["a2"] == pytest.approx(0.20)
+        assert balances["a1"] == 0.10
+        assert balances["a2"] == 0.20
+        balances["a1"] = 5.0
+        assert pm.get_balance("a1") == 0.10  # a copy, not the manager's state
+
+    def test_sub_micro_amount_rounds_to_nearest_unit(self):
+        pm = self._make_manager()
+        assert pm.credit("a1", 0.0000001) == 0.0
+        assert pm.credit("a1", 0.0000007) == 0.000001
+        assert pm.debit("a1", 0.0000001) is True
+
+    def test_many_small_credits_sum_exactly(self):
+        pm = self._make_manager()
+        for _ in range(1000):
+            pm.credit("a1", 0.001)
+        assert pm.get_balance("a1") == 1.0
+        assert pm.debit("a1", 1.0) is True
+        assert pm.get_balance("a1") == 0.0
 
     def test_credit_and_debit(self):
         pm = self._make_manager()
         pm.credit("agent1", 1.00)
-        assert pm.get_balance("agent1") == pytest.approx(1.00)
+        assert pm.get_balance("agent1") == 1.00
         assert pm.debit("agent1", 0.30) is True
-        assert pm.get_balance("agent1") == pytest.approx(0.70)
+        assert pm.get_balance("agent1") == 0.70
 
     def test_debit_insufficient(self):
         pm = self._make_manager()
         pm.credit("agent1", 0.10)
         assert pm.debit("agent1", 0.50) is False
-        assert pm.get_balance("agent1") == pytest.approx(0.10)
+        assert pm.get_balance("agent1") == 0.10
 
     def test_debit_zero_balance(self):
         pm = self._make_manager()
@@ -436,8 +559,8 @@ class TestPaymentManager:
         e2 = pm.hold_escrow("ceo", "a2", 0.10, "t2")
         pm.release_escrow(e1.escrow_id)
         pm.refund_escrow(e2.escrow_id)
-        assert pm.get_balance("a1") == pytest.approx(0.05)
-        assert pm.get_balance("ceo") == pytest.approx(0.10)
+        assert pm.get_balance("a1") == 0.05
+        assert pm.get_balance("ceo") == 0.10
         assert pm.ledger.count() == 4  # 2 holds + 1 release + 1 refund
 
 
@@ -447,10 +570,9 @@ class TestPaymentManager:
 
 
 @pytest.fixture
-def api_client():
-    """Create a test client with marketplace routes mounted."""
+def api_client(marketplace_client, monkeypatch):
+    """Test client with fresh marketplace and payment state patched in."""
     import src.api.marketplace_routes as routes_mod
-    from fastapi import FastAPI
 
     # Create fresh state
     fresh_marketplace = MarketplaceRegistry()
@@ -472,31 +594,15 @@ def api_client():
         ledger=PaymentLedger(),
     )
 
-    # Patch module-level singletons
-    old = {
-        "marketplace": routes_mod.marketplace,
-        "_escrow": routes_mod._escrow,
-        "_budget": routes_mod._budget,
-        "_hiring_manager": routes_mod._hiring_manager,
-        "_payment_gate": routes_mod._payment_gate,
-        "_payment_manager": routes_mod._payment_manager,
-    }
-
-    routes_mod.marketplace = fresh_marketplace
-    routes_mod._escrow = fresh_escrow
-    routes_mod._budget = fresh_budget
-    routes_mod._hiring_manager = fresh_hiring
-    routes_mod._payment_gate = fresh_gate
-    routes_mod._payment_manager = fresh_payment_manager
-
-    app = FastAPI()
-    app.include_router(routes_mod.router)
-    client = TestClient(app)
-    yield client
-
-    # Restore originals
-    for k, v in old.items():
-        setattr(routes_mod, k, v)
+    # Patch module-level singletons; monkeypatch restores them afterwards.
+    monkeypatch.setattr(routes_mod, "marketplace", fresh_marketplace)
+    monkeypatch.setattr(routes_mod, "_escrow", fresh_escrow)
+    monkeypatch.setattr(routes_mod, "_budget", fresh_budget)
+    monkeypatch.setattr(routes_mod, "_hiring_manager", fresh_hiring)
+    monkeypatch.setattr(routes_mod, "_payment_gate", fresh_gate)
+    monkeypatch.setattr(routes_mod, "_payment_manager", fresh_payment_manager)
+
+    return marketplace_client
 
 
 class TestMarketplaceAPIv2:
@@ -622,6 +728,12 @@ class TestPaymentAPIEndpoints:
         assert data["error"] == "Payment Required"
         assert len(data["accepts"]) == 1
 
+    def test_payment_request_sub_micro_amount(self, api_client):
+        resp = api_client.post("/payments/request", json={
+            "resource": "/marketplace/hire", "amount": 1e-7, "payee": "agent1",
+        })
+        assert resp.status_code == 402
+
     def test_payment_request_missing_fields(self, api_client):
         resp = api_client.post("/payments/request", json={})
         assert resp.status_code == 422
@@ -640,6 +752,13 @@ class TestPaymentAPIEndpoints:
         assert data["verified"] is True
         assert data["amount"] == 0.01
 
+    def test_payment_verify_sub_micro_amount(self, api_client):
+        resp = api_client.post("/payments/verify", json={
+            "payer": "0xPayer", "payee": "0xTest", "amount": 1e-7, "tx_hash": "0xabc",
+        })
+        assert resp.status_code == 200
+        assert resp.json()["amount"] == 1e-7
+
     def test_payment_verify_wrong_payee(self, api_client):
         resp = api_client.post("/payments/verify", json={
             "payer": "0xPayer",
@@ -650,30 +769,8 @@ class TestPaymentAPIEndpoints:
         data = resp.json()
         assert data["verified"] is False
 
-    # -- Balance --
-
-    def test_balance_default_zero(self, api_client):
-        resp = api_client.get("/payments/balance/unknown-agent")
-        assert resp.status_code == 200
-        assert resp.json()["balance"] == 0.0
-
-    def test_balance_after_verified_payment(self, api_client):
-        api_client.post("/payments/verify", json={
-            "payer": "0xP",
-            "payee": "0xTest",
-            "amount": 0.50,
-        })
-        resp = api_client.get("/payments/balance/0xTest")
-        assert resp.status_code == 200
-        assert resp.json()["balance"] == pytest.approx(0.50)
-
     # -- Ledger --
 
-    def test_ledger_empty(self, api_client):
-        resp = api_client.get("/payments/ledger")
-        assert resp.status_code == 200
-        assert resp.json() == []
-
     def test_ledger_after_request_and_verify(self, api_client):
         api_client.post("/payments/request", json={
             "resource": "/test",
@@ -708,6 +805,31 @@ class TestPaymentAPIEndpoints:
         assert all(e["event_type"] == "payment_request" for e in data)
 
 
+@pytest.fixture
+def payment_manager():
+    """PaymentManager configured like the one api_client patches in."""
+    return PaymentManager(
+        gate=X402PaymentGate(PaymentConfig(pay_to="0xTest", price=0.0)),
+        escrow=AgentEscrow(),
+        ledger=PaymentLedger(),
+    )
+
+
+class TestPaymentManagerDirect:
+    """Balance and ledger reads behind the payment endpoints, without HTTP."""
+
+    def test_balance_default_zero(self, payment_manager):
+        assert payment_manager.get_balance("unknown-agent") == 0.0
+
+    def test_balance_after_verified_payment(self, payment_manager):
+        proof = PaymentProof(payer="0xP", payee="0xTest", amount=0.50)
+        assert payment_manager.verify_payment(proof) is True
+        assert payment_manager.get_balance("0xTest") == 0.50
+
+    def test_ledger_empty(self, payment_manager):
+        assert payment_manager.ledger.get_entries() == []
+
+
 # ===================================================================
 # 5. End-to-end marketplace + payment flows
 # ===================================================================
@@ -776,7 +898,7 @@ class TestEndToEndFlows:
 
         # Check balance
         bal_resp = api_client.get("/payments/balance/0xTest")
-        assert bal_resp.json()["balance"] == pytest.approx(0.25)
+        assert bal_resp.json()["balance"] == 0.25
 
     def test_jobs_list_after_multiple_hires(self, api_client):
         """Multiple hires should all appear in jobs list."""
@@ -16,22 +16,25 @@ from __future__ import annotations
 
 import json
 import pytest
-from fastapi.testclient import TestClient
 
 from src.mcp_server import (
     create_hirewire_mcp_server,
     MCP_TOOLS,
     _HANDLERS,
-    _handle_create_task,
+    _IMPLS,
     _handle_get_task,
-    _handle_list_tasks,
-    _handle_hire_agent,
     _handle_list_agents,
     _handle_marketplace_search,
-    _handle_check_budget,
-    _handle_check_payment_status,
-    _handle_pay_agent,
-    _handle_get_metrics,
+    _create_task_impl,
+    _get_task_impl,
+    _list_tasks_impl,
+    _hire_agent_impl,
+    _list_agents_impl,
+    _marketplace_search_impl,
+    _check_budget_impl,
+    _check_payment_status_impl,
+    _pay_agent_impl,
+    _get_metrics_impl,
 )
 from src.integrations.mcp_tools import (
     HIREWIRE_SDK_TOOLS,
@@ -47,11 +50,8 @@ from src.integrations.mcp_tools import (
     check_budget_tool,
     agent_metrics_tool,
     x402_payment_tool,
-    create_hirewire_mcp_agent,
-    create_mcp_server,
 )
-from src.agents._mock_client import MockChatClient
-from src.api.main import app
+from src.mcp_servers.payment_hub import ledger
 
 
 # ---------------------------------------------------------------------------
@@ -59,10 +59,12 @@ from src.api.main import app
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def client():
-    """FastAPI test client."""
-    return TestClient(app)
+@pytest.fixture(autouse=True)
+def _clean_ledger():
+    """Reset the payment ledger between tests (storage is reset in conftest)."""
+    ledger.clear()
+    yield
+    ledger.clear()
 
 
 @pytest.fixture
@@ -83,10 +85,27 @@ def _seed_task():
     return task_id
 
 
+@pytest.fixture
+def _seed_many_tasks():
+    """Seed ten tasks in one batch, alternating pending and completed."""
+    from src.storage import get_storage
+    tasks = [
+        {
+            "task_id": f"test_mcp_task_{i:03d}",
+            "description": f"Seeded task {i}",
+            "workflow": "ceo",
+            "budget_usd": 1.0,
+            "status": "pending" if i % 2 else "completed",
+        }
+        for i in range(10)
+    ]
+    get_storage().save_tasks(tasks)
+    return [t["task_id"] for t in tasks]
+
+
 @pytest.fixture
 def _seed_budget():
     """Seed a budget allocation."""
-    from src.mcp_servers.payment_hub import ledger
     ledger.allocate_budget("test_budget_task", 10.0)
     return "test_budget_task"
 
@@ -94,7 +113,6 @@ def _seed_budget():
 @pytest.fixture
 def _seed_payment():
     """Seed a payment transaction."""
-    from src.mcp_servers.payment_hub import ledger
     ledger.allocate_budget("test_pay_task", 20.0)
     ledger.record_payment(
         from_agent="ceo",
@@ -110,40 +128,58 @@ def _seed_payment():
 # ===================================================================
 
 
+@pytest.fixture(scope="module")
+def mcp_server():
+    """One MCP server for the read-only creation tests."""
+    return create_hirewire_mcp_server()
+
+
+# Names of the tools the server and the SDK expose, computed once at import.
+_MCP_TOOL_NAMES = frozenset(t.name for t in MCP_TOOLS)
+_EXPECTED_TOOL_NAMES = frozenset({
+    "create_task", "get_task", "list_tasks", "hire_agent",
+    "list_agents", "marketplace_search", "check_budget",
+    "check_payment_status", "pay_agent", "get_metrics",
+})
+_SDK_TOOL_NAMES = frozenset(t["name"] for t in get_mcp_tool_info())
+
+
 class TestMCPServerCreation:
-    def test_create_server(self):
-        server = create_hirewire_mcp_server()
-        assert server is not None
+    def test_create_server(self, mcp_server):
+        assert mcp_server is not None
 
-    def test_server_name(self):
-        server = create_hirewire_mcp_server()
-        assert server.name == "hirewire"
+    def test_server_name(self, mcp_server):
+        assert mcp_server.name == "hirewire"
 
     def test_mcp_tools_defined(self):
         assert len(MCP_TOOLS) == 10
 
     def test_tool_names(self):
-        names = {t.name for t in MCP_TOOLS}
-        expected = {
-            "create_task", "get_task", "list_tasks", "hire_agent",
-            "list_agents", "marketplace_search", "check_budget",
-            "check_payment_status", "pay_agent", "get_metrics",
-        }
-        assert names == expected
+        assert _MCP_TOOL_NAMES == _EXPECTED_TOOL_NAMES
 
-    def test_all_tools_have_descriptions(self):
-        for t in MCP_TOOLS:
-            assert t.description, f"Tool {t.name} has no description"
+    @pytest.mark.parametrize("tool", MCP_TOOLS, ids=lambda t: t.name)
+    def test_tool_has_description(self, tool):
+        assert tool.description
 
-    def test_all_tools_have_input_schemas(self):
-        for t in MCP_TOOLS:
-            assert t.inputSchema is not None
-            assert t.inputSchema.get("type") == "object"
+    @pytest.mark.parametrize("tool", MCP_TOOLS, ids=lambda t: t.name)
+    def test_tool_has_input_schema(self, tool):
+        assert tool.inputSchema is not None
+        assert tool.inputSchema.get("type") == "object"
 
     def test_handlers_registered(self):
         assert len(_HANDLERS) == 10
-        for t in MCP_TOOLS:
-            assert t.name in _HANDLERS, f"No handler for tool: {t.name}"
+
+    @pytest.mark.parametrize("tool", MCP_TOOLS, ids=lambda t: t.name)
+    def test_tool_has_handler(self, tool):
+        assert tool.name in _HANDLERS
+
+    def test_impls_match_handlers(self):
+        assert _IMPLS.keys() == _HANDLERS.keys()
+
+    def test_handlers_encode_impl_result(self):
+        args = {"task_id": "does_not_exist_12345"}
+        assert json.loads(_handle_get_task(args)) == _get_task_impl(args)
+        assert json.loads(_handle_list_agents({})) == _list_agents_impl({})
 
 
 # ===================================================================
@@ -153,32 +189,32 @@ class TestMCPServerCreation:
 
 class TestCreateTask:
     def test_create_basic_task(self):
-        result = json.loads(_handle_create_task({"description": "Test task"}))
+        result = _create_task_impl({"description": "Test task"})
         assert result["task_id"].startswith("mcp_")
         assert result["description"] == "Test task"
         assert result["status"] == "pending"
         assert result["budget_usd"] == 1.0
 
     def test_create_task_with_budget(self):
-        result = json.loads(_handle_create_task({"description": "Expensive task", "budget": 50.0}))
+        result = _create_task_impl({"description": "Expensive task", "budget": 50.0})
         assert result["budget_usd"] == 50.0
 
     def test_create_task_with_workflow(self):
-        result = json.loads(_handle_create_task({
+        result = _create_task_impl({
             "description": "Custom workflow",
             "workflow": "sequential",
-        }))
+        })
         assert result["task_id"].startswith("mcp_")
 
     def test_create_task_has_timestamp(self):
-        result = json.loads(_handle_create_task({"description": "Timestamped"}))
+        result = _create_task_impl({"description": "Timestamped"})
         assert "created_at" in result
         assert result["created_at"] > 0
 
     def test_created_task_persists(self):
-        result = json.loads(_handle_create_task({"description": "Persistent task"}))
+        result = _create_task_impl({"description": "Persistent task"})
         task_id = result["task_id"]
-        fetched = json.loads(_handle_get_task({"task_id": task_id}))
+        fetched = _get_task_impl({"task_id": task_id})
         assert fetched["task_id"] == task_id
         assert fetched["description"] == "Persistent task"
 
@@ -190,16 +226,16 @@ class TestCreateTask:
 
 class TestGetTask:
     def test_get_existing_task(self, _seed_task):
-        result = json.loads(_handle_get_task({"task_id": _seed_task}))
+        result = _get_task_impl({"task_id": _seed_task})
         assert result["task_id"] == _seed_task
         assert result["description"] == "Test task for MCP server"
 
     def test_get_nonexistent_task(self):
-        result = json.loads(_handle_get_task({"task_id": "nonexistent_task_xyz"}))
+        result = _get_task_impl({"task_id": "nonexistent_task_xyz"})
         assert "error" in result
 
     def test_get_task_fields(self, _seed_task):
-        result = json.loads(_handle_get_task({"task_id": _seed_task}))
+        result = _get_task_impl({"task_id": _seed_task})
         assert "task_id" in result
         assert "description" in result
         assert "status" in result
@@ -214,29 +250,35 @@ class TestGetTask:
 
 class TestListTasks:
     def test_list_all_tasks(self, _seed_task):
-        result = json.loads(_handle_list_tasks({"status": "all"}))
+        result = _list_tasks_impl({"status": "all"})
         assert "count" in result
         assert "tasks" in result
         assert result["count"] >= 1
 
     def test_list_pending_tasks(self, _seed_task):
-        result = json.loads(_handle_list_tasks({"status": "pending"}))
+        result = _list_tasks_impl({"status": "pending"})
         assert result["count"] >= 1
         for t in result["tasks"]:
             assert t["status"] == "pending"
 
     def test_list_completed_tasks(self):
-        result = json.loads(_handle_list_tasks({"status": "completed"}))
+        result = _list_tasks_impl({"status": "completed"})
         assert result["count"] >= 0
         for t in result["tasks"]:
             assert t["status"] == "completed"
 
+    def test_list_filters_seeded_batch(self, _seed_many_tasks):
+        assert _list_tasks_impl({"status": "all"})["count"] == 10
+        result = _list_tasks_impl({"status": "completed"})
+        assert result["count"] == 5
+        assert all(t["status"] == "completed" for t in result["tasks"])
+
     def test_list_default_all(self):
-        result = json.loads(_handle_list_tasks({}))
+        result = _list_tasks_impl({})
         assert "count" in result
 
     def test_task_fields_in_list(self, _seed_task):
-        result = json.loads(_handle_list_tasks({"status": "all"}))
+        result = _list_tasks_impl({"status": "all"})
         if result["tasks"]:
             task = result["tasks"][0]
             assert "task_id" in task
@@ -252,35 +294,35 @@ class TestListTasks:
 
 class TestHireAgent:
     def test_hire_basic(self):
-        result = json.loads(_handle_hire_agent({
+        result = _hire_agent_impl({
             "description": "Build a landing page",
             "required_skills": ["code"],
             "budget": 5.0,
-        }))
+        })
         assert result["status"] in ("completed", "hired", "no_agents")
         assert "task_id" in result
 
     def test_hire_with_skills(self):
-        result = json.loads(_handle_hire_agent({
+        result = _hire_agent_impl({
             "description": "Research market trends",
             "required_skills": ["search", "analysis"],
             "budget": 3.0,
-        }))
+        })
         assert "task_id" in result
 
     def test_hire_no_skills(self):
-        result = json.loads(_handle_hire_agent({
+        result = _hire_agent_impl({
             "description": "General task",
             "budget": 2.0,
-        }))
+        })
         assert "task_id" in result
 
     def test_hire_very_low_budget(self):
-        result = json.loads(_handle_hire_agent({
+        result = _hire_agent_impl({
             "description": "Cheap task",
             "required_skills": ["code"],
             "budget": 0.001,
-        }))
+        })
         assert "status" in result
 
 
@@ -291,17 +333,37 @@ class TestHireAgent:
 
 class TestListAgents:
     def test_list_agents(self):
-        result = json.loads(_handle_list_agents({}))
+        result = _list_agents_impl({})
         assert isinstance(result, list)
         assert len(result) >= 1
 
     def test_agents_have_fields(self):
-        result = json.loads(_handle_list_agents({}))
+        result = _list_agents_impl({})
         for agent in result:
             assert "name" in agent
             assert "description" in agent
             assert "skills" in agent
 
+    def test_results_follow_registry_changes(self):
+        from src.mcp_servers.registry_server import AgentCard, registry
+
+        before = _handle_list_agents({})
+        assert _handle_list_agents({}) == before
+        assert json.loads(_handle_marketplace_search({"query": "zyxcache"}))["count"] == 0
+
+        baseline = registry.snapshot()
+        probe = AgentCard(name="cache-probe", description="probe", skills=["zyxcache"])
+        registry.restore({**baseline, probe.name: probe})
+        try:
+            names = [a["name"] for a in json.loads(_handle_list_agents({}))]
+            assert "cache-probe" in names
+            assert json.loads(_handle_marketplace_search({"query": "zyxcache"}))["count"] == 1
+        finally:
+            registry.restore(baseline)
+
+        assert _handle_list_agents({}) == before
+        assert json.loads(_handle_marketplace_search({"query": "zyxcache"}))["count"] == 0
+
 
 # ===================================================================
 # 7. marketplace_search handler
@@ -310,23 +372,23 @@ class TestListAgents:
 
 class TestMarketplaceSearch:
     def test_search_by_skill(self):
-        result = json.loads(_handle_marketplace_search({"query": "code"}))
+        result = _marketplace_search_impl({"query": "code"})
         assert "count" in result
         assert "agents" in result
 
     def test_search_by_design(self):
-        result = json.loads(_handle_marketplace_search({"query": "design"}))
+        result = _marketplace_search_impl({"query": "design"})
         assert "count" in result
 
     def test_search_with_max_price(self):
-        result = json.loads(_handle_marketplace_search({
+        result = _marketplace_search_impl({
             "query": "code",
             "max_price": 0.001,
-        }))
+        })
         assert "count" in result
 
     def test_search_no_results(self):
-        result = json.loads(_handle_marketplace_search({"query": "quantum_teleportation_xyz"}))
+        result = _marketplace_search_impl({"query": "quantum_teleportation_xyz"})
         assert result["count"] == 0
 
 
@@ -337,12 +399,12 @@ class TestMarketplaceSearch:
 
 class TestCheckBudget:
     def test_check_existing_budget(self, _seed_budget):
-        result = json.loads(_handle_check_budget({"task_id": _seed_budget}))
+        result = _check_budget_impl({"task_id": _seed_budget})
         assert result["allocated"] == 10.0
         assert result["remaining"] == 10.0
 
     def test_check_nonexistent_budget(self):
-        result = json.loads(_handle_check_budget({"task_id": "no_budget_task"}))
+        result = _check_budget_impl({"task_id": "no_budget_task"})
         assert "error" in result
 
 
@@ -353,17 +415,17 @@ class TestCheckBudget:
 
 class TestCheckPaymentStatus:
     def test_check_with_payment(self, _seed_payment):
-        result = json.loads(_handle_check_payment_status({"task_id": _seed_payment}))
+        result = _check_payment_status_impl({"task_id": _seed_payment})
         assert result["task_id"] == _seed_payment
         assert result["transaction_count"] >= 1
         assert len(result["transactions"]) >= 1
 
     def test_check_no_payments(self):
-        result = json.loads(_handle_check_payment_status({"task_id": "empty_task"}))
+        result = _check_payment_status_impl({"task_id": "empty_task"})
         assert result["transaction_count"] == 0
 
     def test_payment_fields(self, _seed_payment):
-        result = json.loads(_handle_check_payment_status({"task_id": _seed_payment}))
+        result = _check_payment_status_impl({"task_id": _seed_payment})
         tx = result["transactions"][0]
         assert "tx_id" in tx
         assert "from_agent" in tx
@@ -379,22 +441,22 @@ class TestCheckPaymentStatus:
 
 class TestPayAgent:
     def test_pay_basic(self):
-        result = json.loads(_handle_pay_agent({
+        result = _pay_agent_impl({
             "to_agent": "builder",
             "amount": 0.5,
             "task_id": "pay_test_001",
-        }))
+        })
         assert result["status"] == "completed"
         assert result["amount_usdc"] == 0.5
         assert result["to_agent"] == "builder"
         assert "tx_id" in result
 
     def test_pay_external_agent(self):
-        result = json.loads(_handle_pay_agent({
+        result = _pay_agent_impl({
             "to_agent": "designer-ext-001",
             "amount": 0.05,
             "task_id": "pay_test_002",
-        }))
+        })
         assert result["status"] == "completed"
         assert result["network"] == "eip155:8453"
 
@@ -406,15 +468,15 @@ class TestPayAgent:
 
 class TestGetMetrics:
     def test_system_metrics(self):
-        result = json.loads(_handle_get_metrics({"agent_name": "all"}))
+        result = _get_metrics_impl({"agent_name": "all"})
         assert isinstance(result, dict)
 
     def test_agent_metrics(self):
-        result = json.loads(_handle_get_metrics({"agent_name": "builder"}))
+        result = _get_metrics_impl({"agent_name": "builder"})
         assert isinstance(result, dict)
 
     def test_default_all(self):
-        result = json.loads(_handle_get_metrics({}))
+        result = _get_metrics_impl({})
         assert isinstance(result, dict)
 
 
@@ -424,24 +486,24 @@ class TestGetMetrics:
 
 
 class TestMCPToolsEndpoint:
-    def test_list_tools(self, client):
-        resp = client.get("/mcp/tools")
+    def test_list_tools(self, app_client):
+        resp = app_client.get("/mcp/tools")
         assert resp.status_code == 200
         data = resp.json()
         assert data["server"] == "hirewire"
         assert data["tool_count"] == 10
         assert len(data["tools"]) == 10
 
-    def test_tool_schema(self, client):
-        resp = client.get("/mcp/tools")
+    def test_tool_schema(self, app_client):
+        resp = app_client.get("/mcp/tools")
         tools = resp.json()["tools"]
         for t in tools:
             assert "name" in t
             assert "description" in t
             assert "inputSchema" in t
 
-    def test_tool_names_in_response(self, client):
-        resp = client.get("/mcp/tools")
+    def test_tool_names_in_response(self, app_client):
+        resp = app_client.get("/mcp/tools")
         names = {t["name"] for t in resp.json()["tools"]}
         assert "create_task" in names
         assert "hire_agent" in names
@@ -455,8 +517,8 @@ class TestMCPToolsEndpoint:
 
 
 class TestMCPInvokeEndpoint:
-    def test_invoke_create_task(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_create_task(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "create_task",
             "arguments": {"description": "API-created task", "budget": 2.0},
         })
@@ -465,8 +527,8 @@ class TestMCPInvokeEndpoint:
         assert data["tool"] == "create_task"
         assert data["result"]["status"] == "pending"
 
-    def test_invoke_list_tasks(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_list_tasks(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "list_tasks",
             "arguments": {"status": "all"},
         })
@@ -474,34 +536,45 @@ class TestMCPInvokeEndpoint:
         data = resp.json()
         assert "count" in data["result"]
 
-    def test_invoke_list_agents(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_list_agents(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "list_agents",
             "arguments": {},
         })
         assert resp.status_code == 200
 
-    def test_invoke_marketplace_search(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_marketplace_search(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "marketplace_search",
             "arguments": {"query": "code"},
         })
         assert resp.status_code == 200
 
-    def test_invoke_unknown_tool(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_unknown_tool(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "nonexistent_tool",
             "arguments": {},
         })
         assert resp.status_code == 404
         assert "Unknown tool" in resp.json()["detail"]
 
-    def test_invoke_missing_tool_field(self, client):
-        resp = client.post("/mcp/invoke", json={"arguments": {}})
+    def test_invoke_missing_tool_field(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={"arguments": {}})
+        assert resp.status_code == 400
+
+    @pytest.mark.parametrize("tool,arguments", [
+        ("get_task", {}),
+        ("pay_agent", {"to_agent": "builder", "amount": "lots", "task_id": "t"}),
+        ("create_task", {"description": "x", "budget": True}),
+        ("list_tasks", ["all"]),
+    ])
+    def test_invoke_rejects_malformed_arguments(self, app_client, tool, arguments):
+        resp = app_client.post("/mcp/invoke", json={"tool": tool, "arguments": arguments})
         assert resp.status_code == 400
+        assert "Invalid arguments" in resp.json()["detail"]
 
-    def test_invoke_pay_agent(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_pay_agent(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "pay_agent",
             "arguments": {"to_agent": "builder", "amount": 0.1, "task_id": "api_pay"},
         })
@@ -509,8 +582,8 @@ class TestMCPInvokeEndpoint:
         data = resp.json()
         assert data["result"]["status"] == "completed"
 
-    def test_invoke_get_metrics(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_get_metrics(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "get_metrics",
             "arguments": {"agent_name": "all"},
         })
@@ -527,14 +600,18 @@ class TestSDKMCPToolsEnhanced:
         assert len(HIREWIRE_SDK_TOOLS) == 11
 
     def test_new_tools_present(self):
-        info = get_mcp_tool_info()
-        names = [t["name"] for t in info]
-        assert "hirewire_create_task" in names
-        assert "hirewire_list_tasks" in names
-        assert "hirewire_get_task" in names
-        assert "hirewire_hire_agent" in names
-        assert "hirewire_marketplace_search" in names
-        assert "hirewire_check_payment_status" in names
+        assert _SDK_TOOL_NAMES >= {
+            "hirewire_create_task",
+            "hirewire_list_tasks",
+            "hirewire_get_task",
+            "hirewire_hire_agent",
+            "hirewire_marketplace_search",
+            "hirewire_check_payment_status",
+        }
+
+    def test_tool_info_returns_copies(self):
+        get_mcp_tool_info()[0]["name"] = "changed"
+        assert get_mcp_tool_info()[0]["name"] != "changed"
 
     def test_all_tools_have_info(self):
         info = get_mcp_tool_info()
@@ -581,12 +658,18 @@ class TestSDKMCPToolsEnhanced:
 
 class TestMCPAgentEnhanced:
     def test_create_mcp_agent(self):
+        from src.agents._mock_client import MockChatClient
+        from src.integrations.mcp_tools import create_hirewire_mcp_agent
+
         agent = create_hirewire_mcp_agent(MockChatClient())
         assert agent.name == "HireWire"
         assert "marketplace" in agent.description.lower()
         assert "hire" in agent.description.lower()
 
     def test_mcp_server_creation(self):
+        from src.agents._mock_client import MockChatClient
+        from src.integrations.mcp_tools import create_mcp_server
+
         server = create_mcp_server(MockChatClient())
         assert server is not None
 
@@ -597,60 +680,61 @@ class TestMCPAgentEnhanced:
 
 
 class TestEndToEndMCPFlow:
-    def test_full_task_lifecycle(self, client):
+    def test_full_task_lifecycle(self, app_client):
         # Step 1: Create a task
-        resp = client.post("/mcp/invoke", json={
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "create_task",
             "arguments": {"description": "E2E test task", "budget": 10.0},
         })
         assert resp.status_code == 200
         task_id = resp.json()["result"]["task_id"]
 
-        # Step 2: Get the task
-        resp = client.post("/mcp/invoke", json={
-            "tool": "get_task",
-            "arguments": {"task_id": task_id},
-        })
-        assert resp.status_code == 200
-        assert resp.json()["result"]["task_id"] == task_id
-        assert resp.json()["result"]["status"] == "pending"
-
-        # Step 3: List tasks includes our task
-        resp = client.post("/mcp/invoke", json={
-            "tool": "list_tasks",
-            "arguments": {"status": "all"},
-        })
+        # Steps 2-5 in one batch: get, list, pay, then check payment status
+        resp = app_client.post("/mcp/invoke_batch", json={"calls": [
+            {"tool": "get_task", "arguments": {"task_id": task_id}},
+            {"tool": "list_tasks", "arguments": {"status": "all"}},
+            {"tool": "pay_agent", "arguments": {"to_agent": "builder", "amount": 0.5, "task_id": task_id}},
+            {"tool": "check_payment_status", "arguments": {"task_id": task_id}},
+        ]})
         assert resp.status_code == 200
-        task_ids = [t["task_id"] for t in resp.json()["result"]["tasks"]]
-        assert task_id in task_ids
+        got, listed, paid, status = (r["result"] for r in resp.json()["results"])
+
+        assert got["task_id"] == task_id
+        assert got["status"] == "pending"
+        assert task_id in [t["task_id"] for t in listed["tasks"]]
+        assert paid["status"] == "completed"
+        assert status["transaction_count"] >= 1
+
+    def test_batch_with_unknown_tool_runs_nothing(self, app_client):
+        resp = app_client.post("/mcp/invoke_batch", json={"calls": [
+            {"tool": "pay_agent", "arguments": {"to_agent": "builder", "amount": 0.5, "task_id": "t"}},
+            {"tool": "nonexistent_tool", "arguments": {}},
+        ]})
+        assert resp.status_code == 404
+        assert ledger.get_transactions() == []
 
-        # Step 4: Pay an agent for this task
-        resp = client.post("/mcp/invoke", json={
-            "tool": "pay_agent",
-            "arguments": {"to_agent": "builder", "amount": 0.5, "task_id": task_id},
-        })
-        assert resp.status_code == 200
-        assert resp.json()["result"]["status"] == "completed"
+    def test_batch_requires_calls(self, app_client):
+        assert app_client.post("/mcp/invoke_batch", json={}).status_code == 400
+        assert app_client.post("/mcp/invoke_batch", json={"calls": ["x"]}).status_code == 400
 
-        # Step 5: Check payment status
-        resp = client.post("/mcp/invoke", json={
-            "tool": "check_payment_status",
-            "arguments": {"task_id": task_id},
-        })
-        assert resp.status_code == 200
-        payment_data = resp.json()["result"]
-        assert payment_data["transaction_count"] >= 1
+    def test_batch_with_bad_arguments_runs_nothing(self, app_client):
+        resp = app_client.post("/mcp/invoke_batch", json={"calls": [
+            {"tool": "pay_agent", "arguments": {"to_agent": "builder", "amount": 0.5, "task_id": "t"}},
+            {"tool": "get_task", "arguments": {}},
+        ]})
+        assert resp.status_code == 400
+        assert ledger.get_transactions() == []
 
-    def test_search_then_hire_flow(self, client):
+    def test_search_then_hire_flow(self, app_client):
         # Search for agents with code skills
-        resp = client.post("/mcp/invoke", json={
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "marketplace_search",
             "arguments": {"query": "code"},
         })
         assert resp.status_code == 200
 
         # Hire an agent
-        resp = client.post("/mcp/invoke", json={
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "hire_agent",
             "arguments": {
                 "description": "Build a REST API",
@@ -670,19 +754,19 @@ class TestEndToEndMCPFlow:
 
 class TestErrorHandling:
     def test_get_task_not_found(self):
-        result = json.loads(_handle_get_task({"task_id": "does_not_exist_12345"}))
+        result = _get_task_impl({"task_id": "does_not_exist_12345"})
         assert "error" in result
 
     def test_check_budget_not_found(self):
-        result = json.loads(_handle_check_budget({"task_id": "no_budget_here"}))
+        result = _check_budget_impl({"task_id": "no_budget_here"})
         assert "error" in result
 
-    def test_invoke_empty_body(self, client):
-        resp = client.post("/mcp/invoke", json={})
+    def test_invoke_empty_body(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={})
         assert resp.status_code == 400
 
-    def test_invoke_invalid_tool(self, client):
-        resp = client.post("/mcp/invoke", json={
+    def test_invoke_invalid_tool(self, app_client):
+        resp = app_client.post("/mcp/invoke", json={
             "tool": "definitely_not_a_tool",
             "arguments": {},
         })
@@ -68,18 +68,21 @@ def _clean_ledger():
 
 
 def _seed_metrics(storage, n=5, agent_id="builder", task_type="build", status="success", cost=0.25):
-    """Helper: insert n metric rows."""
-    for i in range(n):
-        storage.save_metric(
-            event_type="task_completed",
-            agent_id=agent_id,
-            task_id=f"task_{i}",
-            task_type=task_type,
-            status=status,
-            cost_usdc=cost,
-            latency_ms=100.0 + i * 10,
-            timestamp=time.time() - (n - i),
-        )
+    """Helper: insert n metric rows in one batch."""
+    now = time.time()
+    storage.save_metrics([
+        {
+            "event_type": "task_completed",
+            "agent_id": agent_id,
+            "task_id": f"task_{i}",
+            "task_type": task_type,
+            "status": status,
+            "cost_usdc": cost,
+            "latency_ms": 100.0 + i * 10,
+            "timestamp": now - (n - i),
+        }
+        for i in range(n)
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +104,18 @@ class TestMetricsCollectorStore:
         assert rows[0]["agent_id"] == "builder"
         assert rows[0]["cost_usdc"] == 0.10
 
+    def test_save_metrics_batch(self, storage):
+        written = storage.save_metrics([
+            {"event_type": "task_completed", "agent_id": "builder", "cost_usdc": 0.5},
+            {"event_type": "payment", "agent_id": "research", "metadata": {"tx": "abc"},
+             "timestamp": 1700000000.0},
+        ])
+        assert written == 2
+        assert storage.get_metrics(event_type="task_completed")[0]["cost_usdc"] == 0.5
+        payment = storage.get_metrics(event_type="payment")[0]
+        assert (payment["timestamp"], payment["metadata"]) == (1700000000.0, {"tx": "abc"})
+        assert storage.save_metrics([]) == 0
+
     def test_record_payment_stores_event(self, collector, storage):
         collector.record_payment({
             "to_agent": "builder",
@@ -243,17 +258,17 @@ class TestCostAnalyzer:
     def test_trend_analysis_detects_change(self, storage, cost_analyzer):
         now = time.time()
         # Earlier half: low cost
-        for i in range(3):
-            storage.save_metric(
-                event_type="task_completed", agent_id="a",
-                cost_usdc=0.10, timestamp=now - 2500 + i,
-            )
+        storage.save_metrics([
+            {"event_type": "task_completed", "agent_id": "a",
+             "cost_usdc": 0.10, "timestamp": now - 2500 + i}
+            for i in range(3)
+        ])
         # Recent half: high cost
-        for i in range(3):
-            storage.save_metric(
-                event_type="task_completed", agent_id="a",
-                cost_usdc=1.00, timestamp=now - 500 + i,
-            )
+        storage.save_metrics([
+            {"event_type": "task_completed", "agent_id": "a",
+             "cost_usdc": 1.00, "timestamp": now - 500 + i}
+            for i in range(3)
+        ])
         r = cost_analyzer.trend_analysis(window_seconds=3600)
         assert r["direction"] == "up"
 
@@ -309,12 +324,10 @@ class TestROICalculator:
 # ---------------------------------------------------------------------------
 
 class TestMetricsAPI:
-    @pytest.mark.asyncio
     async def test_metrics_endpoint_200(self, client):
         resp = await client.get("/metrics")
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_metrics_returns_system_data(self, client):
         resp = await client.get("/metrics")
         data = resp.json()
@@ -322,18 +335,15 @@ class TestMetricsAPI:
         assert "success_rate" in data
         assert "active_agents" in data
 
-    @pytest.mark.asyncio
     async def test_metrics_agents_endpoint_200(self, client):
         resp = await client.get("/metrics/agents")
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    @pytest.mark.asyncio
     async def test_metrics_costs_endpoint_200(self, client):
         resp = await client.get("/metrics/costs")
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_metrics_costs_structure(self, client):
         resp = await client.get("/metrics/costs")
         data = resp.json()
@@ -350,7 +360,6 @@ class TestMetricsAPI:
 # ---------------------------------------------------------------------------
 
 class TestDashboardMetricsTab:
-    @pytest.mark.asyncio
     async def test_dashboard_has_metrics_tab(self, client):
         resp = await client.get("/")
         assert resp.status_code == 200
@@ -358,13 +367,11 @@ class TestDashboardMetricsTab:
         assert "navigateTo" in html
         assert "metrics" in html.lower()
 
-    @pytest.mark.asyncio
     async def test_dashboard_has_leaderboard(self, client):
         resp = await client.get("/")
         html = resp.text
         assert "spend-by-agent-chart" in html
 
-    @pytest.mark.asyncio
     async def test_dashboard_has_roi_panel(self, client):
         resp = await client.get("/")
         html = resp.text
@@ -27,21 +27,18 @@ from src.mcp_servers.payment_hub import PaymentLedger, ledger
 class TestAnalyzeTask:
     """Test intelligent task analysis with keyword matching."""
 
-    @pytest.mark.asyncio
     async def test_research_only_task(self):
         result = await analyze_task("Search for the best Python frameworks and compare them")
         assert result["task_type"] == "research"
         assert len(result["subtasks"]) == 1
         assert result["subtasks"][0]["agent"] == "research"
 
-    @pytest.mark.asyncio
     async def test_build_only_task(self):
         result = await analyze_task("Build a REST API with FastAPI")
         assert result["task_type"] == "build"
         assert len(result["subtasks"]) == 1
         assert result["subtasks"][0]["agent"] == "builder"
 
-    @pytest.mark.asyncio
     async def test_research_and_build_task(self):
         result = await analyze_task("Research the best database options and build a data pipeline")
         assert result["task_type"] == "research+build"
@@ -51,31 +48,26 @@ class TestAnalyzeTask:
         assert "research" in agents
         assert "builder" in agents
 
-    @pytest.mark.asyncio
     async def test_general_task_defaults_to_both(self):
         result = await analyze_task("handle this thing for me please")
         assert result["task_type"] == "general"
         assert len(result["subtasks"]) == 2
 
-    @pytest.mark.asyncio
     async def test_complexity_simple(self):
         result = await analyze_task("build a hello world app")
         assert result["complexity"] == "simple"
         assert result["estimated_cost"] > 0
 
-    @pytest.mark.asyncio
     async def test_complexity_scales_with_words(self):
         short = await analyze_task("build an app")
         long_desc = "research and build " + " ".join(["word"] * 50)
         long_result = await analyze_task(long_desc)
         assert long_result["estimated_cost"] > short["estimated_cost"]
 
-    @pytest.mark.asyncio
     async def test_status_is_planned(self):
         result = await analyze_task("create something")
         assert result["status"] == "planned"
 
-    @pytest.mark.asyncio
     async def test_original_task_preserved(self):
         desc = "Deploy the microservice to production"
         result = await analyze_task(desc)
@@ -100,14 +92,12 @@ class TestCheckBudget:
         ledger._transactions.clear()
         ledger._tx_counter = 0
 
-    @pytest.mark.asyncio
     async def test_no_budget_returns_message(self):
         result = await check_budget("nonexistent_task")
         assert result["allocated"] == 0.0
         assert "message" in result
         assert "No budget" in result["message"]
 
-    @pytest.mark.asyncio
     async def test_allocated_budget_returned(self):
         ledger.allocate_budget("task_123", 5.0)
         result = await check_budget("task_123")
@@ -116,7 +106,6 @@ class TestCheckBudget:
         assert result["remaining"] == 5.0
         assert result["currency"] == "USDC"
 
-    @pytest.mark.asyncio
     async def test_spent_budget_reflected(self):
         ledger.allocate_budget("task_456", 10.0)
         ledger.record_payment("ceo", "builder", 3.5, "task_456")
@@ -133,7 +122,6 @@ class TestCheckBudget:
 class TestGithubCommit:
     """Test real git subprocess integration."""
 
-    @pytest.mark.asyncio
     async def test_nonexistent_repo_returns_error(self):
         result = await github_commit(
             repo="/tmp/nonexistent_repo_xyz",
@@ -143,7 +131,6 @@ class TestGithubCommit:
         assert result["status"] == "error"
         assert "not found" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_real_git_commit_in_temp_repo(self):
         """Create a temp git repo, add a file, and commit."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -192,13 +179,11 @@ class TestGithubCommit:
 class TestRunTests:
     """Test real pytest runner."""
 
-    @pytest.mark.asyncio
     async def test_nonexistent_path_returns_error(self):
         result = await run_tests(project_path="/tmp/nonexistent_project_xyz")
         assert result["status"] == "error"
         assert "not found" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_run_own_tests(self):
         """Run the project's own test suite (agents only, fast)."""
         result = await run_tests(
@@ -219,7 +204,6 @@ class TestRunTests:
 class TestWebSearch:
     """Test DuckDuckGo search integration."""
 
-    @pytest.mark.asyncio
     async def test_search_returns_results(self):
         """Test that a real search returns actual results."""
         result = await web_search("Python programming language", max_results=3)
@@ -233,12 +217,10 @@ class TestWebSearch:
         assert "url" in first
         assert "snippet" in first
 
-    @pytest.mark.asyncio
     async def test_search_respects_max_results(self):
         result = await web_search("FastAPI framework", max_results=2)
         assert result["total_results"] <= 2
 
-    @pytest.mark.asyncio
     async def test_search_error_handling(self):
         """Test that import errors are handled gracefully."""
         with patch.dict("sys.modules", {"duckduckgo_search": None}):
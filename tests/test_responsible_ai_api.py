@@ -4,9 +4,7 @@ Tests cover all /responsible-ai/* endpoints via FastAPI TestClient.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 
-from src.api.main import app
 from src.responsible_ai import reset_safety_checker
 
 
@@ -18,14 +16,9 @@ def _reset_checker():
     reset_safety_checker()
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-
 class TestCheckResumeEndpoint:
-    def test_safe_resume(self, client):
-        resp = client.post(
+    def test_safe_resume(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-resume",
             json={"text": "Experienced Python developer with cloud expertise."},
         )
@@ -35,8 +28,8 @@ class TestCheckResumeEndpoint:
         assert data["safety_score"] >= 0.8
         assert data["level"] == "safe"
 
-    def test_resume_with_pii(self, client):
-        resp = client.post(
+    def test_resume_with_pii(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-resume",
             json={"text": "John Doe, SSN: 123-45-6789, email: john@test.com"},
         )
@@ -46,8 +39,8 @@ class TestCheckResumeEndpoint:
         assert "email" in data["pii_detected"]
         assert data["safety_score"] < 1.0
 
-    def test_resume_with_bias(self, client):
-        resp = client.post(
+    def test_resume_with_bias(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-resume",
             json={"text": "He is an experienced chairman and leader."},
         )
@@ -55,8 +48,8 @@ class TestCheckResumeEndpoint:
         data = resp.json()
         assert len(data["bias_indicators"]) > 0
 
-    def test_empty_text_rejected(self, client):
-        resp = client.post(
+    def test_empty_text_rejected(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-resume",
             json={"text": ""},
         )
@@ -64,8 +57,8 @@ class TestCheckResumeEndpoint:
 
 
 class TestCheckPostingEndpoint:
-    def test_safe_posting(self, client):
-        resp = client.post(
+    def test_safe_posting(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-posting",
             json={"text": "Software Engineer needed. Remote-friendly team."},
         )
@@ -74,8 +67,8 @@ class TestCheckPostingEndpoint:
         assert data["content_type"] == "job_posting"
         assert data["level"] == "safe"
 
-    def test_discriminatory_posting(self, client):
-        resp = client.post(
+    def test_discriminatory_posting(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/check-posting",
             json={"text": "Looking for young and energetic candidates who are digital native."},
         )
@@ -86,8 +79,8 @@ class TestCheckPostingEndpoint:
 
 
 class TestSafetyScoreEndpoint:
-    def test_score_safe_text(self, client):
-        resp = client.post(
+    def test_score_safe_text(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/score",
             json={"text": "Professional resume for a software engineer."},
         )
@@ -96,8 +89,8 @@ class TestSafetyScoreEndpoint:
         assert data["safety_score"] >= 0.8
         assert data["level"] == "safe"
 
-    def test_score_unsafe_text(self, client):
-        resp = client.post(
+    def test_score_unsafe_text(self, app_client):
+        resp = app_client.post(
             "/responsible-ai/score",
             json={"text": "SSN: 123-45-6789. Young and energetic only."},
         )
@@ -107,8 +100,8 @@ class TestSafetyScoreEndpoint:
 
 
 class TestBiasReportEndpoint:
-    def test_bias_report(self, client):
-        resp = client.get("/responsible-ai/bias-report")
+    def test_bias_report(self, app_client):
+        resp = app_client.get("/responsible-ai/bias-report")
         assert resp.status_code == 200
         data = resp.json()
         assert "report_id" in data
@@ -118,22 +111,22 @@ class TestBiasReportEndpoint:
 
 
 class TestStatusEndpoint:
-    def test_initial_status(self, client):
-        resp = client.get("/responsible-ai/status")
+    def test_initial_status(self, app_client):
+        resp = app_client.get("/responsible-ai/status")
         assert resp.status_code == 200
         data = resp.json()
         assert data["total_checked"] == 0
 
-    def test_status_after_checks(self, client):
-        client.post(
+    def test_status_after_checks(self, app_client):
+        app_client.post(
             "/responsible-ai/check-resume",
             json={"text": "Test resume."},
         )
-        client.post(
+        app_client.post(
             "/responsible-ai/check-posting",
             json={"text": "Test job posting."},
         )
-        resp = client.get("/responsible-ai/status")
+        resp = app_client.get("/responsible-ai/status")
         data = resp.json()
         assert data["total_checked"] == 2
         assert data["resumes_checked"] == 1
@@ -16,7 +16,6 @@ Covers:
 from __future__ import annotations
 
 import asyncio
-import pytest
 
 from agent_framework import ChatAgent, SequentialBuilder, ConcurrentBuilder, HandoffBuilder
 
@@ -193,7 +192,6 @@ class TestSDKOrchestrationResult:
 
 
 class TestSDKSequential:
-    @pytest.mark.asyncio
     async def test_sequential_basic(self):
         agents = [_make_sdk_agent("A"), _make_sdk_agent("B")]
         result = await run_sequential(agents, "Test task")
@@ -203,34 +201,29 @@ class TestSDKSequential:
         assert result.final_output != ""
         assert result.elapsed_ms > 0
 
-    @pytest.mark.asyncio
     async def test_sequential_empty_agents(self):
         result = await run_sequential([], "Test task")
         assert result.status == "failed"
         assert "No agents" in result.metadata.get("error", "")
 
-    @pytest.mark.asyncio
     async def test_sequential_single_agent(self):
         agents = [_make_sdk_agent("Solo")]
         result = await run_sequential(agents, "Solo task")
         assert result.status == "completed"
         assert len(result.agent_results) >= 1
 
-    @pytest.mark.asyncio
     async def test_sequential_three_agents(self):
         agents = [_make_sdk_agent("R"), _make_sdk_agent("B"), _make_sdk_agent("D")]
         result = await run_sequential(agents, "Pipeline task")
         assert result.status == "completed"
         assert result.metadata.get("agent_count") == 3
 
-    @pytest.mark.asyncio
     async def test_sequential_metadata(self):
         agents = [_make_sdk_agent("X"), _make_sdk_agent("Y")]
         result = await run_sequential(agents, "Metadata test")
         assert "agent_count" in result.metadata
         assert "message_count" in result.metadata
 
-    @pytest.mark.asyncio
     async def test_sequential_preserves_task(self):
         task = "Unique task description 12345"
         result = await run_sequential([_make_sdk_agent("A")], task)
@@ -243,7 +236,6 @@ class TestSDKSequential:
 
 
 class TestSDKConcurrent:
-    @pytest.mark.asyncio
     async def test_concurrent_basic(self):
         agents = [_make_sdk_agent("A"), _make_sdk_agent("B")]
         result = await run_concurrent(agents, "Parallel task")
@@ -251,31 +243,26 @@ class TestSDKConcurrent:
         assert result.pattern == "sdk_concurrent"
         assert result.elapsed_ms > 0
 
-    @pytest.mark.asyncio
     async def test_concurrent_empty_agents(self):
         result = await run_concurrent([], "Test")
         assert result.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_concurrent_three_agents(self):
         agents = [_make_sdk_agent("A"), _make_sdk_agent("B"), _make_sdk_agent("C")]
         result = await run_concurrent(agents, "Three-way analysis")
         assert result.status == "completed"
         assert result.metadata.get("agent_count") == 3
 
-    @pytest.mark.asyncio
     async def test_concurrent_merged_output(self):
         agents = [_make_sdk_agent("Expert1"), _make_sdk_agent("Expert2")]
         result = await run_concurrent(agents, "Give analysis")
         assert result.final_output != ""
 
-    @pytest.mark.asyncio
     async def test_concurrent_parallel_results(self):
         agents = [_make_sdk_agent("A"), _make_sdk_agent("B")]
         result = await run_concurrent(agents, "Test")
         assert "parallel_results" in result.metadata
 
-    @pytest.mark.asyncio
     async def test_concurrent_preserves_task(self):
         task = "Unique concurrent task 67890"
         result = await run_concurrent([_make_sdk_agent("A")], task)
@@ -288,7 +275,6 @@ class TestSDKConcurrent:
 
 
 class TestSDKHandoff:
-    @pytest.mark.asyncio
     async def test_handoff_basic(self):
         agents = [_make_sdk_agent("CEO"), _make_sdk_agent("Builder")]
         result = await run_handoff(agents, "Handoff task", max_turns=3)
@@ -296,12 +282,10 @@ class TestSDKHandoff:
         assert result.status == "completed"
         assert result.elapsed_ms > 0
 
-    @pytest.mark.asyncio
     async def test_handoff_empty_participants(self):
         result = await run_handoff([], "Test")
         assert result.status == "failed"
 
-    @pytest.mark.asyncio
     async def test_handoff_with_start_agent(self):
         ceo = _make_sdk_agent("CEO")
         builder = _make_sdk_agent("Builder")
@@ -309,21 +293,18 @@ class TestSDKHandoff:
         assert result.status == "completed"
         assert result.metadata.get("start_agent") == "CEO"
 
-    @pytest.mark.asyncio
     async def test_handoff_max_turns(self):
         agents = [_make_sdk_agent("A"), _make_sdk_agent("B")]
         result = await run_handoff(agents, "Long conversation", max_turns=2)
         assert result.status == "completed"
         assert result.metadata.get("turns", 0) <= 3  # max_turns + small buffer
 
-    @pytest.mark.asyncio
     async def test_handoff_three_participants(self):
         agents = [_make_sdk_agent("CEO"), _make_sdk_agent("Builder"), _make_sdk_agent("Research")]
         result = await run_handoff(agents, "Complex task", max_turns=3)
         assert result.status == "completed"
         assert result.metadata.get("agent_count") == 3
 
-    @pytest.mark.asyncio
     async def test_handoff_preserves_task(self):
         task = "Unique handoff task abc"
         result = await run_handoff([_make_sdk_agent("A"), _make_sdk_agent("B")], task, max_turns=2)
@@ -353,7 +334,6 @@ class TestSDKOrchestrator:
         orch = SDKOrchestrator(_mock_client())
         assert orch.history == []
 
-    @pytest.mark.asyncio
     async def test_run_sequential(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test task", pattern="sequential")
@@ -361,40 +341,34 @@ class TestSDKOrchestrator:
         assert result.status == "completed"
         assert len(orch.history) == 1
 
-    @pytest.mark.asyncio
     async def test_run_concurrent(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test task", pattern="concurrent")
         assert result.pattern == "sdk_concurrent"
         assert result.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_run_handoff(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test task", pattern="handoff", max_turns=2)
         assert result.pattern == "sdk_handoff"
         assert result.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_run_unknown_pattern(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test", pattern="unknown")
         assert result.status == "failed"
         assert "Unknown pattern" in result.metadata.get("error", "")
 
-    @pytest.mark.asyncio
     async def test_run_with_specific_agents(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test", pattern="sequential", agents=["research", "builder"])
         assert result.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_run_with_invalid_agent_names(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Test", pattern="sequential", agents=["nonexistent"])
         assert result.status == "failed"  # No agents found
 
-    @pytest.mark.asyncio
     async def test_history_accumulates(self):
         orch = SDKOrchestrator(_mock_client())
         await orch.run("Task 1", pattern="sequential")
@@ -403,14 +377,12 @@ class TestSDKOrchestrator:
         assert orch.history[0].pattern == "sdk_sequential"
         assert orch.history[1].pattern == "sdk_concurrent"
 
-    @pytest.mark.asyncio
     async def test_default_agents_sequential(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Default sequential", pattern="sequential")
         # Sequential default: research, builder
         assert result.metadata.get("agent_count") == 2
 
-    @pytest.mark.asyncio
     async def test_default_agents_concurrent(self):
         orch = SDKOrchestrator(_mock_client())
         result = await orch.run("Default concurrent", pattern="concurrent")
@@ -581,7 +553,6 @@ class TestFrameworkIntegration:
         orch = SequentialOrchestrator([agent])
         assert len(orch.agents) == 1
 
-    @pytest.mark.asyncio
     async def test_existing_orchestrator_runs(self):
         from src.framework.orchestrator import SequentialOrchestrator
         from src.framework.agent import AgentFrameworkAgent
@@ -594,7 +565,6 @@ class TestFrameworkIntegration:
         assert result.status == "completed"
         assert result.pattern == "sequential"
 
-    @pytest.mark.asyncio
     async def test_sdk_and_native_coexist(self):
         """Both SDK and native orchestrators should work side by side."""
         from src.framework.orchestrator import SequentialOrchestrator
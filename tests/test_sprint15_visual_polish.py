@@ -53,33 +53,27 @@ def _clean_running_tasks():
 class TestStatCardVisuals:
     """Verify stat card CSS enhancements are present in the served HTML."""
 
-    @pytest.mark.asyncio
     async def test_stat_cards_have_gradient_background(self, client):
         resp = await client.get("/")
         assert "linear-gradient(135deg" in resp.text
 
-    @pytest.mark.asyncio
     async def test_stat_value_larger_font(self, client):
         resp = await client.get("/")
         assert "font-size: 30px" in resp.text or "font-size:30px" in resp.text
 
-    @pytest.mark.asyncio
     async def test_stat_value_extra_bold(self, client):
         resp = await client.get("/")
         assert "font-weight: 800" in resp.text or "font-weight:800" in resp.text
 
-    @pytest.mark.asyncio
     async def test_stat_label_uppercase(self, client):
         resp = await client.get("/")
         # stat-label should have text-transform: uppercase
         assert "text-transform: uppercase" in resp.text or "text-transform:uppercase" in resp.text
 
-    @pytest.mark.asyncio
     async def test_stat_card_hover_glow_line(self, client):
         resp = await client.get("/")
         assert "stat-card::before" in resp.text
 
-    @pytest.mark.asyncio
     async def test_stat_card_border_radius_12(self, client):
         resp = await client.get("/")
         # stat-card should have border-radius: 12px
@@ -93,26 +87,22 @@ class TestStatCardVisuals:
 class TestActivityFeedVisuals:
     """Verify activity feed visual enhancements."""
 
-    @pytest.mark.asyncio
     async def test_activity_item_hover_effect(self, client):
         resp = await client.get("/")
         assert "activity-item:hover" in resp.text
 
-    @pytest.mark.asyncio
     async def test_activity_icon_larger(self, client):
         resp = await client.get("/")
         # Icon should be 30x30
         text = resp.text
         assert ("width: 30px" in text or "width:30px" in text)
 
-    @pytest.mark.asyncio
     async def test_activity_time_has_background(self, client):
         resp = await client.get("/")
         # .activity-time should have background and padding
         assert "activity-time" in resp.text
         assert "tabular-nums" in resp.text
 
-    @pytest.mark.asyncio
     async def test_activity_feed_smooth_scroll(self, client):
         resp = await client.get("/")
         assert "scroll-behavior: smooth" in resp.text or "scroll-behavior:smooth" in resp.text
@@ -125,18 +115,15 @@ class TestActivityFeedVisuals:
 class TestAgentCardVisuals:
     """Verify agent card visual enhancements."""
 
-    @pytest.mark.asyncio
     async def test_agent_avatar_shadow(self, client):
         resp = await client.get("/")
         assert "box-shadow: 0 2px 8px" in resp.text or "box-shadow:0 2px 8px" in resp.text
 
-    @pytest.mark.asyncio
     async def test_agent_row_selected_border(self, client):
         resp = await client.get("/")
         assert "agent-row.selected" in resp.text
         assert "border-left: 3px solid" in resp.text or "border-left:3px solid" in resp.text
 
-    @pytest.mark.asyncio
     async def test_agent_avatar_larger(self, client):
         resp = await client.get("/")
         # 38px avatar
@@ -150,24 +137,20 @@ class TestAgentCardVisuals:
 class TestSkillTagVisuals:
     """Verify color-coded skill tag system."""
 
-    @pytest.mark.asyncio
     async def test_tag_pill_style(self, client):
         resp = await client.get("/")
         # Tags should be pill-shaped (border-radius: 20px)
         assert "border-radius: 20px" in resp.text or "border-radius:20px" in resp.text
 
-    @pytest.mark.asyncio
     async def test_tag_color_variants_exist(self, client):
         resp = await client.get("/")
         for variant in ["tag-blue", "tag-green", "tag-yellow", "tag-purple", "tag-cyan"]:
             assert variant in resp.text
 
-    @pytest.mark.asyncio
     async def test_tag_hover_effect(self, client):
         resp = await client.get("/")
         assert ".tag:hover" in resp.text
 
-    @pytest.mark.asyncio
     async def test_skill_color_map_in_js(self, client):
         resp = await client.get("/")
         assert "skillColors" in resp.text
@@ -181,22 +164,18 @@ class TestSkillTagVisuals:
 class TestCategoryFilterPills:
     """Verify agent category filter pill system."""
 
-    @pytest.mark.asyncio
     async def test_filter_pill_css_exists(self, client):
         resp = await client.get("/")
         assert ".filter-pill" in resp.text
 
-    @pytest.mark.asyncio
     async def test_filter_pill_active_state(self, client):
         resp = await client.get("/")
         assert ".filter-pill.active" in resp.text
 
-    @pytest.mark.asyncio
     async def test_filter_pills_container_exists(self, client):
         resp = await client.get("/")
         assert "agent-filter-pills" in resp.text
 
-    @pytest.mark.asyncio
     async def test_filter_js_function_exists(self, client):
         resp = await client.get("/")
         assert "orchSetFilter" in resp.text
@@ -210,46 +189,38 @@ class TestCategoryFilterPills:
 class TestFormUX:
     """Verify form enhancement features."""
 
-    @pytest.mark.asyncio
     async def test_form_input_focus_glow(self, client):
         resp = await client.get("/")
         assert "box-shadow: 0 0 0 3px" in resp.text or "box-shadow:0 0 0 3px" in resp.text
 
-    @pytest.mark.asyncio
     async def test_form_input_hover_state(self, client):
         resp = await client.get("/")
         assert ".form-input:hover" in resp.text
 
-    @pytest.mark.asyncio
     async def test_form_success_class(self, client):
         resp = await client.get("/")
         assert ".form-success" in resp.text
 
-    @pytest.mark.asyncio
     async def test_form_error_class(self, client):
         resp = await client.get("/")
         assert ".form-error" in resp.text
 
-    @pytest.mark.asyncio
     async def test_form_hint_exists(self, client):
         resp = await client.get("/")
         assert ".form-hint" in resp.text
         assert "task-hint" in resp.text
 
-    @pytest.mark.asyncio
     async def test_step_indicator_exists(self, client):
         resp = await client.get("/")
         assert ".step-indicator" in resp.text
         assert "step-dot" in resp.text
 
-    @pytest.mark.asyncio
     async def test_step_indicator_has_three_steps(self, client):
         resp = await client.get("/")
         assert "step-1" in resp.text
         assert "step-2" in resp.text
         assert "step-3" in resp.text
 
-    @pytest.mark.asyncio
     async def test_reset_modal_steps_function(self, client):
         resp = await client.get("/")
         assert "resetModalSteps" in resp.text
@@ -262,7 +233,6 @@ class TestFormUX:
 class TestLiveDemoPipeline:
     """Verify the 7-stage live demo pipeline."""
 
-    @pytest.mark.asyncio
     async def test_pipeline_has_7_stages(self, client):
         resp = await client.get("/")
         text = resp.text
@@ -270,7 +240,6 @@ class TestLiveDemoPipeline:
         assert "ps-7-detail" in text
         assert "ps-7-time" in text
 
-    @pytest.mark.asyncio
     async def test_pipeline_stage_names(self, client):
         resp = await client.get("/")
         text = resp.text
@@ -282,12 +251,10 @@ class TestLiveDemoPipeline:
         assert "Rate &amp; Verify" in text or "Rate & Verify" in text
         assert "Dashboard Update" in text
 
-    @pytest.mark.asyncio
     async def test_pipeline_reset_handles_7_stages(self, client):
         resp = await client.get("/")
         assert "i<=7" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_live_endpoint_returns_7_stages(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         assert resp.status_code == 200
@@ -295,7 +262,6 @@ class TestLiveDemoPipeline:
         assert "stages" in data
         assert len(data["stages"]) == 7
 
-    @pytest.mark.asyncio
     async def test_demo_live_stage_names_match(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -310,7 +276,6 @@ class TestLiveDemoPipeline:
             "Dashboard Update",
         ]
 
-    @pytest.mark.asyncio
     async def test_demo_live_all_stages_have_detail(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -318,7 +283,6 @@ class TestLiveDemoPipeline:
             assert "detail" in stage
             assert len(stage["detail"]) > 0
 
-    @pytest.mark.asyncio
     async def test_demo_live_all_stages_have_duration(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -326,7 +290,6 @@ class TestLiveDemoPipeline:
             assert "duration_ms" in stage
             assert isinstance(stage["duration_ms"], (int, float))
 
-    @pytest.mark.asyncio
     async def test_demo_live_has_quality_score(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -334,7 +297,6 @@ class TestLiveDemoPipeline:
         rate_stage = data["stages"][5]
         assert "Quality score" in rate_stage["detail"]
 
-    @pytest.mark.asyncio
     async def test_demo_live_dashboard_stage_mentions_refresh(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -349,28 +311,24 @@ class TestLiveDemoPipeline:
 class TestLiveDemoTaskVariations:
     """Verify demo works with all task variations."""
 
-    @pytest.mark.asyncio
     async def test_demo_task_index_0(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         assert resp.status_code == 200
         data = resp.json()
         assert "memory" in data["description"].lower() or "agent" in data["description"].lower()
 
-    @pytest.mark.asyncio
     async def test_demo_task_index_1(self, client):
         resp = await client.post("/demo/live", json={"task_index": 1})
         assert resp.status_code == 200
         data = resp.json()
         assert "pricing" in data["description"].lower() or "agent" in data["description"].lower()
 
-    @pytest.mark.asyncio
     async def test_demo_task_index_2(self, client):
         resp = await client.post("/demo/live", json={"task_index": 2})
         assert resp.status_code == 200
         data = resp.json()
         assert "dashboard" in data["description"].lower() or "monitoring" in data["description"].lower()
 
-    @pytest.mark.asyncio
     async def test_demo_task_index_wraps(self, client):
         resp = await client.post("/demo/live", json={"task_index": 100})
         assert resp.status_code == 200
@@ -378,42 +336,36 @@ class TestLiveDemoTaskVariations:
         assert "stages" in data
         assert len(data["stages"]) == 7
 
-    @pytest.mark.asyncio
     async def test_demo_live_no_body(self, client):
         resp = await client.post("/demo/live")
         assert resp.status_code == 200
         data = resp.json()
         assert "stages" in data
 
-    @pytest.mark.asyncio
     async def test_demo_live_returns_cost(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
         assert "cost_usdc" in data
         assert data["cost_usdc"] > 0
 
-    @pytest.mark.asyncio
     async def test_demo_live_returns_agent(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
         assert "agent" in data
         assert len(data["agent"]) > 0
 
-    @pytest.mark.asyncio
     async def test_demo_live_returns_model(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
         assert "model" in data
         assert data["model"] in ("gpt-4o", "mock")
 
-    @pytest.mark.asyncio
     async def test_demo_live_returns_total_ms(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
         assert "total_ms" in data
         assert data["total_ms"] > 0
 
-    @pytest.mark.asyncio
     async def test_demo_live_returns_preview(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -428,7 +380,6 @@ class TestLiveDemoTaskVariations:
 class TestDemoPipelineIntegrity:
     """Verify demo pipeline creates proper data in storage/ledger."""
 
-    @pytest.mark.asyncio
     async def test_demo_creates_task_in_storage(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -438,7 +389,6 @@ class TestDemoPipelineIntegrity:
         task = task_resp.json()
         assert task["status"] == "completed"
 
-    @pytest.mark.asyncio
     async def test_demo_creates_payment(self, client):
         txs_before = await client.get("/transactions")
         count_before = len(txs_before.json())
@@ -447,7 +397,6 @@ class TestDemoPipelineIntegrity:
         count_after = len(txs_after.json())
         assert count_after > count_before
 
-    @pytest.mark.asyncio
     async def test_demo_task_has_result(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -456,7 +405,6 @@ class TestDemoPipelineIntegrity:
         assert task["result"] is not None
         assert "assigned_agent" in task["result"]
 
-    @pytest.mark.asyncio
     async def test_demo_task_has_quality_score(self, client):
         resp = await client.post("/demo/live", json={"task_index": 0})
         data = resp.json()
@@ -473,12 +421,10 @@ class TestDemoPipelineIntegrity:
 class TestVersionBump:
     """Verify version is updated to 0.15.0."""
 
-    @pytest.mark.asyncio
     async def test_dashboard_shows_version(self, client):
         resp = await client.get("/")
         assert "v2.0" in resp.text
 
-    @pytest.mark.asyncio
     async def test_api_version_in_openapi(self, client):
         resp = await client.get("/openapi.json")
         assert resp.status_code == 200
@@ -493,17 +439,14 @@ class TestVersionBump:
 class TestOrchestrationVisuals:
     """Verify orchestration node enhancements."""
 
-    @pytest.mark.asyncio
     async def test_orch_node_box_larger(self, client):
         resp = await client.get("/")
         assert ("width: 84px" in resp.text or "width:84px" in resp.text)
 
-    @pytest.mark.asyncio
     async def test_orch_active_gradient(self, client):
         resp = await client.get("/")
         assert "rgba(34,197,94,0.08)" in resp.text
 
-    @pytest.mark.asyncio
     async def test_orch_node_bg_secondary(self, client):
         resp = await client.get("/")
         assert "orch-node-box" in resp.text
@@ -517,20 +460,17 @@ class TestOrchestrationVisuals:
 class TestDarkThemePolish:
     """Verify professional dark theme elements."""
 
-    @pytest.mark.asyncio
     async def test_css_variables_present(self, client):
         resp = await client.get("/")
         text = resp.text
         for var in ["--bg", "--card", "--accent", "--green", "--text", "--text-muted"]:
             assert var in text
 
-    @pytest.mark.asyncio
     async def test_inter_font_loaded(self, client):
         resp = await client.get("/")
         assert "fonts.googleapis.com" in resp.text
         assert "Inter" in resp.text
 
-    @pytest.mark.asyncio
     async def test_no_raw_json_in_demo_data(self, client):
         resp = await client.get("/")
         text = resp.text
@@ -540,12 +480,10 @@ class TestDarkThemePolish:
         assert "status:" in text
         assert "healthy" in text
 
-    @pytest.mark.asyncio
     async def test_scrollbar_styling(self, client):
         resp = await client.get("/")
         assert "::-webkit-scrollbar" in resp.text
 
-    @pytest.mark.asyncio
     async def test_animations_present(self, client):
         resp = await client.get("/")
         for anim in ["fadeIn", "slideIn", "shimmer", "pulse"]:
@@ -559,37 +497,31 @@ class TestDarkThemePolish:
 class TestStandaloneDemoData:
     """Verify standalone demo data renders without backend."""
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_health(self, client):
         resp = await client.get("/")
         assert "DEMO_DATA" in resp.text
         assert "agents_count:5" in resp.text or "agents_count: 5" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_agents(self, client):
         resp = await client.get("/")
         assert "ceo-agent" in resp.text
         assert "builder-agent" in resp.text
         assert "research-agent" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_activity(self, client):
         resp = await client.get("/")
         assert "research-agent" in resp.text
         assert "completed" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_transactions(self, client):
         resp = await client.get("/")
         assert "amount_usdc" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_approvals(self, client):
         resp = await client.get("/")
         assert "approvals" in resp.text
         assert "pending" in resp.text
 
-    @pytest.mark.asyncio
     async def test_demo_data_has_safety(self, client):
         resp = await client.get("/")
         assert "fairness_score" in resp.text
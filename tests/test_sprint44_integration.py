@@ -16,8 +16,6 @@ from __future__ import annotations
 import time
 
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
 from src.marketplace import AgentListing, MarketplaceRegistry, SkillMatcher, marketplace
 from src.marketplace.x402 import (
@@ -716,6 +714,20 @@ class TestBudgetTrackerEdgeCases:
         assert bt.spend("t1", 1.01) is False
         assert bt.remaining == 1.0
 
+    def test_repeated_small_spends_are_exact(self):
+        """Ten 0.1 spends use up a 1.0 budget exactly, with no float drift."""
+        bt = BudgetTracker(total_budget=1.0)
+        assert all(bt.spend(f"t{i}", 0.1) for i in range(10))
+        assert bt.remaining == 0.0
+        assert bt.spend("t10", 0.000001) is False
+
+    def test_refund_returns_budget(self):
+        bt = BudgetTracker(total_budget=1.0)
+        bt.spend("t1", 0.4)
+        bt.refund("t1", 0.4)
+        assert bt.remaining == 1.0
+        assert bt.spending_report()["tasks"] == {}
+
     def test_multiple_spends_same_task_accumulate(self):
         """Multiple spends on the same task_id accumulate."""
         bt = BudgetTracker(total_budget=10.0)
@@ -1051,7 +1063,7 @@ class TestDataIntegrity:
 
 
 @pytest.fixture
-def api_client():
+def api_client(marketplace_client, monkeypatch):
     """Create a test client with marketplace routes and fresh state."""
     import src.api.marketplace_routes as routes_mod
 
@@ -1066,25 +1078,13 @@ def api_client():
         budget_tracker=fresh_budget,
     )
 
-    old_marketplace = routes_mod.marketplace
-    old_escrow = routes_mod._escrow
-    old_budget = routes_mod._budget
-    old_hiring = routes_mod._hiring_manager
-
-    routes_mod.marketplace = fresh_marketplace
-    routes_mod._escrow = fresh_escrow
-    routes_mod._budget = fresh_budget
-    routes_mod._hiring_manager = fresh_hiring
-
-    app = FastAPI()
-    app.include_router(routes_mod.router)
-    client = TestClient(app)
-    yield client
-
-    routes_mod.marketplace = old_marketplace
-    routes_mod._escrow = old_escrow
-    routes_mod._budget = old_budget
-    routes_mod._hiring_manager = old_hiring
+    # Patch module-level singletons; monkeypatch restores them afterwards.
+    monkeypatch.setattr(routes_mod, "marketplace", fresh_marketplace)
+    monkeypatch.setattr(routes_mod, "_escrow", fresh_escrow)
+    monkeypatch.setattr(routes_mod, "_budget", fresh_budget)
+    monkeypatch.setattr(routes_mod, "_hiring_manager", fresh_hiring)
+
+    return marketplace_client
 
 
 class TestAPIMethodValidation:
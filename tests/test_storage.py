@@ -16,9 +16,25 @@ import pytest_asyncio
 from src.storage import SQLiteStorage
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def storage():
-    """Create a fresh SQLiteStorage with a temporary database."""
+    """One SQLiteStorage per module; ``_reset`` empties it before each test."""
+    tmpdir = tempfile.mkdtemp()
+    db_path = os.path.join(tmpdir, "test_storage.db")
+    s = SQLiteStorage(db_path)
+    yield s
+    s.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset(storage):
+    storage.clear_all()
+    yield
+
+
+@pytest.fixture
+def fresh_storage():
+    """A newly initialised SQLiteStorage, for tests of database setup."""
     tmpdir = tempfile.mkdtemp()
     db_path = os.path.join(tmpdir, "test_storage.db")
     return SQLiteStorage(db_path)
@@ -75,6 +91,18 @@ class TestTaskStorage:
         all_tasks = storage.list_tasks()
         assert len(all_tasks) == 3
 
+    def test_save_tasks_batch(self, storage):
+        written = storage.save_tasks([
+            {"task_id": "b1", "description": "B1", "workflow": "sequential", "budget_usd": 1.0},
+            {"task_id": "b2", "description": "B2", "workflow": "ceo", "budget_usd": 2.0,
+             "status": "completed", "created_at": 1700000000.0, "result": {"ok": True}},
+        ])
+        assert written == 2
+        assert storage.get_task("b1")["status"] == "pending"
+        b2 = storage.get_task("b2")
+        assert (b2["created_at"], b2["result"]) == (1700000000.0, {"ok": True})
+        assert storage.save_tasks([]) == 0
+
     def test_list_tasks_filtered(self, storage):
         storage.save_task(task_id="a", description="A", workflow="sequential", budget_usd=1.0, status="pending")
         storage.save_task(task_id="b", description="B", workflow="sequential", budget_usd=1.0, status="completed")
@@ -289,18 +317,18 @@ class TestBudgetStorage:
 # ──────────────────────────────────────────────
 
 class TestDatabaseInit:
-    def test_wal_mode_enabled(self, storage):
+    def test_wal_mode_enabled(self, fresh_storage):
         """Verify WAL journal mode is active."""
         import sqlite3
-        conn = sqlite3.connect(storage._db_path)
+        conn = sqlite3.connect(fresh_storage._db_path)
         result = conn.execute("PRAGMA journal_mode").fetchone()
         conn.close()
         assert result[0] == "wal"
 
-    def test_tables_exist(self, storage):
+    def test_tables_exist(self, fresh_storage):
         """Verify all required tables are created."""
         import sqlite3
-        conn = sqlite3.connect(storage._db_path)
+        conn = sqlite3.connect(fresh_storage._db_path)
         cursor = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
         )
@@ -336,7 +364,6 @@ class TestDatabaseInit:
 # ──────────────────────────────────────────────
 
 class TestAsyncStorage:
-    @pytest.mark.asyncio
     async def test_async_save_and_get_task(self, storage):
         await storage.async_save_task(
             task_id="async1",
@@ -350,7 +377,6 @@ class TestAsyncStorage:
         assert task["description"] == "Async test"
         assert task["status"] == "pending"
 
-    @pytest.mark.asyncio
     async def test_async_update_task_status(self, storage):
         await storage.async_save_task(
             task_id="async2",
@@ -363,7 +389,6 @@ class TestAsyncStorage:
         assert task["status"] == "completed"
         assert task["result"] == {"result": "success"}
 
-    @pytest.mark.asyncio
     async def test_async_get_nonexistent(self, storage):
         task = await storage.async_get_task("nope")
         assert task is None
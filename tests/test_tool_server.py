@@ -276,7 +276,6 @@ class TestToolComposition:
 class TestToolExecutor:
     """Tests for tool invocation and validation."""
 
-    @pytest.mark.asyncio
     async def test_invoke_success(self):
         inv = await tool_executor.invoke(
             "azure_resource_check",
@@ -287,13 +286,11 @@ class TestToolExecutor:
         assert inv.output_data["status"] == "available"
         assert inv.duration_ms is not None
 
-    @pytest.mark.asyncio
     async def test_invoke_missing_tool(self):
         inv = await tool_executor.invoke("nonexistent_tool", {})
         assert inv.status == "failed"
         assert "not found" in inv.error
 
-    @pytest.mark.asyncio
     async def test_invoke_missing_required_field(self):
         inv = await tool_executor.invoke(
             "azure_resource_check",
@@ -302,7 +299,6 @@ class TestToolExecutor:
         assert inv.status == "failed"
         assert "Missing required field" in inv.error
 
-    @pytest.mark.asyncio
     async def test_invoke_wrong_type(self):
         inv = await tool_executor.invoke(
             "azure_resource_check",
@@ -311,7 +307,6 @@ class TestToolExecutor:
         assert inv.status == "failed"
         assert "expected type" in inv.error
 
-    @pytest.mark.asyncio
     async def test_invoke_timeout(self):
         """Tools that exceed timeout should fail."""
         async def slow_handler(args):
@@ -326,7 +321,6 @@ class TestToolExecutor:
         assert inv.status == "failed"
         assert "timed out" in inv.error
 
-    @pytest.mark.asyncio
     async def test_invoke_handler_error(self):
         """Tools whose handler raises should fail gracefully."""
         async def bad_handler(args):
@@ -340,7 +334,6 @@ class TestToolExecutor:
         assert inv.status == "failed"
         assert "something went wrong" in inv.error
 
-    @pytest.mark.asyncio
     async def test_invocation_tracking(self):
         await tool_executor.invoke(
             "azure_resource_check",
@@ -355,7 +348,6 @@ class TestToolExecutor:
         filtered = tool_executor.get_invocations("azure_keyvault_get")
         assert len(filtered) == 1
 
-    @pytest.mark.asyncio
     async def test_invocation_id_increments(self):
         inv1 = await tool_executor.invoke(
             "azure_keyvault_get", {"secret_name": "a"},
@@ -365,7 +357,6 @@ class TestToolExecutor:
         )
         assert inv1.invocation_id != inv2.invocation_id
 
-    @pytest.mark.asyncio
     async def test_invoke_composition_success(self):
         tool_registry.register_composition(ToolComposition(
             name="check_then_create",
@@ -379,7 +370,6 @@ class TestToolExecutor:
         assert len(results) == 2
         assert all(r.status == "completed" for r in results)
 
-    @pytest.mark.asyncio
     async def test_invoke_composition_stops_on_failure(self):
         """Composition should stop at the first failing step."""
         async def failing_handler(args):
@@ -398,7 +388,6 @@ class TestToolExecutor:
         assert len(results) == 1
         assert results[0].status == "failed"
 
-    @pytest.mark.asyncio
     async def test_invoke_composition_not_found(self):
         results = await tool_executor.invoke_composition("nonexistent", {})
         assert len(results) == 1
@@ -433,7 +422,6 @@ class TestAzureStubs:
             td = tool_registry.get(name)
             assert td.provider == "azure"
 
-    @pytest.mark.asyncio
     async def test_azure_resource_check_handler(self):
         result = await _azure_resource_check({
             "resource_type": "Microsoft.Web/sites",
@@ -444,7 +432,6 @@ class TestAzureStubs:
         assert result["region"] == "westus"
         assert result["provisioning_state"] == "Succeeded"
 
-    @pytest.mark.asyncio
     async def test_azure_devops_create_item_handler(self):
         result = await _azure_devops_create_item({
             "title": "Implement feature X",
@@ -456,7 +443,6 @@ class TestAzureStubs:
         assert result["state"] == "New"
         assert "url" in result
 
-    @pytest.mark.asyncio
     async def test_azure_keyvault_get_handler(self):
         result = await _azure_keyvault_get({
             "secret_name": "db-connection-string",
@@ -466,12 +452,10 @@ class TestAzureStubs:
         assert result["vault_name"] == "prod-vault"
         assert result["enabled"] is True
 
-    @pytest.mark.asyncio
     async def test_search_azure_tools(self):
         results = tool_registry.search("azure")
         assert len(results) == 3
 
-    @pytest.mark.asyncio
     async def test_search_azure_by_tag(self):
         results = tool_registry.search_by_tag("security")
         assert len(results) == 1
@@ -485,7 +469,6 @@ class TestAzureStubs:
 class TestInputValidation:
     """Tests for input schema validation edge cases."""
 
-    @pytest.mark.asyncio
     async def test_extra_fields_allowed(self):
         """Extra fields not in schema should be allowed."""
         inv = await tool_executor.invoke(
@@ -494,7 +477,6 @@ class TestInputValidation:
         )
         assert inv.status == "completed"
 
-    @pytest.mark.asyncio
     async def test_number_type_validation(self):
         async def num_handler(args):
             return {"sum": args["a"] + args["b"]}
@@ -518,7 +500,6 @@ class TestInputValidation:
         assert inv.status == "failed"
         assert "expected type" in inv.error
 
-    @pytest.mark.asyncio
     async def test_boolean_type_validation(self):
         tool_registry.register(
             ToolDefinition(
@@ -537,7 +518,6 @@ class TestInputValidation:
         assert inv.status == "failed"
         assert "expected type" in inv.error
 
-    @pytest.mark.asyncio
     async def test_array_type_validation(self):
         tool_registry.register(
             ToolDefinition(
@@ -576,7 +556,6 @@ class TestMCPServerEndpoints:
             server.request_handlers[CallToolRequest],
         )
 
-    @pytest.mark.asyncio
     async def test_list_tools_returns_all_endpoints(self):
         from mcp.types import ListToolsRequest
         list_handler, _ = self._get_handlers()
@@ -590,7 +569,6 @@ class TestMCPServerEndpoints:
         assert "tools_invoke_composition" in names
         assert "tools_get_info" in names
 
-    @pytest.mark.asyncio
     async def test_tools_list_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -604,7 +582,6 @@ class TestMCPServerEndpoints:
         names = [t["name"] for t in data]
         assert "azure_resource_check" in names
 
-    @pytest.mark.asyncio
     async def test_tools_list_by_tag_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -616,7 +593,6 @@ class TestMCPServerEndpoints:
         assert len(data) == 1
         assert data[0]["name"] == "azure_devops_create_item"
 
-    @pytest.mark.asyncio
     async def test_tools_search_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -628,7 +604,6 @@ class TestMCPServerEndpoints:
         assert len(data) == 1
         assert data[0]["name"] == "azure_keyvault_get"
 
-    @pytest.mark.asyncio
     async def test_tools_invoke_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -646,7 +621,6 @@ class TestMCPServerEndpoints:
         assert data["status"] == "completed"
         assert data["output_data"]["status"] == "available"
 
-    @pytest.mark.asyncio
     async def test_tools_register_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -667,7 +641,6 @@ class TestMCPServerEndpoints:
         assert data["registered"] is True
         assert tool_registry.get("new_tool") is not None
 
-    @pytest.mark.asyncio
     async def test_tools_get_info_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -683,7 +656,6 @@ class TestMCPServerEndpoints:
         assert data["provider"] == "azure"
         assert "input_schema" in data
 
-    @pytest.mark.asyncio
     async def test_tools_get_info_not_found_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()
@@ -697,7 +669,6 @@ class TestMCPServerEndpoints:
         data = json.loads(result.root.content[0].text)
         assert "error" in data
 
-    @pytest.mark.asyncio
     async def test_tools_invoke_composition_via_mcp(self):
         tool_registry.register_composition(ToolComposition(
             name="az_pipeline",
@@ -720,7 +691,6 @@ class TestMCPServerEndpoints:
         assert isinstance(data, list)
         assert len(data) == 2
 
-    @pytest.mark.asyncio
     async def test_unknown_tool_via_mcp(self):
         from mcp.types import CallToolRequest, CallToolRequestParams
         _, call_handler = self._get_handlers()